@@ -5,30 +5,218 @@ Cursor Commands Common Utility Module
 특히 한글 경로 처리 등 인코딩 문제를 해결합니다.
 
 작성자: Cursor AI Assistant
-버전: 1.0.0
+버전: 1.1.0
 생성일: 2025-10-13
 """
 
 import shutil
 import os
-from typing import Optional, List, Dict
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Tuple
 from pathlib import Path
 
 
+# copy_file_range 한 번에 넘길 최대 바이트 수
+_COPY_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def _scan_tree(root: str, follow_symlinks: bool = True) -> Dict[str, os.stat_result]:
+    """
+    폴더 아래 모든 항목을 os.scandir로 순회합니다.
+    
+    Args:
+        root (str): 순회할 폴더 경로
+        follow_symlinks (bool): 심볼릭 링크를 copytree처럼 따라갈지 여부 (기본값: True).
+            False이면 링크 자체의 stat을 담고 링크된 폴더 안으로 들어가지 않습니다 (대상 폴더 순회용).
+    
+    Returns:
+        Dict[str, os.stat_result]: 상대 경로 → stat (따라갈 때 깨진 심볼릭 링크는 제외)
+    """
+    entries = {}
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        with os.scandir(os.path.join(root, rel_dir)) as it:
+            for entry in it:
+                rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                try:
+                    st = entry.stat(follow_symlinks=follow_symlinks)
+                except FileNotFoundError:
+                    continue
+                entries[rel_path] = st
+                if stat.S_ISDIR(st.st_mode):
+                    stack.append(rel_path)
+    return entries
+
+
+def _count_entries(root: str) -> int:
+    """폴더 아래 파일/폴더 개수 (목록을 만들지 않고 os.scandir로 셈)"""
+    count = 0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                count += 1
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return count
+
+
+def _copy_file(source: str, destination: str) -> None:
+    """
+    파일 하나를 복사하고 수정 시각 등 메타데이터를 유지합니다.
+    
+    가능하면 os.copy_file_range(커널 내부 복사, 지원 파일시스템에서는 reflink)를 사용하고,
+    지원하지 않으면 shutil.copyfile(Linux sendfile / macOS fcopyfile)로 복사합니다.
+    """
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source, "rb") as src, open(destination, "wb") as dst:
+                while os.copy_file_range(src.fileno(), dst.fileno(), _COPY_CHUNK_SIZE):
+                    pass
+            copied = True
+        except OSError:
+            copied = False
+    if not copied:
+        shutil.copyfile(source, destination)
+    shutil.copystat(source, destination)
+
+
+def _file_digest(path: str) -> bytes:
+    """파일 내용 해시 (checksum 비교용)"""
+    import hashlib
+    
+    digest = hashlib.blake2b()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _entry_kind(st: os.stat_result) -> str:
+    """stat 종류 (dir / link / file)"""
+    if stat.S_ISDIR(st.st_mode):
+        return "dir"
+    if stat.S_ISLNK(st.st_mode):
+        return "link"
+    return "file"
+
+
+def _sync_tree(
+    source: str,
+    destination: str,
+    delete: bool = True,
+    checksum: bool = False,
+    workers: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    source의 내용을 destination에 맞춥니다 (바뀐 파일만 복사, 없어진 항목 삭제).
+    
+    크기나 수정 시각(초 단위)이 다르면 복사합니다. checksum=True이면 크기가 같은 파일은
+    수정 시각 대신 내용 해시로 비교합니다. 비교와 복사는 스레드 풀에서 병렬로 실행합니다.
+    
+    Returns:
+        Dict[str, int]: copied, skipped, deleted, bytes_copied, entry_count
+    """
+    src_entries = _scan_tree(source)
+    # 대상 폴더의 심볼릭 링크는 따라가지 않음 (링크 너머의 파일을 지우거나 덮어쓰지 않도록)
+    dest_entries = _scan_tree(destination, follow_symlinks=False) if os.path.isdir(destination) else {}
+    
+    # 종류가 바뀐 항목(파일 ↔ 폴더, 대상의 심볼릭 링크)은 항상, 원본에 없는 항목은 delete=True일 때 삭제
+    deleted = 0
+    for rel_path in sorted(dest_entries, key=len, reverse=True):
+        dest_st = dest_entries[rel_path]
+        src_st = src_entries.get(rel_path)
+        type_changed = src_st is not None and _entry_kind(src_st) != _entry_kind(dest_st)
+        if not type_changed and (src_st is not None or not delete):
+            continue
+        target = os.path.join(destination, rel_path)
+        if not os.path.lexists(target):
+            continue
+        if stat.S_ISDIR(dest_st.st_mode):
+            shutil.rmtree(target)
+        else:
+            os.unlink(target)
+        dest_entries.pop(rel_path)
+        deleted += 1
+    
+    os.makedirs(destination, exist_ok=True)
+    candidates = []
+    for rel_path in sorted(src_entries):
+        src_st = src_entries[rel_path]
+        if stat.S_ISDIR(src_st.st_mode):
+            os.makedirs(os.path.join(destination, rel_path), exist_ok=True)
+            continue
+        dest_st = dest_entries.get(rel_path)
+        if dest_st is None or dest_st.st_size != src_st.st_size:
+            candidates.append((rel_path, True))
+        elif checksum:
+            candidates.append((rel_path, False))
+        elif int(dest_st.st_mtime) != int(src_st.st_mtime):
+            candidates.append((rel_path, True))
+    
+    def sync_file(item: Tuple[str, bool]) -> int:
+        rel_path, changed = item
+        src_path = os.path.join(source, rel_path)
+        dest_path = os.path.join(destination, rel_path)
+        if not changed and _file_digest(src_path) == _file_digest(dest_path):
+            return -1
+        _copy_file(src_path, dest_path)
+        return src_entries[rel_path].st_size
+    
+    copied = 0
+    bytes_copied = 0
+    if candidates:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for size in pool.map(sync_file, candidates):
+                if size >= 0:
+                    copied += 1
+                    bytes_copied += size
+    
+    # 폴더 권한/수정 시각은 안의 파일을 다 쓴 뒤 깊은 폴더부터 맞춤 (copytree와 같음)
+    dirs = [rel_path for rel_path, st in src_entries.items() if stat.S_ISDIR(st.st_mode)]
+    for rel_path in sorted(dirs, key=lambda path: path.count(os.sep), reverse=True):
+        shutil.copystat(os.path.join(source, rel_path), os.path.join(destination, rel_path))
+    shutil.copystat(source, destination)
+    
+    file_total = sum(1 for st in src_entries.values() if not stat.S_ISDIR(st.st_mode))
+    return {
+        "copied": copied,
+        "skipped": file_total - copied,
+        "deleted": deleted,
+        "bytes_copied": bytes_copied,
+        "entry_count": len(src_entries),
+    }
+
+
 def copy_folder(
     source: str,
     destination: str,
     overwrite: bool = True,
-    verify: bool = True
+    verify: bool = True,
+    incremental: bool = False,
+    delete: bool = True,
+    checksum: bool = False,
+    workers: Optional[int] = None
 ) -> Dict[str, any]:
     """
     폴더를 안전하게 복사합니다 (한글 경로 지원).
     
+    incremental=True이면 대상 폴더를 지우지 않고 크기/수정 시각(또는 해시)이 바뀐 파일만 복사하며,
+    원본에서 사라진 파일은 삭제합니다 (동기화). 파일 복사는 스레드 풀에서 병렬로 실행합니다.
+    
     Args:
         source (str): 원본 폴더 경로 (절대 경로 또는 상대 경로)
         destination (str): 대상 폴더 경로 (절대 경로 또는 상대 경로)
-        overwrite (bool): 기존 폴더가 있으면 삭제 후 복사 (기본값: True)
+        overwrite (bool): 기존 폴더가 있으면 삭제 후 복사 (기본값: True, incremental이면 사용 안 함)
         verify (bool): 복사 후 파일 개수 검증 (기본값: True)
+        incremental (bool): 바뀐 파일만 복사하는 동기화 모드 (기본값: False)
+        delete (bool): incremental 모드에서 원본에 없는 파일 삭제 (기본값: True)
+        checksum (bool): incremental 모드에서 크기가 같은 파일을 수정 시각 대신 해시로 비교 (기본값: False)
+        workers (Optional[int]): 복사 스레드 수 (기본값: None, ThreadPoolExecutor 기본값)
     
     Returns:
         Dict[str, any]: 복사 결과 정보
@@ -36,6 +224,9 @@ def copy_folder(
             - source_path: 원본 경로 (str)
             - dest_path: 대상 경로 (str)
             - file_count: 복사된 파일 개수 (int)
+            - copied / skipped / deleted: 복사·건너뜀·삭제한 항목 수 (int)
+            - bytes_copied: 복사한 바이트 수 (int)
+            - elapsed: 소요 시간 (float, 초)
             - error: 에러 메시지 (str, 에러 발생 시)
     
     Raises:
@@ -49,14 +240,23 @@ def copy_folder(
         ...     r"d:\\dest\\새로운_폴더"
         ... )
         >>> print(f"복사 완료: {result['file_count']}개 파일")
+        
+        >>> result = copy_folder(r"d:\\source\\폴더", r"d:\\dest\\새로운_폴더", incremental=True)
+        >>> print(f"변경 {result['copied']}개, 삭제 {result['deleted']}개")
     """
     result = {
         "success": False,
         "source_path": source,
         "dest_path": destination,
         "file_count": 0,
+        "copied": 0,
+        "skipped": 0,
+        "deleted": 0,
+        "bytes_copied": 0,
+        "elapsed": 0.0,
         "error": None
     }
+    start = time.perf_counter()
     
     try:
         # 원본 폴더 존재 확인
@@ -66,30 +266,40 @@ def copy_folder(
         if not os.path.isdir(source):
             raise ValueError(f"원본 경로가 폴더가 아닙니다: {source}")
         
-        # 대상 폴더가 이미 존재하는 경우
-        if os.path.exists(destination):
+        # 대상 폴더가 이미 존재하는 경우 (incremental 모드는 그대로 두고 동기화)
+        if os.path.exists(destination) and not incremental:
             if overwrite:
                 shutil.rmtree(destination)
             else:
                 raise FileExistsError(f"대상 폴더가 이미 존재합니다: {destination}")
         
-        # 폴더 복사
-        shutil.copytree(source, destination)
+        # 폴더 복사 (빈 대상 폴더로의 동기화와 같음)
+        stats = _sync_tree(source, destination, delete=delete, checksum=checksum, workers=workers)
+        result.update(
+            copied=stats["copied"],
+            skipped=stats["skipped"],
+            deleted=stats["deleted"],
+            bytes_copied=stats["bytes_copied"],
+        )
         
-        # 검증
+        # 검증 (원본은 동기화하면서 이미 셌으므로 대상만 다시 셈)
         if verify:
-            source_files = list(Path(source).rglob("*"))
-            dest_files = list(Path(destination).rglob("*"))
-            result["file_count"] = len(dest_files)
+            source_count = stats["entry_count"]
+            dest_count = _count_entries(destination)
+            result["file_count"] = dest_count
             
-            if len(source_files) != len(dest_files):
-                result["error"] = f"파일 개수 불일치: 원본 {len(source_files)}, 대상 {len(dest_files)}"
+            # 삭제하지 않는 증분 모드는 대상에 원본에 없는 항목이 남아 있을 수 있음
+            keeps_extra = incremental and not delete
+            if dest_count < source_count or (dest_count != source_count and not keeps_extra):
+                result["error"] = f"파일 개수 불일치: 원본 {source_count}, 대상 {dest_count}"
+                result["elapsed"] = time.perf_counter() - start
                 return result
         else:
             # 빠른 카운트 (최상위만)
             result["file_count"] = len(os.listdir(destination))
         
         result["success"] = True
+        result["elapsed"] = time.perf_counter() - start
         return result
         
     except Exception as e:
@@ -231,8 +441,88 @@ def safe_file_name(name: str, replace_char: str = "_") -> str:
     return name
 
 
+def benchmark_copy_folder(
+    file_count: int = 100_000,
+    large_file_count: int = 8,
+    large_file_size: int = 16 * 1024 * 1024,
+    work_dir: Optional[str] = None
+) -> Dict[str, float]:
+    """
+    copy_folder 전체 복사 / 증분 동기화 소요 시간을 측정합니다.
+    
+    작은 파일 file_count개(폴더당 100개)와 큰 파일 large_file_count개로 트리를 만든 뒤
+    기존 방식(rmtree + copytree)과 전체 복사(둘 다 기존 대상 폴더 삭제 포함), 변경 없는 증분 동기화, 1% 수정 + 0.5% 삭제 후 증분 동기화를 잽니다.
+    
+    Args:
+        file_count (int): 작은 파일 개수 (기본값: 100,000)
+        large_file_count (int): 큰 파일 개수 (기본값: 8)
+        large_file_size (int): 큰 파일 크기 (기본값: 16MB)
+        work_dir (Optional[str]): 작업 폴더 (기본값: None, 임시 폴더)
+    
+    Returns:
+        Dict[str, float]: 단계별 소요 시간 (초)
+    
+    Examples:
+        >>> timings = benchmark_copy_folder(file_count=10_000)
+    """
+    import tempfile
+    
+    root = tempfile.mkdtemp(prefix="copy_folder_bench_", dir=work_dir)
+    source = os.path.join(root, "source")
+    destination = os.path.join(root, "dest")
+    timings = {}
+    
+    def measure(name: str, func) -> None:
+        start = time.perf_counter()
+        func()
+        timings[name] = time.perf_counter() - start
+        print(f"  {name:<32} {timings[name]:8.2f}s")
+    
+    try:
+        print(f"📁 트리 생성 중: 작은 파일 {file_count:,}개 + 큰 파일 {large_file_count}개 ({root})")
+        small_files = []
+        for index in range(file_count):
+            folder = os.path.join(source, f"dir_{index // 100:05d}")
+            if index % 100 == 0:
+                os.makedirs(folder)
+            path = os.path.join(folder, f"file_{index:06d}.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(f"파일 {index}\n" * 8)
+            small_files.append(path)
+        os.makedirs(os.path.join(source, "large"), exist_ok=True)
+        for index in range(large_file_count):
+            with open(os.path.join(source, "large", f"blob_{index}.bin"), "wb") as f:
+                f.write(os.urandom(large_file_size))
+        
+        def legacy_copy() -> None:
+            if os.path.exists(destination):
+                shutil.rmtree(destination)
+            shutil.copytree(source, destination)
+        
+        def modify_source() -> None:
+            past = time.time() - 10
+            for path in small_files[::100]:
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write("changed\n")
+                os.utime(path, (past, past))
+            for path in small_files[50::200]:
+                os.unlink(path)
+        
+        print("⏱️  측정 중...")
+        shutil.copytree(source, destination)
+        # 두 전체 복사 모두 기존 대상 폴더 삭제부터 시작 (overwrite=True 경로)
+        measure("rmtree + copytree (기존)", legacy_copy)
+        measure("copy_folder (전체)", lambda: copy_folder(source, destination))
+        measure("copy_folder (증분, 변경 없음)", lambda: copy_folder(source, destination, incremental=True))
+        modify_source()
+        measure("copy_folder (증분, 1% 변경)", lambda: copy_folder(source, destination, incremental=True))
+        return timings
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
 # 버전 정보
-__version__ = "1.0.0"
+__version__ = "1.1.0"
 __author__ = "Cursor AI Assistant"
 __all__ = [
     "copy_folder",
@@ -245,6 +535,13 @@ __all__ = [
 
 
 if __name__ == "__main__":
+    import sys
+    
+    # python common_util.py bench [파일 개수]
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        benchmark_copy_folder(file_count=int(sys.argv[2]) if len(sys.argv) > 2 else 100_000)
+        sys.exit(0)
+    
     # 테스트 코드
     print(f"Common Util v{__version__}")
     print(f"Available functions: {', '.join(__all__)}")
@@ -0,0 +1,174 @@
+"""
+common_util 테스트
+
+실행: python .cursor/scripts/test_common_util.py
+"""
+
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from common_util import copy_folder
+
+
+@unittest.skipUnless(hasattr(os, "symlink") and os.name != "nt", "심볼릭 링크 필요")
+class CopyFolderSymlinkTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="common_util_test_")
+        self.source = os.path.join(self.root, "src")
+        self.destination = os.path.join(self.root, "dst")
+        self.outside = os.path.join(self.root, "outside")
+        os.makedirs(self.source)
+        os.makedirs(self.outside)
+        with open(os.path.join(self.source, "a.txt"), "w", encoding="utf-8") as f:
+            f.write("a")
+        for name in ("x.txt", "y.txt"):
+            with open(os.path.join(self.outside, name), "w", encoding="utf-8") as f:
+                f.write(name)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_incremental_deletes_symlink_not_its_target(self):
+        copy_folder(self.source, self.destination)
+        os.symlink(self.outside, os.path.join(self.destination, "link"))
+
+        result = copy_folder(self.source, self.destination, incremental=True)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["deleted"], 1)
+        self.assertFalse(os.path.lexists(os.path.join(self.destination, "link")))
+        self.assertEqual(sorted(os.listdir(self.outside)), ["x.txt", "y.txt"])
+
+    def test_incremental_replaces_symlink_instead_of_writing_through_it(self):
+        copy_folder(self.source, self.destination)
+        target = os.path.join(self.outside, "x.txt")
+        dest_file = os.path.join(self.destination, "a.txt")
+        os.unlink(dest_file)
+        os.symlink(target, dest_file)
+
+        result = copy_folder(self.source, self.destination, incremental=True)
+
+        self.assertTrue(result["success"])
+        self.assertFalse(os.path.islink(dest_file))
+        with open(target, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "x.txt")
+        with open(dest_file, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "a")
+
+
+class CopyFolderMetadataTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="common_util_test_")
+        self.source = os.path.join(self.root, "src")
+        self.destination = os.path.join(self.root, "dst")
+        os.makedirs(os.path.join(self.source, "private", "nested"))
+        with open(os.path.join(self.source, "private", "nested", "a.txt"), "w", encoding="utf-8") as f:
+            f.write("a")
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_directory_mode_and_mtime_are_kept(self):
+        private = os.path.join(self.source, "private")
+        nested = os.path.join(private, "nested")
+        os.utime(nested, (1_000_000_000, 1_000_000_000))
+        os.utime(private, (1_000_000_000, 1_000_000_000))
+        os.chmod(private, 0o700)
+
+        result = copy_folder(self.source, self.destination)
+
+        self.assertTrue(result["success"])
+        for rel_path in ("private", os.path.join("private", "nested")):
+            src_st = os.stat(os.path.join(self.source, rel_path))
+            dest_st = os.stat(os.path.join(self.destination, rel_path))
+            self.assertEqual(stat.S_IMODE(dest_st.st_mode), stat.S_IMODE(src_st.st_mode))
+            self.assertEqual(int(dest_st.st_mtime), int(src_st.st_mtime))
+
+
+class CopyFolderIncrementalTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="common_util_test_")
+        self.source = os.path.join(self.root, "src")
+        self.destination = os.path.join(self.root, "dst")
+        os.makedirs(os.path.join(self.source, "sub"))
+        self.write(self.source, "a.txt", "a")
+        self.write(self.source, "b.txt", "b")
+        self.write(self.source, os.path.join("sub", "c.txt"), "c")
+        copy_folder(self.source, self.destination)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def write(self, base, rel_path, text):
+        with open(os.path.join(base, rel_path), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def read(self, base, rel_path):
+        with open(os.path.join(base, rel_path), encoding="utf-8") as f:
+            return f.read()
+
+    def test_only_changed_files_are_copied(self):
+        self.write(self.source, "a.txt", "changed")
+        self.write(self.destination, "b.txt", "x")
+        os.utime(os.path.join(self.destination, "b.txt"), (1_000_000_000, 1_000_000_000))
+
+        result = copy_folder(self.source, self.destination, incremental=True)
+
+        self.assertTrue(result["success"])
+        self.assertEqual((result["copied"], result["skipped"], result["deleted"]), (2, 1, 0))
+        self.assertEqual(result["bytes_copied"], len("changed") + len("b"))
+        self.assertEqual(self.read(self.destination, "a.txt"), "changed")
+        self.assertEqual(self.read(self.destination, "b.txt"), "b")
+
+    def test_unchanged_tree_copies_nothing(self):
+        result = copy_folder(self.source, self.destination, incremental=True)
+
+        self.assertTrue(result["success"])
+        self.assertEqual((result["copied"], result["skipped"], result["deleted"]), (0, 3, 0))
+        self.assertEqual(result["bytes_copied"], 0)
+
+    def test_files_removed_from_source_are_deleted(self):
+        os.unlink(os.path.join(self.source, "b.txt"))
+        shutil.rmtree(os.path.join(self.source, "sub"))
+
+        result = copy_folder(self.source, self.destination, incremental=True)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["deleted"], 3)
+        self.assertEqual(os.listdir(self.destination), ["a.txt"])
+
+    def test_delete_false_keeps_extra_files(self):
+        self.write(self.destination, "extra.txt", "extra")
+        os.unlink(os.path.join(self.source, "b.txt"))
+
+        result = copy_folder(self.source, self.destination, incremental=True, delete=False)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["deleted"], 0)
+        self.assertEqual(self.read(self.destination, "extra.txt"), "extra")
+        self.assertEqual(self.read(self.destination, "b.txt"), "b")
+
+    def test_checksum_catches_same_size_same_mtime_change(self):
+        dest_file = os.path.join(self.destination, "a.txt")
+        src_st = os.stat(os.path.join(self.source, "a.txt"))
+        self.write(self.destination, "a.txt", "z")
+        os.utime(dest_file, ns=(src_st.st_atime_ns, src_st.st_mtime_ns))
+
+        result = copy_folder(self.source, self.destination, incremental=True)
+        self.assertEqual(result["copied"], 0)
+        self.assertEqual(self.read(self.destination, "a.txt"), "z")
+
+        result = copy_folder(self.source, self.destination, incremental=True, checksum=True)
+        self.assertTrue(result["success"])
+        self.assertEqual((result["copied"], result["skipped"]), (1, 2))
+        self.assertEqual(self.read(self.destination, "a.txt"), "a")
+
+
+if __name__ == "__main__":
+    unittest.main()
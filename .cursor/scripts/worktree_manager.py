@@ -9,6 +9,31 @@ Git worktree를 자동으로 생성하고 관리하는 스크립트입니다.
     macOS/Linux:
         python worktree_manager.py <branch_name>
 
+    여러 브랜치 일괄 생성 (파일 또는 stdin, 한 줄에 하나):
+        python worktree_manager.py --batch branches.txt --jobs 4
+        gh pr list --json headRefName -q '.[].headRefName' | python worktree_manager.py --batch -
+
+    리모트 브랜치는 ls-remote(캐시 5분)로 확인한 뒤 해당 브랜치만 fetch (shallow 저장소면 --depth로 얕게):
+        python worktree_manager.py <branch_name> --depth 50
+
+    필요한 폴더만 체크아웃 (sparse-checkout 프로필, worktree_profiles.json):
+        python worktree_manager.py <branch_name> --profile dart
+
+    메인 체크아웃(또는 --seed-from)의 빌드 캐시(.dart_tool, build, Gradle, CocoaPods)로 시작:
+        python worktree_manager.py <branch_name> --seed-cache
+
+    worktree 목록/상태/정리 (브랜치명이 list·status·gc이면 `-- <branch_name>`으로 구분):
+        python worktree_manager.py list
+        python worktree_manager.py status
+        python worktree_manager.py gc --older-than 30 --dry-run
+
+    데몬 모드 (macOS/Linux, 실행 중이면 자동으로 사용하고 없으면 직접 실행):
+        python worktree_manager.py daemon start
+        python worktree_manager.py daemon stop
+
+    결과를 JSON 문서로 받기 (stdout은 JSON만, 진행 메시지는 stderr):
+        python worktree_manager.py <branch_name> --json
+
     Windows (환경 변수 방식, 권장):
         $env:GIT_BRANCH_NAME = "브랜치명"
         $env:PYTHONIOENCODING = "utf-8"
@@ -21,25 +46,18 @@ Author: Cursor AI Assistant
 Version: 1.0.4
 """
 
+import errno
+import io
 import os
+import stat
 import sys
-import subprocess
-import re
-import platform
-import io
+import time
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
-# Windows 인코딩 문제 해결 - stdout/stderr를 UTF-8로 래핑
-if platform.system() == 'Windows':
-  try:
-    # stdout/stderr가 버퍼를 가지고 있는 경우에만 래핑
-    if hasattr(sys.stdout, 'buffer'):
-      sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-    if hasattr(sys.stderr, 'buffer'):
-      sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-  except Exception:
-    pass  # 래핑 실패 시 무시
+# 시작 시간을 줄이기 위해 일부 경로에서만 쓰는 모듈(argparse, subprocess, json, shutil, socket,
+# concurrent.futures 등)은 사용하는 함수 안에서 import 합니다.
+# 측정: python -X importtime worktree_manager.py <branch> / python worktree_manager.py bench
 
 
 # ===================================================================
@@ -48,28 +66,61 @@ if platform.system() == 'Windows':
 
 VERSION = "1.1.0"
 
-# Windows 환경 감지
-IS_WINDOWS = platform.system() == 'Windows'
+# Windows 환경 감지 (platform.system() == 'Windows'와 같음)
+IS_WINDOWS = sys.platform == 'win32'
 
 # 폴더명에서 제거할 특수문자 (파일시스템에서 안전하지 않은 문자)
-SPECIAL_CHARS_PATTERN = r'[#/\\:*?"<>|]'
+SPECIAL_CHARS = '#/\\:*?"<>|'
 
 # Worktree 루트 폴더명 (동적으로 설정됨)
 # 예: RomRom-FE → RomRom-FE-Worktree
 WORKTREE_ROOT_NAME = None  # get_worktree_root()에서 동적으로 설정
 
+# 리모트 브랜치 목록(ls-remote) 캐시: worktree 루트 아래 파일, 유효 시간(초)
+REMOTE_CACHE_FILE = '.remote-heads-cache.json'
+REMOTE_CACHE_TTL = 300
+
+# sparse-checkout 프로필 프리셋 파일 (스크립트와 같은 폴더)
+PROFILES_FILE = Path(__file__).resolve().with_name('worktree_profiles.json')
+
+# 새 worktree에 복제할 빌드 캐시 (worktree 루트 기준 상대 경로, .gitignore 대상)
+SEED_CACHE_PATHS = [
+  '.dart_tool',
+  'build',
+  'android/.gradle',
+  'android/local.properties',
+  'ios/Pods',
+  'ios/.symlinks',
+  'macos/Pods',
+]
+SEED_JOBS = 8
+
+# 저장소 상태 스냅샷 (프로세스 동안 유지, 변경 명령 후 해당 항목만 무효화)
+# - 'worktrees': git worktree list --porcelain 항목 리스트 (Git 저장소가 아니면 None)
+# - 'refs'     : git for-each-ref 로 읽은 로컬/리모트 브랜치 집합
+_snapshot: Dict[str, object] = {}
+
+# --json 결과 문서용 기록 (main() 시작 시 초기화)
+# - _git_calls: 실행한 git 명령별 소요 시간 [{'command': str, 'ms': float, 'ok': bool}, ...]
+# - _errors   : print_error로 출력한 메시지
+_git_calls: List[Dict] = []
+_errors: List[str] = []
+
 
 # ===================================================================
 # 유틸리티 함수
 # ===================================================================
 
-def get_branch_name() -> str:
+def get_branch_name(arg_branch: Optional[str] = None) -> str:
   """
   브랜치명을 안전하게 받기 (Windows 인코딩 문제 해결)
 
   Windows 환경에서 PowerShell → Python 스크립트로 한글 브랜치명을 전달할 때
   인코딩 문제가 발생하므로, 환경 변수나 파일에서 읽는 방식을 우선 사용합니다.
 
+  Args:
+      arg_branch: 명령행 인자로 받은 브랜치명
+
   Returns:
       str: 브랜치명 (비어있을 수 있음)
   """
@@ -128,13 +179,27 @@ def get_branch_name() -> str:
       except Exception:
         pass
 
-  # 기본: sys.argv에서 받기 (macOS/Linux 또는 Windows에서도 인자로 전달된 경우)
-  if len(sys.argv) >= 2:
-    return sys.argv[1].strip()
+  # 기본: 명령행 인자에서 받기 (macOS/Linux 또는 Windows에서도 인자로 전달된 경우)
+  if arg_branch:
+    return arg_branch.strip()
 
   return ''
 
 
+def configure_windows_console():
+  """
+  Windows 인코딩 문제 해결 - stdout/stderr를 UTF-8로 래핑 (엔트리 포인트에서 한 번만 호출)
+  """
+  try:
+    # stdout/stderr가 버퍼를 가지고 있는 경우에만 래핑
+    if hasattr(sys.stdout, 'buffer'):
+      sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    if hasattr(sys.stderr, 'buffer'):
+      sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+  except Exception:
+    pass  # 래핑 실패 시 무시
+
+
 def print_header():
   """헤더 출력"""
   print("━" * 60)
@@ -150,6 +215,7 @@ def print_step(emoji: str, message: str):
 
 def print_error(message: str):
   """에러 메시지 출력"""
+  _errors.append(message)
   print(f"❌ 에러: {message}", file=sys.stderr)
 
 
@@ -183,6 +249,9 @@ def run_git_command(args: list, check: bool = True) -> Tuple[bool, str, str]:
   Returns:
       Tuple[bool, str, str]: (성공 여부, stdout, stderr)
   """
+  import subprocess
+
+  start = time.perf_counter()
   try:
     result = subprocess.run(
       ['git'] + args,
@@ -191,11 +260,18 @@ def run_git_command(args: list, check: bool = True) -> Tuple[bool, str, str]:
       encoding='utf-8',
       check=check
     )
-    return True, result.stdout.strip(), result.stderr.strip()
+    outcome = (result.returncode == 0, result.stdout.strip(), result.stderr.strip())
   except subprocess.CalledProcessError as e:
-    return False, e.stdout.strip() if e.stdout else "", e.stderr.strip() if e.stderr else ""
+    outcome = (False, e.stdout.strip() if e.stdout else "", e.stderr.strip() if e.stderr else "")
   except Exception as e:
-    return False, "", str(e)
+    outcome = (False, "", str(e))
+
+  _git_calls.append({
+    'command': ' '.join(['git'] + args),
+    'ms': round((time.perf_counter() - start) * 1000, 2),
+    'ok': outcome[0],
+  })
+  return outcome
 
 
 def check_and_enable_longpaths() -> bool:
@@ -225,22 +301,144 @@ def check_and_enable_longpaths() -> bool:
     return False
 
 
+# ===================================================================
+# 저장소 상태 스냅샷
+# ===================================================================
+#
+# 브랜치/worktree 확인마다 git을 따로 실행하지 않고, `git worktree list --porcelain`과
+# `git for-each-ref` 두 번의 호출 결과를 모아 두고 모든 확인이 여기서 읽습니다.
+# 이미 존재하는 worktree 경로는 worktree 목록만으로 확인이 끝납니다.
+
+def invalidate_snapshot(*keys: str):
+  """
+  변경 명령(fetch, branch, worktree add 등) 실행 후 스냅샷 무효화
+
+  Args:
+      keys: 무효화할 항목 ('worktrees', 'refs'). 지정하지 않으면 전체
+  """
+  if not keys:
+    _snapshot.clear()
+  for key in keys:
+    _snapshot.pop(key, None)
+
+
+def parse_worktree_porcelain(stdout: str) -> List[Dict]:
+  """
+  `git worktree list --porcelain` 출력 파싱
+
+  Returns:
+      List[Dict]: [{'path': str, 'branch': Optional[str], 'locked': bool, 'prunable': bool}, ...]
+                  (첫 항목이 메인 worktree, detached HEAD는 branch가 None)
+  """
+  entries = []
+  entry = None
+
+  for line in stdout.split('\n'):
+    if line.startswith('worktree '):
+      entry = {'path': line[len('worktree '):], 'branch': None, 'locked': False, 'prunable': False}
+      entries.append(entry)
+    elif entry is None:
+      continue
+    elif line.startswith('branch '):
+      branch = line[len('branch '):]
+      entry['branch'] = branch[len('refs/heads/'):] if branch.startswith('refs/heads/') else branch
+    elif line == 'locked' or line.startswith('locked '):
+      entry['locked'] = True
+    elif line == 'prunable' or line.startswith('prunable '):
+      entry['prunable'] = True
+
+  return entries
+
+
+def get_worktree_entries() -> Optional[List[Dict]]:
+  """
+  등록된 worktree 항목 (스냅샷, 첫 호출 시 git worktree list 1회)
+
+  Returns:
+      Optional[List[Dict]]: worktree 항목 리스트, Git 저장소가 아니면 None
+  """
+  if 'worktrees' not in _snapshot:
+    success, stdout, _ = run_git_command(['worktree', 'list', '--porcelain'], check=False)
+    _snapshot['worktrees'] = parse_worktree_porcelain(stdout) if success else None
+  return _snapshot['worktrees']
+
+
+def get_refs() -> Dict[str, Set[str]]:
+  """
+  로컬/리모트 브랜치 목록 (스냅샷, 첫 호출 시 git for-each-ref 1회)
+
+  Returns:
+      Dict[str, Set[str]]: {'local': {'main', ...}, 'remote': {'origin/main', ...}}
+  """
+  if 'refs' not in _snapshot:
+    success, stdout, _ = run_git_command(
+      ['for-each-ref', '--format=%(refname)', 'refs/heads', 'refs/remotes'],
+      check=False
+    )
+    local, remote = set(), set()
+    if success:
+      for ref in stdout.split('\n'):
+        if ref.startswith('refs/heads/'):
+          local.add(ref[len('refs/heads/'):])
+        elif ref.startswith('refs/remotes/') and not ref.endswith('/HEAD'):
+          remote.add(ref[len('refs/remotes/'):])
+    _snapshot['refs'] = {'local': local, 'remote': remote}
+  return _snapshot['refs']
+
+
+def get_current_worktree() -> Optional[Dict]:
+  """
+  현재 디렉토리가 속한 worktree 항목 (여러 개가 포함하면 가장 깊은 경로)
+
+  Returns:
+      Optional[Dict]: worktree 항목, 찾지 못하면 None
+  """
+  cwd = Path.cwd().resolve()
+  current = None
+  depth = -1
+
+  for entry in get_worktree_entries() or []:
+    path = Path(entry['path']).resolve()
+    if (path == cwd or path in cwd.parents) and len(path.parts) > depth:
+      current, depth = entry, len(path.parts)
+
+  return current
+
+
+# ===================================================================
+# Git 저장소 조회 함수
+# ===================================================================
+
 def is_git_repository() -> bool:
   """현재 디렉토리가 Git 저장소인지 확인"""
-  success, _, _ = run_git_command(['rev-parse', '--git-dir'], check=False)
-  return success
+  return get_worktree_entries() is not None
 
 
 def get_git_root() -> Optional[Path]:
-  """Git 저장소 루트 경로 반환"""
+  """Git 저장소 루트 경로 반환 (현재 worktree의 최상위 경로)"""
+  entry = get_current_worktree()
+  if entry:
+    return Path(entry['path'])
+
+  # worktree 목록으로 찾지 못한 경우 (예: .git 디렉토리 내부)
   success, stdout, _ = run_git_command(['rev-parse', '--show-toplevel'], check=False)
   if success and stdout:
     return Path(stdout)
   return None
 
 
+def is_shallow_repository() -> bool:
+  """저장소가 이미 shallow clone인지 확인"""
+  success, stdout, _ = run_git_command(['rev-parse', '--is-shallow-repository'], check=False)
+  return success and stdout == 'true'
+
+
 def get_current_branch() -> Optional[str]:
   """현재 체크아웃된 브랜치명 반환"""
+  entry = get_current_worktree()
+  if entry:
+    return entry['branch']
+
   success, stdout, _ = run_git_command(['branch', '--show-current'], check=False)
   if success and stdout:
     return stdout
@@ -257,12 +455,10 @@ def branch_exists(branch_name: str) -> bool:
   Returns:
       bool: 로컬 브랜치가 존재하면 True
   """
-  success, stdout, _ = run_git_command(['branch', '--list', branch_name], check=False)
-  if success and stdout:
-    # 출력 형식: "  branch_name" 또는 "* branch_name"
-    branches = [line.strip().lstrip('* ') for line in stdout.split('\n')]
-    return branch_name in branches
-  return False
+  # worktree에 체크아웃된 브랜치는 로컬에 있으므로 ref 조회 없이 확인
+  if any(entry['branch'] == branch_name for entry in get_worktree_entries() or []):
+    return True
+  return branch_name in get_refs()['local']
 
 
 def remote_branch_exists(branch_name: str, remote: str = 'origin') -> bool:
@@ -276,11 +472,7 @@ def remote_branch_exists(branch_name: str, remote: str = 'origin') -> bool:
   Returns:
       bool: 리모트에 브랜치가 존재하면 True
   """
-  success, stdout, _ = run_git_command(['branch', '-r', '--list', f'{remote}/{branch_name}'], check=False)
-  if success and stdout:
-    branches = [line.strip() for line in stdout.split('\n')]
-    return f'{remote}/{branch_name}' in branches
-  return False
+  return f'{remote}/{branch_name}' in get_refs()['remote']
 
 
 def fetch_remote(remote: str = 'origin') -> bool:
@@ -295,11 +487,223 @@ def fetch_remote(remote: str = 'origin') -> bool:
   """
   print_step("🔄", f"리모트({remote}) 최신 정보 가져오는 중...")
   success, _, stderr = run_git_command(['fetch', remote], check=False)
+  invalidate_snapshot('refs')
   if not success:
     print_warning(f"리모트 fetch 실패: {stderr}")
   return success
 
 
+def ls_remote_heads(remote: str = 'origin', branch_names: Optional[List[str]] = None) -> Optional[Dict[str, str]]:
+  """
+  git ls-remote --heads로 리모트 브랜치 조회 (fetch 없이 ref 목록만 받음)
+
+  Args:
+      remote: 리모트 이름
+      branch_names: 조회할 브랜치명 (없으면 전체)
+
+  Returns:
+      Optional[Dict[str, str]]: {브랜치명: 커밋 해시}, 실패하면 None
+  """
+  success, stdout, stderr = run_git_command(['ls-remote', '--heads', remote] + (branch_names or []))
+  if not success:
+    print_warning(f"리모트 브랜치 조회 실패: {stderr}")
+    return None
+
+  heads = {}
+  for line in stdout.split('\n'):
+    sha, _, ref = line.partition('\t')
+    if ref.startswith('refs/heads/'):
+      heads[ref[len('refs/heads/'):]] = sha
+  return heads
+
+
+def get_remote_cache_path() -> Optional[Path]:
+  """리모트 브랜치 캐시 파일 경로 (worktree 루트를 알 수 없으면 None)"""
+  try:
+    return get_worktree_root() / REMOTE_CACHE_FILE
+  except RuntimeError:
+    return None
+
+
+def load_remote_heads_cache(remote: str, ttl: int) -> Optional[Dict[str, str]]:
+  """
+  유효 시간 안의 리모트 브랜치 캐시 읽기
+
+  Returns:
+      Optional[Dict[str, str]]: {브랜치명: 커밋 해시}, 없거나 만료되었으면 None
+  """
+  cache_path = get_remote_cache_path()
+  if ttl <= 0 or not cache_path:
+    return None
+  import json
+
+  try:
+    with open(cache_path, 'r', encoding='utf-8') as f:
+      entry = json.load(f).get(remote) or {}
+  except (OSError, ValueError):
+    return None
+  if time.time() - entry.get('fetched_at', 0) > ttl:
+    return None
+  return entry.get('heads')
+
+
+def save_remote_heads_cache(remote: str, heads: Dict[str, str]):
+  """리모트 브랜치 전체 목록을 캐시에 저장 (실패해도 무시)"""
+  cache_path = get_remote_cache_path()
+  if not cache_path:
+    return
+  import json
+
+  try:
+    with open(cache_path, 'r', encoding='utf-8') as f:
+      cache = json.load(f)
+  except (OSError, ValueError):
+    cache = {}
+  cache[remote] = {'fetched_at': time.time(), 'heads': heads}
+
+  try:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+      json.dump(cache, f, ensure_ascii=False)
+    os.replace(tmp_path, cache_path)
+  except OSError as e:
+    print_warning(f"리모트 브랜치 캐시 저장 실패: {e}")
+
+
+def clear_remote_heads_cache():
+  """리모트 브랜치 캐시 삭제 (캐시가 리모트와 달라졌을 때)"""
+  cache_path = get_remote_cache_path()
+  if not cache_path:
+    return
+  try:
+    cache_path.unlink()
+  except FileNotFoundError:
+    pass
+  except OSError as e:
+    print_warning(f"리모트 브랜치 캐시 삭제 실패: {e}")
+
+
+def find_remote_branches(branch_names: List[str], remote: str = 'origin',
+                         ttl: int = REMOTE_CACHE_TTL) -> Optional[Tuple[Set[str], Set[str]]]:
+  """
+  브랜치들 중 리모트에 존재하는 것 확인 (fetch 없이)
+
+  캐시가 유효하면 캐시로 답하고, 캐시에 없는 브랜치만 `ls-remote --heads <remote> <브랜치...>`로
+  다시 확인합니다 (캐시 이후 push된 브랜치 대응). 캐시가 없거나 만료되었으면 전체 목록을 한 번
+  받아 캐시를 갱신합니다. ttl이 0이면 캐시 없이 해당 브랜치만 조회합니다.
+
+  Returns:
+      Optional[Tuple[Set[str], Set[str]]]: (리모트에 있는 브랜치명, 그중 캐시로만 확인한 브랜치명),
+      리모트 조회 실패 시 None
+  """
+  heads = load_remote_heads_cache(remote, ttl)
+  from_cache = heads is not None
+
+  if heads is None:
+    heads = ls_remote_heads(remote, None if ttl > 0 else branch_names)
+    if heads is None:
+      return None
+    if ttl > 0:
+      save_remote_heads_cache(remote, heads)
+
+  found = {name for name in branch_names if name in heads}
+  cached = set(found) if from_cache else set()
+  unknown = [name for name in branch_names if name not in heads]
+  if from_cache and unknown:
+    confirmed = ls_remote_heads(remote, unknown)
+    if confirmed is None:
+      return None
+    found.update(name for name in unknown if name in confirmed)
+  return found, cached
+
+
+def fetch_remote_branches(branch_names: List[str], remote: str = 'origin', depth: Optional[int] = None) -> bool:
+  """
+  지정한 브랜치의 refspec만 fetch (전체 git fetch 대신)
+
+  refspec 하나라도 리모트에 없으면 git fetch 전체가 실패하므로, 여러 브랜치를 한 번에 가져오다
+  실패하면 브랜치별로 다시 fetch해서 문제가 된 브랜치만 실패로 남깁니다.
+
+  Args:
+      branch_names: fetch할 브랜치명
+      remote: 리모트 이름
+      depth: 지정하면 얕은 fetch (--depth, 이미 shallow인 저장소에서만 넘길 것)
+
+  Returns:
+      bool: 모든 브랜치를 가져왔는지 여부
+  """
+  print_step("🔄", f"리모트({remote})에서 브랜치 {len(branch_names)}개만 가져오는 중...")
+  depth_args = ['--depth', str(depth)] if depth else []
+
+  def fetch(names: List[str]) -> Tuple[bool, str]:
+    refspecs = [f'+refs/heads/{name}:refs/remotes/{remote}/{name}' for name in names]
+    success, _, stderr = run_git_command(['fetch'] + depth_args + [remote] + refspecs)
+    return success, stderr
+
+  success, stderr = fetch(branch_names)
+  if not success and len(branch_names) > 1:
+    print_warning(f"리모트 브랜치 일괄 fetch 실패, 브랜치별로 다시 시도합니다: {stderr}")
+    failed = []
+    for name in branch_names:
+      ok, stderr = fetch([name])
+      if not ok:
+        failed.append(name)
+        print_warning(f"리모트 브랜치({remote}/{name}) fetch 실패: {stderr}")
+    success = not failed
+  elif not success:
+    print_warning(f"리모트 브랜치 fetch 실패: {stderr}")
+  invalidate_snapshot('refs')
+  return success
+
+
+def sync_remote_branches(branch_names: List[str], remote: str = 'origin', depth: Optional[int] = None,
+                         ttl: int = REMOTE_CACHE_TTL) -> Dict[str, str]:
+  """
+  로컬에 없는 브랜치들의 리모트 존재 여부를 확인하고 리모트에 있는 브랜치만 fetch
+
+  리모트 조회(ls-remote)에 실패하면 기존처럼 전체 fetch 후 원격 추적 브랜치로 판단합니다.
+  캐시로만 확인한 브랜치를 가져오지 못하면 캐시를 지우고 ls-remote로 다시 확인해, 그사이 리모트에서
+  삭제된 브랜치는 'new'로 처리합니다. 'fetch_failed'는 방금 ls-remote로 확인한 브랜치에만 붙습니다.
+
+  Returns:
+      Dict[str, str]: {브랜치명: 'remote'(원격 추적 브랜치 준비됨) | 'new'(리모트에 없음) | 'fetch_failed'}
+  """
+  lookup = find_remote_branches(branch_names, remote, ttl)
+  if lookup is None:
+    found = None
+    fetch_remote(remote)
+  else:
+    found, cached = lookup
+    if found:
+      fetch_remote_branches(sorted(found), remote, depth)
+
+    stale = [name for name in sorted(found & cached) if not remote_branch_exists(name, remote)]
+    if stale:
+      print_step("🌐", "리모트 브랜치 캐시가 오래되어 다시 확인합니다...")
+      clear_remote_heads_cache()
+      confirmed = ls_remote_heads(remote, stale)
+      if confirmed is None:
+        # 다시 확인할 수 없으면 전체 fetch 결과로 판단
+        found -= set(stale)
+        fetch_remote(remote)
+      else:
+        found -= {name for name in stale if name not in confirmed}
+        retry = [name for name in stale if name in confirmed]
+        if retry:
+          fetch_remote_branches(retry, remote, depth)
+
+  states = {}
+  for name in branch_names:
+    if remote_branch_exists(name, remote):
+      states[name] = 'remote'
+    elif found is not None and name in found:
+      states[name] = 'fetch_failed'
+    else:
+      states[name] = 'new'
+  return states
+
+
 def create_branch(branch_name: str) -> bool:
   """
   새 브랜치 생성 (현재 브랜치에서 분기)
@@ -311,6 +715,7 @@ def create_branch(branch_name: str) -> bool:
       bool: 성공 여부
   """
   success, _, stderr = run_git_command(['branch', branch_name], check=False)
+  invalidate_snapshot('refs')
   if not success:
     print_error(f"브랜치 생성 실패: {stderr}")
   return success
@@ -331,6 +736,7 @@ def create_branch_from_remote(branch_name: str, remote: str = 'origin') -> bool:
     ['branch', '--track', branch_name, f'{remote}/{branch_name}'],
     check=False
   )
+  invalidate_snapshot('refs')
   if not success:
     print_error(f"리모트 브랜치 기반 로컬 브랜치 생성 실패: {stderr}")
   return success
@@ -341,25 +747,9 @@ def get_worktree_list() -> Dict[str, str]:
   현재 등록된 worktree 목록 반환
 
   Returns:
-      Dict[str, str]: {worktree_path: branch_name}
+      Dict[str, str]: {worktree_path: branch_name} (detached HEAD worktree 제외)
   """
-  success, stdout, _ = run_git_command(['worktree', 'list', '--porcelain'], check=False)
-  if not success:
-    return {}
-
-  worktrees = {}
-  current_path = None
-
-  for line in stdout.split('\n'):
-    if line.startswith('worktree '):
-      current_path = line.replace('worktree ', '')
-    elif line.startswith('branch '):
-      branch = line.replace('branch ', '').replace('refs/heads/', '')
-      if current_path:
-        worktrees[current_path] = branch
-        current_path = None
-
-  return worktrees
+  return {entry['path']: entry['branch'] for entry in get_worktree_entries() or [] if entry['branch']}
 
 
 def prune_worktrees() -> bool:
@@ -372,15 +762,43 @@ def prune_worktrees() -> bool:
   success, _, stderr = run_git_command(['worktree', 'prune'], check=False)
   if not success:
     print_warning(f"Worktree prune 실패: {stderr}")
+  elif _snapshot.get('worktrees'):
+    # prune이 지우는 항목(잠기지 않았고 경로가 없는 worktree)만 스냅샷에서 제거 (목록 재조회 불필요)
+    _snapshot['worktrees'] = [
+      entry for entry in _snapshot['worktrees']
+      if entry['locked'] or not (entry['prunable'] or not Path(entry['path']).exists())
+    ]
   return success
 
 
+def prune_stale_worktrees() -> bool:
+  """
+  목록에 있지만 실제 경로가 없는 worktree가 있을 때만 정리 (git worktree prune)
+
+  정리할 항목이 없으면 git을 실행하지 않습니다.
+
+  Returns:
+      bool: prune을 실행했으면 True
+  """
+  stale = [
+    entry['path'] for entry in get_worktree_entries() or []
+    if not entry['locked'] and (entry['prunable'] or not Path(entry['path']).exists())
+  ]
+  if not stale:
+    return False
+
+  for path in stale:
+    print_warning(f"Worktree 경로가 존재하지 않아 정리합니다: {path}")
+  prune_worktrees()
+  return True
+
+
 def is_worktree_exists(worktree_path: Path) -> bool:
   """
   특정 경로에 worktree가 이미 존재하는지 확인
 
-  Git worktree 목록과 실제 디렉토리 존재 여부를 모두 확인합니다.
-  prunable 상태의 worktree는 자동으로 정리합니다.
+  Git worktree 목록(스냅샷)과 실제 디렉토리 존재 여부를 모두 확인합니다.
+  목록에는 있지만 디렉토리가 없는 worktree가 있을 때만 정리(prune)합니다.
 
   Args:
       worktree_path: 확인할 worktree 경로
@@ -388,22 +806,15 @@ def is_worktree_exists(worktree_path: Path) -> bool:
   Returns:
       bool: worktree가 유효하게 존재하면 True
   """
-  # 먼저 prunable worktree 정리
-  prune_worktrees()
-
-  worktrees = get_worktree_list()
   worktree_path_resolved = worktree_path.resolve()
 
-  for path in worktrees.keys():
-    if Path(path).resolve() == worktree_path_resolved:
+  for entry in get_worktree_entries() or []:
+    if Path(entry['path']).resolve() == worktree_path_resolved:
       # Git 목록에 있으면 실제 디렉토리도 존재하는지 확인
-      if Path(path).exists():
+      if Path(entry['path']).exists():
         return True
-      else:
-        # 디렉토리가 없으면 다시 prune 실행
-        print_warning(f"Worktree 경로가 존재하지 않아 정리합니다: {path}")
-        prune_worktrees()
-        return False
+      prune_stale_worktrees()
+      return False
 
   # 디렉토리만 존재하고 Git에 등록되지 않은 경우도 확인
   if worktree_path_resolved.exists():
@@ -416,13 +827,45 @@ def is_worktree_exists(worktree_path: Path) -> bool:
   return False
 
 
-def create_worktree(branch_name: str, worktree_path: Path) -> Dict:
+def add_worktree(branch_name: str, worktree_path: Path, sparse_paths: Optional[List[str]] = None) -> Tuple[bool, str]:
+  """
+  git worktree add 실행 (스냅샷은 건드리지 않으므로 여러 스레드에서 동시에 호출 가능)
+
+  sparse_paths가 있으면 파일 없이 worktree를 만든 뒤 cone 모드 sparse-checkout을 설정하고
+  지정한 폴더(+ 루트 파일)만 체크아웃합니다.
+
+  Args:
+      branch_name: 체크아웃할 브랜치명
+      worktree_path: worktree를 생성할 경로
+      sparse_paths: 체크아웃할 폴더 목록 (없으면 전체)
+
+  Returns:
+      Tuple[bool, str]: (성공 여부, stderr)
+  """
+  if not sparse_paths:
+    success, _, stderr = run_git_command(['worktree', 'add', str(worktree_path), branch_name], check=False)
+    return success, stderr
+
+  steps = [
+    ['worktree', 'add', '--no-checkout', str(worktree_path), branch_name],
+    ['-C', str(worktree_path), 'sparse-checkout', 'set', '--cone'] + sparse_paths,
+    ['-C', str(worktree_path), 'read-tree', '-mu', 'HEAD'],
+  ]
+  for step in steps:
+    success, _, stderr = run_git_command(step, check=False)
+    if not success:
+      return False, stderr
+  return True, ''
+
+
+def create_worktree(branch_name: str, worktree_path: Path, sparse_paths: Optional[List[str]] = None) -> Dict:
   """
   Git worktree 생성
 
   Args:
       branch_name: 체크아웃할 브랜치명
       worktree_path: worktree를 생성할 경로
+      sparse_paths: sparse-checkout으로 체크아웃할 폴더 목록 (없으면 전체)
 
   Returns:
       Dict: {
@@ -432,7 +875,7 @@ def create_worktree(branch_name: str, worktree_path: Path) -> Dict:
           'is_existing': bool
       }
   """
-  # 이미 존재하는지 확인
+  # 이미 존재하는지 확인 (스냅샷을 읽으므로 호출하는 쪽에서 먼저 확인했어도 git을 다시 실행하지 않음)
   if is_worktree_exists(worktree_path):
     return {
       'success': True,
@@ -441,11 +884,12 @@ def create_worktree(branch_name: str, worktree_path: Path) -> Dict:
       'is_existing': True
     }
 
+  # 경로가 사라진 worktree가 같은 브랜치를 잡고 있으면 worktree add가 실패하므로 필요할 때만 정리
+  prune_stale_worktrees()
+
   # worktree 생성
-  success, stdout, stderr = run_git_command(
-    ['worktree', 'add', str(worktree_path), branch_name],
-    check=False
-  )
+  success, stderr = add_worktree(branch_name, worktree_path, sparse_paths)
+  invalidate_snapshot('worktrees')
 
   if success:
     return {
@@ -485,15 +929,10 @@ def normalize_branch_name(branch_name: str) -> str:
       "20260120_163_Github_Projects"
   """
   # 특수문자를 _ 로 변환
-  normalized = re.sub(SPECIAL_CHARS_PATTERN, '_', branch_name)
-
-  # 연속된 _를 하나로 통합
-  normalized = re.sub(r'_+', '_', normalized)
+  normalized = branch_name.translate({ord(c): '_' for c in SPECIAL_CHARS})
 
-  # 앞뒤 _를 제거
-  normalized = normalized.strip('_')
-
-  return normalized
+  # 연속된 _를 하나로 통합하고 앞뒤 _를 제거 (re를 로드하지 않도록 split/join 사용)
+  return '_'.join(part for part in normalized.split('_') if part)
 
 
 def get_worktree_root() -> Path:
@@ -561,96 +1000,1569 @@ def ensure_directory(path: Path) -> bool:
 
 
 # ===================================================================
-# 메인 워크플로우
+# sparse-checkout 프로필
 # ===================================================================
 
-def main() -> int:
+def load_sparse_profiles() -> Dict[str, Dict]:
   """
-  메인 워크플로우
+  sparse-checkout 프로필 프리셋 읽기 (worktree_profiles.json)
 
   Returns:
-      int: Exit code (0: 성공, 1: 실패)
+      Dict[str, Dict]: {프로필명: {'description': str, 'paths': [폴더, ...]}}, 파일이 없으면 빈 dict
   """
-  print_header()
+  import json
 
-  # 1. 브랜치명 받기 (Windows 환경 대응)
-  branch_name = get_branch_name()
+  try:
+    with open(PROFILES_FILE, 'r', encoding='utf-8') as f:
+      return json.load(f).get('profiles', {})
+  except FileNotFoundError:
+    return {}
+  except (OSError, ValueError) as e:
+    print_warning(f"프로필 파일을 읽을 수 없습니다 ({PROFILES_FILE.name}): {e}")
+    return {}
 
-  if not branch_name:
-    print_error("브랜치명이 제공되지 않았습니다.")
-    print()
-    print("사용법:")
-    if IS_WINDOWS:
-      print("  Windows 환경:")
-      print("    방법 1: 환경 변수 사용")
-      print(f'      $env:GIT_BRANCH_NAME = "브랜치명"')
-      print(f"      python {sys.argv[0]}")
-      print()
-      print("    방법 2: 파일 사용")
-      print(f'      $env:BRANCH_NAME_FILE = "branch_name.txt"')
-      print(f"      python {sys.argv[0]}")
-      print()
-      print("    방법 3: 인자로 전달 (한글 깨짐 가능)")
-      print(f'      python {sys.argv[0]} "브랜치명"')
-    else:
-      print(f"  python {sys.argv[0]} <branch_name>")
-    print()
-    print("예시:")
-    print(f'  python {sys.argv[0]} "20260120_#163_Github_Projects_에_대한_템플릿_개발_필요"')
-    return 1
 
-  print_step("📋", f"입력된 브랜치: {branch_name}")
+def resolve_sparse_paths(profile_names: Optional[List[str]]) -> Tuple[Optional[List[str]], Optional[str]]:
+  """
+  프로필명들을 체크아웃할 폴더 목록으로 변환 (여러 프로필이면 합집합)
 
-  # 2. Git 저장소 확인
-  if not is_git_repository():
-    print_error("현재 디렉토리가 Git 저장소가 아닙니다.")
-    return 1
+  Args:
+      profile_names: --profile로 받은 프로필명 목록
 
-  # 2-1. Windows 긴 경로 지원 확인 및 활성화
-  if IS_WINDOWS:
-    check_and_enable_longpaths()
-    print()
+  Returns:
+      Tuple[Optional[List[str]], Optional[str]]: (폴더 목록 또는 None(전체 체크아웃), 에러 메시지)
+  """
+  if not profile_names:
+    return None, None
+
+  profiles = load_sparse_profiles()
+  unknown = [name for name in profile_names if name not in profiles]
+  if unknown:
+    available = ', '.join(sorted(profiles)) or '없음'
+    return None, f"알 수 없는 프로필: {', '.join(unknown)} (사용 가능: {available})"
+
+  paths = []
+  for name in profile_names:
+    for folder in profiles[name].get('paths', []):
+      folder = folder.strip('/')
+      if folder and folder not in paths:
+        paths.append(folder)
+  if not paths:
+    return None, f"프로필에 체크아웃할 폴더가 없습니다: {', '.join(profile_names)}"
+  return paths, None
+
+
+def enable_worktree_config() -> bool:
+  """
+  worktree별 설정(extensions.worktreeConfig) 활성화
 
-  # 3. 브랜치명 정규화
-  folder_name = normalize_branch_name(branch_name)
-  print_step("📁", f"폴더명: {folder_name}")
-  print()
+  sparse-checkout은 처음 설정할 때 공용 config에 이 값을 쓰므로, 여러 worktree를 병렬로
+  만들기 전에 한 번 켜 두면 config 잠금 충돌이 나지 않습니다.
+  저장소 config를 바꾸는 것이므로 새로 켤 때는 안내 메시지를 출력합니다.
+  """
+  success, stdout, _ = run_git_command(['config', '--bool', 'extensions.worktreeConfig'], check=False)
+  if success and stdout == 'true':
+    return True
+  success, _, stderr = run_git_command(['config', 'extensions.worktreeConfig', 'true'], check=False)
+  if success:
+    print_info("저장소 config에 extensions.worktreeConfig=true를 설정했습니다 "
+               "(되돌리기: git config --unset extensions.worktreeConfig)")
+  else:
+    print_warning(f"extensions.worktreeConfig 설정 실패: {stderr}")
+  return success
 
-  # 4. 브랜치 존재 확인 (로컬 → 리모트 순서)
-  print_step("🔍", "브랜치 확인 중...")
 
-  if branch_exists(branch_name):
-    print_success("로컬 브랜치가 이미 존재합니다.")
-  else:
-    print_warning("로컬 브랜치가 존재하지 않습니다.")
+# ===================================================================
+# 빌드 캐시 시딩 (--seed-cache)
+# ===================================================================
 
-    # 리모트에서 최신 정보 가져오기
-    fetch_remote()
+_FICLONE = 0x40049409  # linux/fs.h: ioctl(dst, FICLONE, src)
+_LINK_UNSUPPORTED_ERRNOS = {
+  errno.EXDEV, errno.EINVAL, errno.ENOTTY, errno.ENOSYS, errno.EPERM,
+  getattr(errno, 'EOPNOTSUPP', errno.EINVAL), getattr(errno, 'ENOTSUP', errno.EINVAL),
+}
 
-    if remote_branch_exists(branch_name):
-      # 리모트에 브랜치가 있으면 tracking 브랜치로 생성
-      print_step("🌐", f"리모트(origin/{branch_name})에서 브랜치를 가져옵니다...")
 
-      if not create_branch_from_remote(branch_name):
-        print_error("리모트 브랜치 기반 로컬 브랜치 생성에 실패했습니다.")
-        return 1
+def reflink_file(source: str, destination: str):
+  """
+  copy-on-write 복제 (Linux FICLONE: btrfs/xfs, macOS clonefile: APFS)
 
-      print_success(f"리모트 브랜치(origin/{branch_name})를 기반으로 로컬 브랜치 생성 완료!")
-    else:
-      # 리모트에도 없으면 현재 브랜치에서 새로 생성
-      current_branch = get_current_branch()
-      if current_branch:
-        print_step("🔄", f"현재 브랜치({current_branch})에서 새 브랜치 생성 중...")
-      else:
-        print_step("🔄", "새 브랜치 생성 중...")
+  Raises:
+      OSError: 파일시스템이나 OS가 지원하지 않을 때
+  """
+  if sys.platform == 'darwin':
+    import ctypes
+    libc = ctypes.CDLL(None, use_errno=True)
+    if libc.clonefile(os.fsencode(source), os.fsencode(destination), 0) != 0:
+      err = ctypes.get_errno()
+      raise OSError(err, os.strerror(err), source)
+    return
 
-      if not create_branch(branch_name):
-        print_error("브랜치 생성에 실패했습니다.")
-        return 1
+  try:
+    import fcntl
+  except ImportError:
+    raise OSError(errno.ENOSYS, 'reflink 미지원 플랫폼', source)
+  with open(source, 'rb') as src, open(destination, 'wb') as dst:
+    fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
 
-      print_success("새 브랜치 생성 완료!")
 
-  print()
+def seed_file(source: str, destination: str, mode: str, supported: Dict[str, bool]) -> str:
+  """
+  파일 하나를 reflink → (hardlink) → 복사 순서로 시도
+
+  한 번 지원하지 않는다고 확인된 방식은 supported에 기록해 나머지 파일에서는 건너뜁니다.
+
+  Args:
+      mode: 'auto' (reflink → 복사), 'hardlink' (reflink → hardlink → 복사), 'copy'
+      supported: {'reflink': bool, 'hardlink': bool} (여러 스레드가 공유)
+
+  Returns:
+      str: 사용한 방식 ('reflink', 'hardlink', 'copy')
+  """
+  import shutil
+
+  if mode != 'copy' and supported.get('reflink', True):
+    try:
+      reflink_file(source, destination)
+      shutil.copystat(source, destination)
+      return 'reflink'
+    except OSError as e:
+      if e.errno in _LINK_UNSUPPORTED_ERRNOS:
+        supported['reflink'] = False
+      if os.path.lexists(destination):
+        os.unlink(destination)
+
+  if mode == 'hardlink' and supported.get('hardlink', True):
+    try:
+      os.link(source, destination)
+      return 'hardlink'
+    except OSError as e:
+      if e.errno in _LINK_UNSUPPORTED_ERRNOS:
+        supported['hardlink'] = False
+
+  shutil.copy2(source, destination)
+  return 'copy'
+
+
+def collect_seed_files(source_root: Path, target_root: Path,
+                       rel_paths: List[str]) -> Tuple[List[str], List[Tuple[str, str, int]], List[str]]:
+  """
+  복제할 캐시 경로를 os.scandir로 순회해 만들 디렉토리/파일/심볼릭 링크 목록 작성
+
+  대상 worktree에 이미 있는 경로는 건너뜁니다.
+
+  Returns:
+      Tuple: (시딩할 상대 경로 목록, [(원본, 대상, 크기), ...], 만들 디렉토리 목록)
+  """
+  seeded, files, directories = [], [], []
+
+  for rel in rel_paths:
+    source = source_root / rel
+    target = target_root / rel
+    if not os.path.lexists(source) or os.path.lexists(target):
+      continue
+    seeded.append(rel)
+
+    if not source.is_dir() or source.is_symlink():
+      files.append((str(source), str(target), source.lstat().st_size))
+      directories.append(str(target.parent))
+      continue
+
+    stack = [(str(source), str(target))]
+    while stack:
+      src_dir, dst_dir = stack.pop()
+      directories.append(dst_dir)
+      with os.scandir(src_dir) as it:
+        for entry in it:
+          dst = os.path.join(dst_dir, entry.name)
+          if entry.is_dir(follow_symlinks=False):
+            stack.append((entry.path, dst))
+          else:
+            files.append((entry.path, dst, entry.stat(follow_symlinks=False).st_size))
+
+  return seeded, files, directories
+
+
+def seed_build_cache(source_root: Path, target_root: Path, mode: str = 'auto',
+                     sparse_paths: Optional[List[str]] = None) -> Dict:
+  """
+  원본 체크아웃의 빌드 캐시를 새 worktree로 복제
+
+  sparse-checkout 프로필을 쓰는 worktree에는 체크아웃하지 않은 플랫폼 폴더의 캐시를 만들지 않습니다.
+
+  Args:
+      source_root: 캐시를 가져올 체크아웃 (메인 또는 다른 worktree)
+      target_root: 새 worktree 경로
+      mode: 'auto', 'hardlink', 'copy' (seed_file 참고)
+      sparse_paths: sparse-checkout 폴더 목록
+
+  Returns:
+      Dict: {'paths': [...], 'files': int, 'bytes': {'reflink': int, 'hardlink': int, 'copy': int},
+             'copy_seconds': float, 'elapsed': float}
+  """
+  from concurrent.futures import ThreadPoolExecutor
+
+  start = time.perf_counter()
+  rel_paths = [
+    rel for rel in SEED_CACHE_PATHS
+    if not sparse_paths or '/' not in rel or rel.split('/', 1)[0] in sparse_paths
+  ]
+  seeded, files, directories = collect_seed_files(source_root, target_root, rel_paths)
+
+  for directory in directories:
+    os.makedirs(directory, exist_ok=True)
+
+  supported = {}
+
+  def seed_one(item: Tuple[str, str, int]) -> Tuple[str, int, float]:
+    source, destination, size = item
+    if os.path.islink(source):
+      os.symlink(os.readlink(source), destination)
+      return 'copy', 0, 0.0
+    file_start = time.perf_counter()
+    method = seed_file(source, destination, mode, supported)
+    return method, size, time.perf_counter() - file_start
+
+  totals = {'reflink': 0, 'hardlink': 0, 'copy': 0}
+  copy_seconds = 0.0
+  with ThreadPoolExecutor(max_workers=SEED_JOBS) as pool:
+    for method, size, seconds in pool.map(seed_one, files):
+      totals[method] += size
+      if method == 'copy':
+        copy_seconds += seconds
+
+  return {
+    'paths': seeded,
+    'files': len(files),
+    'bytes': totals,
+    'copy_seconds': copy_seconds,
+    'elapsed': time.perf_counter() - start,
+  }
+
+
+def resolve_seed_source(seed_from: Optional[str]) -> Optional[Path]:
+  """
+  빌드 캐시 원본 체크아웃 찾기
+
+  Args:
+      seed_from: 경로 또는 브랜치명 (없으면 메인 worktree)
+
+  Returns:
+      Optional[Path]: 원본 경로, 찾지 못하면 None
+  """
+  entries = get_worktree_entries() or []
+  if not seed_from:
+    return Path(entries[0]['path']) if entries else get_git_root()
+
+  if Path(seed_from).is_dir():
+    return Path(seed_from)
+  for entry in entries:
+    if entry['branch'] == seed_from:
+      return Path(entry['path'])
+  return None
+
+
+def format_bytes(size: float) -> str:
+  """바이트 수를 읽기 쉬운 단위로 변환"""
+  for unit in ('B', 'KB', 'MB', 'GB'):
+    if size < 1024 or unit == 'GB':
+      return f"{size:.0f}{unit}" if unit == 'B' else f"{size:.1f}{unit}"
+    size /= 1024
+
+
+def merge_seed_reports(reports: List[Dict]) -> Dict:
+  """여러 worktree의 시딩 결과 합산 (일괄 생성용)"""
+  total = {'paths': [], 'files': 0, 'bytes': {'reflink': 0, 'hardlink': 0, 'copy': 0},
+           'copy_seconds': 0.0, 'elapsed': 0.0}
+  for report in reports:
+    total['paths'].extend(p for p in report['paths'] if p not in total['paths'])
+    total['files'] += report['files']
+    for method, size in report['bytes'].items():
+      total['bytes'][method] += size
+    total['copy_seconds'] += report['copy_seconds']
+    total['elapsed'] += report['elapsed']
+  return total
+
+
+def print_seed_report(report: Dict):
+  """빌드 캐시 시딩 결과 출력 (방식별 바이트, 소요 시간, 복사 대비 절약 시간 추정)"""
+  if not report['paths']:
+    print_info("복제할 빌드 캐시가 없습니다 (원본에 없거나 이미 존재).")
+    return
+
+  sizes = report['bytes']
+  print_success(f"빌드 캐시 시딩 완료: {', '.join(report['paths'])} (파일 {report['files']:,}개)")
+  print(f"   reflink {format_bytes(sizes['reflink'])} · hardlink {format_bytes(sizes['hardlink'])} · "
+        f"복사 {format_bytes(sizes['copy'])} · {report['elapsed']:.2f}초")
+
+  # 같은 실행에서 잰 복사 속도로, 링크한 바이트를 전부 복사했을 때의 시간을 추정
+  linked = sizes['reflink'] + sizes['hardlink']
+  if linked and sizes['copy'] and report['copy_seconds'] > 0:
+    saved = linked / (sizes['copy'] / report['copy_seconds'])
+    print(f"   링크로 전체 복사 대비 약 {saved:.1f}초 절약 (추정)")
+
+
+# ===================================================================
+# 일괄 생성 (--batch)
+# ===================================================================
+
+DEFAULT_BATCH_JOBS = 4
+
+
+def read_branch_list(source: str) -> List[str]:
+  """
+  일괄 생성할 브랜치 목록 읽기 (한 줄에 하나, 빈 줄 무시, 중복 제거)
+
+  Args:
+      source: 파일 경로 또는 '-' (stdin)
+
+  Returns:
+      List[str]: 입력 순서를 유지한 브랜치명 리스트
+  """
+  if source == '-':
+    text = sys.stdin.read()
+  else:
+    with open(source, 'r', encoding='utf-8-sig') as f:
+      text = f.read()
+
+  branches = []
+  for line in text.splitlines():
+    name = line.strip()
+    if name and name not in branches:
+      branches.append(name)
+  return branches
+
+
+def resolve_batch_branches(branches: List[str], worktree_root: Path, depth: Optional[int] = None,
+                           remote_ttl: int = REMOTE_CACHE_TTL) -> List[Dict]:
+  """
+  브랜치별 worktree 경로와 브랜치 출처(local/remote/new) 결정
+
+  로컬 존재 여부는 ref 스냅샷 한 번으로 확인하고, 로컬에 없는 브랜치들은 리모트 조회와
+  fetch를 한 번씩만 실행합니다(리모트에 있는 브랜치만). 필요한 브랜치는 여기서 순서대로 생성합니다.
+
+  Returns:
+      List[Dict]: [{'branch', 'path', 'source', 'status', 'message'}, ...]
+                  status: 'pending'(생성 대상) | 'existing' | 'failed'
+  """
+  results = []
+  folders: Dict[str, str] = {}
+
+  for branch_name in branches:
+    path = worktree_root / normalize_branch_name(branch_name)
+    result = {'branch': branch_name, 'path': str(path), 'source': '-', 'status': 'pending', 'message': ''}
+    results.append(result)
+
+    # 정규화 후 같은 폴더명이 되는 브랜치는 함께 만들 수 없음 (예: a/b, a#b)
+    other = folders.setdefault(path.name, branch_name)
+    if other != branch_name:
+      result.update(status='failed', message=f'폴더명이 {other}와 겹칩니다')
+    elif is_worktree_exists(path):
+      result.update(status='existing', message='이미 존재')
+
+  pending = [r for r in results if r['status'] == 'pending']
+  for result in pending:
+    if branch_exists(result['branch']):
+      result['source'] = 'local'
+
+  missing = [r for r in pending if r['source'] == '-']
+  if missing:
+    # 리모트 존재 여부를 모두 정한 뒤에 생성 (생성할 때마다 ref 스냅샷이 무효화되므로)
+    states = sync_remote_branches([r['branch'] for r in missing], depth=depth, ttl=remote_ttl)
+    for result in missing:
+      state = states[result['branch']]
+      result['source'] = 'new' if state == 'new' else 'remote'
+      if state == 'fetch_failed':
+        result.update(status='failed', message='리모트 브랜치 fetch 실패')
+
+  for result in missing:
+    if result['status'] == 'failed':
+      continue
+    if result['source'] == 'remote':
+      created = create_branch_from_remote(result['branch'])
+    else:
+      created = create_branch(result['branch'])
+    if not created:
+      result.update(status='failed', message='브랜치 생성 실패')
+
+  return results
+
+
+def display_width(text: str) -> int:
+  """터미널 표시 폭 (한글 등 전각 문자는 2칸)"""
+  import unicodedata
+  return sum(2 if unicodedata.east_asian_width(c) in ('W', 'F') else 1 for c in text)
+
+
+def pad(text: str, width: int) -> str:
+  """표시 폭 기준으로 오른쪽을 공백으로 채움"""
+  return text + ' ' * max(0, width - display_width(text))
+
+
+def print_batch_table(results: List[Dict]):
+  """브랜치별 결과 표 출력"""
+  labels = {'created': '생성', 'existing': '존재', 'failed': '실패'}
+  width = max(display_width('브랜치'), *(display_width(r['branch']) for r in results))
+
+  print(f"{pad('브랜치', width)}  {pad('출처', 6)}  {pad('결과', 4)}  경로 / 메시지")
+  print("─" * (width + 40))
+  for r in results:
+    detail = r['path'] if r['status'] != 'failed' else r['message']
+    print(f"{pad(r['branch'], width)}  {pad(r['source'], 6)}  {pad(labels[r['status']], 4)}  {detail}")
+
+
+def run_batch(source: str, jobs: int = DEFAULT_BATCH_JOBS, depth: Optional[int] = None,
+              remote_ttl: int = REMOTE_CACHE_TTL, sparse_paths: Optional[List[str]] = None,
+              seed_source: Optional[Path] = None, seed_mode: str = 'auto', report: Optional[Dict] = None) -> int:
+  """
+  여러 브랜치의 worktree를 한 번에 생성
+
+  fetch와 ref 조회는 한 번만 하고, git worktree add는 최대 jobs개까지 병렬로 실행합니다.
+
+  Args:
+      source: 브랜치 목록 파일 경로 또는 '-' (stdin)
+      jobs: 동시에 실행할 worktree add 수
+      depth: 리모트 브랜치를 얕게 fetch할 깊이
+      remote_ttl: 리모트 브랜치 캐시 유효 시간 (초, 0이면 캐시 사용 안 함)
+      sparse_paths: sparse-checkout으로 체크아웃할 폴더 목록 (없으면 전체)
+      seed_source: 빌드 캐시를 복제할 원본 체크아웃 (없으면 시딩 안 함)
+      seed_mode: 빌드 캐시 복제 방식 ('auto', 'hardlink', 'copy')
+      report: --json 결과 문서 (브랜치별 결과를 'results'에 기록)
+
+  Returns:
+      int: Exit code (0: 모두 성공 또는 이미 존재, 1: 하나라도 실패)
+  """
+  try:
+    branches = read_branch_list(source)
+  except OSError as e:
+    print_error(f"브랜치 목록을 읽을 수 없습니다: {e}")
+    return 1
+
+  if not branches:
+    print_error("브랜치 목록이 비어 있습니다.")
+    return 1
+
+  print_step("📋", f"일괄 생성 대상: {len(branches)}개 브랜치")
+
+  if not is_git_repository():
+    print_error("현재 디렉토리가 Git 저장소가 아닙니다.")
+    return 1
+
+  if IS_WINDOWS:
+    check_and_enable_longpaths()
+
+  try:
+    worktree_root = get_worktree_root()
+  except RuntimeError as e:
+    print_error(str(e))
+    return 1
+
+  print_step("🔍", "브랜치 확인 중...")
+  results = resolve_batch_branches(branches, worktree_root, depth, remote_ttl)
+  pending = [r for r in results if r['status'] == 'pending']
+  seed_reports = []
+
+  if pending:
+    from concurrent.futures import ThreadPoolExecutor
+
+    if not ensure_directory(worktree_root):
+      return 1
+    prune_stale_worktrees()
+    if sparse_paths:
+      enable_worktree_config()
+
+    def create_one(result: Dict) -> Tuple[bool, str, Optional[Dict]]:
+      success, stderr = add_worktree(result['branch'], Path(result['path']), sparse_paths)
+      if not success or not seed_source:
+        return success, stderr, None
+      return success, stderr, seed_build_cache(seed_source, Path(result['path']), seed_mode, sparse_paths)
+
+    print_step("🔄", f"Worktree {len(pending)}개 생성 중 (동시 {max(1, jobs)}개)...")
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+      outcomes = pool.map(create_one, pending)
+      for result, (success, stderr, seed_report) in zip(pending, outcomes):
+        if success:
+          result['status'] = 'created'
+        else:
+          result.update(status='failed', message=f'Worktree 생성 실패: {stderr}')
+        if seed_report:
+          seed_reports.append(seed_report)
+    invalidate_snapshot('worktrees')
+
+    if seed_reports:
+      print_seed_report(merge_seed_reports(seed_reports))
+
+  if report is not None:
+    report['results'] = [
+      {
+        'branch': r['branch'],
+        'path': r['path'],
+        'is_existing': r['status'] == 'existing',
+        'source': r['source'] if r['source'] != '-' else ('local' if r['status'] == 'existing' else None),
+        'status': r['status'],
+        'message': r.get('message') or None,
+      }
+      for r in results
+    ]
+    if seed_reports:
+      report['seed'] = merge_seed_reports(seed_reports)
+
+  print()
+  print_batch_table(results)
+  print()
+
+  failed = sum(1 for r in results if r['status'] == 'failed')
+  created = sum(1 for r in results if r['status'] == 'created')
+  existing = sum(1 for r in results if r['status'] == 'existing')
+  summary = f"생성 {created}개, 이미 존재 {existing}개, 실패 {failed}개"
+  if failed:
+    print_error(summary)
+    return 1
+  print_success(summary)
+  return 0
+
+
+# ===================================================================
+# 목록 / 상태 / 정리 (list, status, gc)
+# ===================================================================
+
+COMMANDS = ('list', 'status', 'gc', 'daemon', 'bench')
+DEFAULT_INVENTORY_JOBS = 8
+
+
+def get_default_base_branch() -> str:
+  """병합 여부를 판단할 기준 브랜치 (origin/HEAD → main/master → 메인 worktree 브랜치)"""
+  success, stdout, _ = run_git_command(['symbolic-ref', '--short', 'refs/remotes/origin/HEAD'], check=False)
+  if success and stdout:
+    return stdout
+
+  local = get_refs()['local']
+  for name in ('main', 'master'):
+    if name in local:
+      return name
+  entries = get_worktree_entries() or []
+  return entries[0]['branch'] if entries and entries[0]['branch'] else 'HEAD'
+
+
+def get_branch_states(base: str) -> Dict[str, Dict]:
+  """
+  로컬 브랜치별 최근 커밋 시각, upstream 삭제 여부, 기준 브랜치 병합 여부 (git 3회)
+
+  기준 브랜치와 같은 커밋을 가리키는 브랜치(막 만든 브랜치)는 병합된 것으로 보지 않습니다.
+
+  Returns:
+      Dict[str, Dict]: {브랜치명: {'committed_at': int, 'gone': bool, 'merged': bool}}
+  """
+  states = {}
+  success, stdout, _ = run_git_command(
+    ['for-each-ref', '--format=%(refname)%09%(objectname)%09%(upstream:track)%09%(committerdate:unix)', 'refs/heads'],
+    check=False
+  )
+  tips = {}
+  if success:
+    for line in stdout.split('\n'):
+      parts = line.split('\t')
+      if len(parts) == 4 and parts[0].startswith('refs/heads/'):
+        name = parts[0][len('refs/heads/'):]
+        tips[name] = parts[1]
+        states[name] = {
+          'committed_at': int(parts[3] or 0),
+          'gone': parts[2] == '[gone]',
+          'merged': False,
+        }
+
+  _, base_tip, _ = run_git_command(['rev-parse', '--verify', '--quiet', f'{base}^{{commit}}'], check=False)
+
+  success, stdout, _ = run_git_command(['for-each-ref', f'--merged={base}', '--format=%(refname)', 'refs/heads'],
+                                       check=False)
+  if success:
+    for ref in stdout.split('\n'):
+      name = ref[len('refs/heads/'):]
+      if name in states and tips[name] != base_tip:
+        states[name]['merged'] = True
+  return states
+
+
+def scan_directory_size(path: str) -> int:
+  """
+  디렉토리 디스크 사용량 (os.scandir 순회, 심볼릭 링크는 따라가지 않음)
+
+  Returns:
+      int: 바이트 수 (st_blocks가 있으면 실제 할당 크기)
+  """
+  total = 0
+  stack = [path]
+  while stack:
+    try:
+      it = os.scandir(stack.pop())
+    except OSError:
+      continue
+    with it:
+      for entry in it:
+        try:
+          if entry.is_dir(follow_symlinks=False):
+            stack.append(entry.path)
+          else:
+            st = entry.stat(follow_symlinks=False)
+            total += st.st_blocks * 512 if hasattr(st, 'st_blocks') else st.st_size
+        except OSError:
+          continue
+  return total
+
+
+def count_worktree_changes(path: str) -> Optional[int]:
+  """커밋하지 않은 변경 파일 수 (git status --porcelain), 확인할 수 없으면 None"""
+  success, stdout, _ = run_git_command(['-C', path, 'status', '--porcelain'], check=False)
+  if not success:
+    return None
+  return len([line for line in stdout.split('\n') if line])
+
+
+def collect_worktree_inventory(base: str, with_size: bool = True, with_changes: bool = False,
+                               jobs: int = DEFAULT_INVENTORY_JOBS) -> List[Dict]:
+  """
+  모든 worktree의 상태 수집 (크기 계산과 git status는 worktree별로 병렬 실행)
+
+  Returns:
+      List[Dict]: [{'path', 'branch', 'is_main', 'is_current', 'locked', 'prunable', 'managed',
+                    'committed_at', 'merged', 'gone', 'size', 'changes'}, ...]
+  """
+  from concurrent.futures import ThreadPoolExecutor
+
+  entries = get_worktree_entries() or []
+  if not entries:
+    return []
+
+  states = get_branch_states(base)
+  current = get_current_worktree()
+  main_path = Path(entries[0]['path'])
+  managed_root = main_path.parent / f"{main_path.name}-Worktree"
+
+  items = []
+  for index, entry in enumerate(entries):
+    path = Path(entry['path'])
+    state = states.get(entry['branch'] or '', {})
+    items.append({
+      'path': entry['path'],
+      'branch': entry['branch'],
+      'is_main': index == 0,
+      'is_current': current is not None and current['path'] == entry['path'],
+      'locked': entry['locked'],
+      'prunable': entry['prunable'] or not path.exists(),
+      'managed': managed_root in path.parents,
+      'committed_at': state.get('committed_at'),
+      'merged': state.get('merged', False),
+      'gone': state.get('gone', False),
+      'size': None,
+      'changes': None,
+    })
+
+  def inspect(item: Dict):
+    if item['prunable']:
+      return
+    if with_size:
+      item['size'] = scan_directory_size(item['path'])
+    if with_changes:
+      item['changes'] = count_worktree_changes(item['path'])
+
+  with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+    list(pool.map(inspect, items))
+  return items
+
+
+def format_age(timestamp: Optional[int]) -> str:
+  """커밋 시각을 '3일 전' 형태로 변환"""
+  if not timestamp:
+    return '-'
+  seconds = max(0, time.time() - timestamp)
+  for unit, label in ((86400, '일'), (3600, '시간'), (60, '분')):
+    if seconds >= unit:
+      return f"{int(seconds // unit)}{label} 전"
+  return '방금'
+
+
+def describe_merge_state(item: Dict) -> str:
+  """병합 여부 표시 (병합됨 / 리모트 삭제 / -)"""
+  if item['merged']:
+    return '병합됨'
+  if item['gone']:
+    return '리모트 삭제'
+  return '-'
+
+
+def print_table(headers: List[str], rows: List[List[str]]):
+  """표시 폭 기준으로 정렬한 표 출력 (마지막 열은 채우지 않음)"""
+  widths = [max(display_width(str(row[i])) for row in [headers] + rows) for i in range(len(headers) - 1)]
+  print('  '.join(pad(h, w) for h, w in zip(headers, widths)) + '  ' + headers[-1])
+  print('─' * (sum(widths) + 2 * len(widths) + 30))
+  for row in rows:
+    print('  '.join(pad(str(c), w) for c, w in zip(row, widths)) + '  ' + str(row[-1]))
+
+
+def inventory_rows(items: List[Dict], with_changes: bool) -> List[List[str]]:
+  """worktree 상태를 표 행으로 변환"""
+  rows = []
+  for item in items:
+    branch = item['branch'] or '(detached)'
+    if item['is_main']:
+      branch += ' [메인]'
+    elif item['is_current']:
+      branch += ' [현재]'
+    if item['prunable']:
+      size = '경로 없음'
+    else:
+      size = format_bytes(item['size']) if item['size'] is not None else '-'
+    row = [branch, format_age(item['committed_at']), describe_merge_state(item), size]
+    if with_changes:
+      row.append('-' if item['changes'] is None else str(item['changes']))
+    rows.append(row + [item['path']])
+  return rows
+
+
+def run_inventory(with_changes: bool, base: Optional[str], with_size: bool, jobs: int) -> int:
+  """
+  list / status 명령 실행
+
+  Args:
+      with_changes: 커밋하지 않은 변경 파일 수도 표시 (status)
+      base: 병합 여부 기준 브랜치 (없으면 자동)
+      with_size: 디스크 사용량 계산 여부
+      jobs: 동시에 검사할 worktree 수
+
+  Returns:
+      int: Exit code
+  """
+  if not is_git_repository():
+    print_error("현재 디렉토리가 Git 저장소가 아닙니다.")
+    return 1
+
+  base = base or get_default_base_branch()
+  start = time.perf_counter()
+  items = collect_worktree_inventory(base, with_size, with_changes, jobs)
+
+  headers = ['브랜치', '최근 커밋', f'병합({base})', '크기']
+  if with_changes:
+    headers.append('변경')
+  headers.append('경로')
+  print_table(headers, inventory_rows(items, with_changes))
+  print()
+
+  summary = f"worktree {len(items)}개"
+  if with_size:
+    summary += f", 전체 {format_bytes(sum(item['size'] or 0 for item in items))}"
+  print_info(f"{summary} ({time.perf_counter() - start:.2f}초)")
+  return 0
+
+
+def gc_reasons(item: Dict, older_than_days: Optional[int]) -> List[str]:
+  """정리 대상이 되는 사유 (비어 있으면 대상 아님)"""
+  reasons = []
+  if item['merged']:
+    reasons.append('병합됨')
+  if item['gone']:
+    reasons.append('리모트 삭제')
+  if older_than_days is not None and item['committed_at']:
+    age_days = (time.time() - item['committed_at']) / 86400
+    if age_days >= older_than_days:
+      reasons.append(f'{int(age_days)}일 경과')
+  return reasons
+
+
+def run_gc(base: Optional[str], older_than_days: Optional[int], dry_run: bool, jobs: int) -> int:
+  """
+  오래되었거나 병합된 worktree 일괄 삭제 (gc 명령)
+
+  {프로젝트명}-Worktree 아래의 worktree 중 기준 브랜치에 병합되었거나, upstream이 삭제되었거나,
+  마지막 커밋이 older_than_days일 이상 지난 것을 삭제합니다. 메인/현재/잠긴 worktree와
+  커밋하지 않은 변경이 있는 worktree는 건드리지 않습니다. 브랜치는 삭제하지 않습니다.
+
+  Returns:
+      int: Exit code (0: 성공, 1: 삭제 실패가 있음)
+  """
+  if not is_git_repository():
+    print_error("현재 디렉토리가 Git 저장소가 아닙니다.")
+    return 1
+
+  prune_stale_worktrees()
+  base = base or get_default_base_branch()
+  print_step("🔍", f"worktree 검사 중 (병합 기준: {base})...")
+  items = collect_worktree_inventory(base, with_size=True, with_changes=True, jobs=jobs)
+
+  candidates = []
+  for item in items:
+    if item['is_main'] or item['is_current'] or item['locked'] or item['prunable'] or not item['managed']:
+      continue
+    if not item['branch']:
+      continue
+    reasons = gc_reasons(item, older_than_days)
+    if not reasons:
+      continue
+    if item['changes'] != 0:
+      print_warning(f"커밋하지 않은 변경이 있어 건너뜀: {item['branch']}")
+      continue
+    item['reasons'] = reasons
+    candidates.append(item)
+
+  if not candidates:
+    print_success("정리할 worktree가 없습니다.")
+    return 0
+
+  rows = [[c['branch'], format_age(c['committed_at']), ', '.join(c['reasons']), format_bytes(c['size'] or 0), c['path']]
+          for c in candidates]
+  print_table(['브랜치', '최근 커밋', '사유', '크기', '경로'], rows)
+  print()
+
+  total_size = sum(c['size'] or 0 for c in candidates)
+  if dry_run:
+    print_info(f"삭제 대상 {len(candidates)}개, {format_bytes(total_size)} (--dry-run이므로 삭제하지 않음)")
+    return 0
+
+  from concurrent.futures import ThreadPoolExecutor
+
+  print_step("🗑️", f"worktree {len(candidates)}개 삭제 중...")
+  with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+    outcomes = list(pool.map(lambda c: run_git_command(['worktree', 'remove', c['path']], check=False), candidates))
+  invalidate_snapshot('worktrees')
+
+  freed = 0
+  failed = 0
+  for candidate, (success, _, stderr) in zip(candidates, outcomes):
+    if success:
+      freed += candidate['size'] or 0
+    else:
+      failed += 1
+      print_error(f"{candidate['branch']} 삭제 실패: {stderr}")
+
+  summary = f"삭제 {len(candidates) - failed}개, 실패 {failed}개, 확보 {format_bytes(freed)}"
+  if failed:
+    print_error(summary)
+    return 1
+  print_success(summary)
+  return 0
+
+
+def parse_command_args(argv: List[str]) -> 'argparse.Namespace':
+  """list / status / gc / daemon / bench 명령행 인자 파싱"""
+  import argparse
+
+  parser = argparse.ArgumentParser(prog='worktree_manager.py', description='worktree 목록/상태/정리')
+  commands = parser.add_subparsers(dest='command')
+
+  common = argparse.ArgumentParser(add_help=False)
+  common.add_argument('--base', help='병합 여부를 판단할 기준 브랜치 (기본: origin/HEAD)')
+  common.add_argument('--jobs', type=int, default=DEFAULT_INVENTORY_JOBS,
+                      help=f'동시에 검사할 worktree 수 (기본: {DEFAULT_INVENTORY_JOBS})')
+
+  list_parser = commands.add_parser('list', parents=[common], help='worktree 목록 (크기, 최근 커밋, 병합 여부)')
+  list_parser.add_argument('--no-size', action='store_true', help='디스크 사용량 계산 생략')
+  status_parser = commands.add_parser('status', parents=[common], help='목록 + 커밋하지 않은 변경 수')
+  status_parser.add_argument('--no-size', action='store_true', help='디스크 사용량 계산 생략')
+  gc_parser = commands.add_parser('gc', parents=[common], help='병합되었거나 오래된 worktree 일괄 삭제')
+  gc_parser.add_argument('--older-than', type=int, metavar='DAYS', help='마지막 커밋이 DAYS일 이상 지난 worktree도 삭제')
+  gc_parser.add_argument('--dry-run', action='store_true', help='삭제 대상만 출력')
+
+  daemon_parser = commands.add_parser('daemon', help='상주 데몬 (Unix 소켓) 시작/중지/상태')
+  daemon_parser.add_argument('action', choices=['start', 'stop', 'status', 'run'],
+                             help='start: 백그라운드 실행 / run: 포그라운드 실행 / stop / status')
+  daemon_parser.add_argument('--idle-timeout', type=int, default=DAEMON_IDLE_TIMEOUT, metavar='SECONDS',
+                             help=f'요청이 없으면 종료할 시간 (기본: {DAEMON_IDLE_TIMEOUT})')
+
+  bench_parser = commands.add_parser('bench', help='"이미 존재" 경로의 시작 시간 측정 (예산 초과 시 exit 1)')
+  bench_parser.add_argument('--branch', help='측정할 브랜치 (기본: worktree 폴더의 첫 worktree)')
+  bench_parser.add_argument('--runs', type=int, default=STARTUP_BENCH_RUNS, help=f'반복 횟수 (기본: {STARTUP_BENCH_RUNS})')
+  bench_parser.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS,
+                            help=f'인터프리터 기동을 뺀 스크립트 시간 예산 (기본: {STARTUP_BUDGET_MS:.0f}ms)')
+  return parser.parse_args(argv)
+
+
+def run_command(args: 'argparse.Namespace') -> int:
+  """list / status / gc / daemon / bench 명령 실행"""
+  if args.command == 'bench':
+    return run_startup_bench(args.branch, args.runs, args.budget_ms)
+  if args.command == 'daemon':
+    return run_daemon_command(args.action, args.idle_timeout)
+  if args.command == 'gc':
+    return run_gc(args.base, args.older_than, args.dry_run, args.jobs)
+  return run_inventory(args.command == 'status', args.base, not args.no_size, args.jobs)
+
+
+# ===================================================================
+# 데몬 모드 (daemon)
+# ===================================================================
+#
+# 데몬은 저장소 상태 스냅샷을 메모리에 유지한 채 Unix 소켓으로 요청을 받아 main()을 대신 실행합니다.
+# 요청마다 .git의 HEAD, packed-refs, refs/, worktrees/ 의 mtime을 비교해 바뀌었으면 스냅샷을 버리므로
+# 다른 곳에서 실행한 git 명령도 반영됩니다. 데몬이 없거나 응답하지 않으면 클라이언트는 직접 실행합니다.
+
+DAEMON_IDLE_TIMEOUT = 1800
+DAEMON_CONNECT_TIMEOUT = 1.0
+DAEMON_REQUEST_TIMEOUT = 600
+
+
+def find_git_common_dir(start: Path) -> Optional[Path]:
+  """
+  git을 실행하지 않고 공용 .git 디렉토리 찾기 (linked worktree는 .git 파일의 gitdir → commondir)
+
+  Returns:
+      Optional[Path]: 공용 .git 디렉토리, Git 저장소가 아니면 None
+  """
+  for directory in [start, *start.parents]:
+    git_path = directory / '.git'
+    if git_path.is_dir():
+      return git_path.resolve()
+    if git_path.is_file():
+      try:
+        content = git_path.read_text(encoding='utf-8').strip()
+      except OSError:
+        return None
+      if not content.startswith('gitdir:'):
+        return None
+      gitdir = (directory / content[len('gitdir:'):].strip()).resolve()
+      commondir = gitdir / 'commondir'
+      if commondir.is_file():
+        return (gitdir / commondir.read_text(encoding='utf-8').strip()).resolve()
+      return gitdir
+  return None
+
+
+def get_daemon_socket_path(common_dir: Path) -> str:
+  """
+  저장소별 데몬 소켓 경로 (Unix 소켓 경로 길이 제한 때문에 사용자별 폴더 + 해시)
+
+  소켓은 사용자 전용 폴더(XDG_RUNTIME_DIR 아래, 없으면 TMPDIR 아래 0700 폴더)에 둡니다.
+  클라이언트가 매번 계산하므로 hashlib/tempfile 대신 가벼운 zlib.crc32와 TMPDIR를 사용합니다.
+  """
+  import zlib
+  digest = f"{zlib.crc32(str(common_dir).encode('utf-8')):08x}"
+  runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+  if runtime_dir and os.path.isdir(runtime_dir):
+    socket_dir = os.path.join(runtime_dir, 'worktree-manager')
+  else:
+    socket_dir = os.path.join(os.environ.get('TMPDIR') or '/tmp', f'worktree-manager-{os.getuid()}')
+  return os.path.join(socket_dir, f'{digest}.sock')
+
+
+def is_private_daemon_dir(directory: str) -> bool:
+  """본인 소유이고 다른 사용자가 접근할 수 없는(0700) 실제 폴더인지 (심볼릭 링크 불가)"""
+  try:
+    st = os.lstat(directory)
+  except OSError:
+    return False
+  return stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+
+def is_trusted_daemon_socket(socket_path: str) -> bool:
+  """
+  본인이 띄운 데몬의 소켓인지 확인 (연결하거나 지우기 전에 호출)
+
+  공용 임시 폴더에서 다른 사용자가 같은 경로에 소켓을 먼저 만들어 가짜 결과를 돌려주지 않도록,
+  본인 소유의 비공개 폴더 안에 있는 본인 소유의 소켓만 신뢰합니다.
+  """
+  try:
+    st = os.lstat(socket_path)
+  except OSError:
+    return False
+  return (stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+          and is_private_daemon_dir(os.path.dirname(socket_path)))
+
+
+def ensure_daemon_socket_dir(socket_path: str) -> bool:
+  """소켓 폴더를 0700으로 만들고 본인 전용 폴더인지 확인 (다른 사용자가 먼저 만들었으면 False)"""
+  directory = os.path.dirname(socket_path)
+  try:
+    os.mkdir(directory, 0o700)
+  except FileExistsError:
+    pass
+  except OSError:
+    return False
+  return is_private_daemon_dir(directory)
+
+
+def repository_signature(common_dir: Path) -> Tuple:
+  """
+  스냅샷을 무효화해야 하는지 판단할 .git 상태 (HEAD, packed-refs, refs/·worktrees/ 하위 디렉토리의 mtime)
+
+  ref와 worktree 정보는 잠금 파일을 rename해서 갱신되므로 디렉토리 mtime만 봐도 변경을 알 수 있습니다.
+  """
+  signature = []
+  for name in ('HEAD', 'packed-refs'):
+    try:
+      signature.append((name, os.stat(common_dir / name).st_mtime_ns))
+    except OSError:
+      signature.append((name, None))
+
+  for top in ('refs', 'worktrees'):
+    stack = [str(common_dir / top)]
+    while stack:
+      directory = stack.pop()
+      try:
+        signature.append((directory, os.stat(directory).st_mtime_ns))
+        with os.scandir(directory) as it:
+          stack.extend(entry.path for entry in it if entry.is_dir(follow_symlinks=False))
+      except OSError:
+        signature.append((directory, None))
+  return tuple(signature)
+
+
+def send_daemon_request(socket_path: str, request: Dict, timeout: float = DAEMON_REQUEST_TIMEOUT) -> Optional[Dict]:
+  """
+  데몬에 JSON 요청 한 건 전송
+
+  Returns:
+      Optional[Dict]: 응답, 신뢰할 수 없는 소켓이거나 연결 실패·잘못된 응답이면 None
+  """
+  if not is_trusted_daemon_socket(socket_path):
+    return None
+  import json
+  import socket
+
+  try:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+      conn.settimeout(DAEMON_CONNECT_TIMEOUT)
+      conn.connect(socket_path)
+      conn.settimeout(timeout)
+      conn.sendall(json.dumps(request, ensure_ascii=False).encode('utf-8') + b'\n')
+      conn.shutdown(socket.SHUT_WR)
+      chunks = []
+      while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+          break
+        chunks.append(chunk)
+    return json.loads(b''.join(chunks).decode('utf-8'))
+  except (OSError, ValueError):
+    return None
+
+
+def run_via_daemon(argv: List[str]) -> Optional[int]:
+  """
+  실행 중인 데몬이 있으면 요청을 넘기고 출력을 그대로 표시
+
+  Returns:
+      Optional[int]: 데몬이 처리한 exit code, 데몬을 쓸 수 없으면 None (직접 실행)
+  """
+  if IS_WINDOWS or os.environ.get('WORKTREE_MANAGER_NO_DAEMON'):
+    return None
+  common_dir = find_git_common_dir(Path.cwd())
+  if not common_dir:
+    return None
+  socket_path = get_daemon_socket_path(common_dir)
+  if not is_trusted_daemon_socket(socket_path):
+    return None
+
+  response = send_daemon_request(socket_path, {'cmd': 'run', 'cwd': os.getcwd(), 'argv': argv})
+  if not response or 'exit_code' not in response:
+    return None
+  sys.stdout.write(response.get('output', ''))
+  sys.stdout.flush()
+  sys.stderr.write(response.get('errors', ''))
+  return response['exit_code']
+
+
+def handle_daemon_run(request: Dict) -> Dict:
+  """데몬 안에서 main() 실행 (stdout/stderr는 따로 캡처해서 클라이언트로 돌려줌)"""
+  import contextlib
+
+  output = io.StringIO()
+  errors = io.StringIO()
+  previous_cwd = os.getcwd()
+  try:
+    os.chdir(request['cwd'])
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(errors):
+      try:
+        exit_code = main(['--no-daemon'] + list(request['argv']))
+      except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+      except Exception as e:
+        print_error(f"예상치 못한 오류가 발생했습니다: {e}")
+        exit_code = 1
+  except OSError as e:
+    return {'exit_code': 1, 'output': '', 'errors': f"❌ 에러: {e}\n"}
+  finally:
+    os.chdir(previous_cwd)
+  return {'exit_code': exit_code, 'output': output.getvalue(), 'errors': errors.getvalue()}
+
+
+def serve_daemon(idle_timeout: int) -> int:
+  """
+  포그라운드에서 데몬 실행 (daemon run)
+
+  요청은 한 번에 하나씩 처리합니다 (git 작업이 어차피 저장소 잠금을 공유하므로).
+
+  Returns:
+      int: Exit code
+  """
+  import json
+  import socket
+
+  if not hasattr(socket, 'AF_UNIX'):
+    print_error("이 플랫폼은 Unix 소켓을 지원하지 않아 데몬을 사용할 수 없습니다.")
+    return 1
+  common_dir = find_git_common_dir(Path.cwd())
+  if not common_dir:
+    print_error("현재 디렉토리가 Git 저장소가 아닙니다.")
+    return 1
+
+  socket_path = get_daemon_socket_path(common_dir)
+  if not ensure_daemon_socket_dir(socket_path):
+    print_error(f"데몬 소켓 폴더가 본인 전용(0700) 폴더가 아닙니다: {os.path.dirname(socket_path)}")
+    return 1
+  if send_daemon_request(socket_path, {'cmd': 'ping'}, timeout=DAEMON_CONNECT_TIMEOUT):
+    print_info(f"데몬이 이미 실행 중입니다: {socket_path}")
+    return 0
+  if os.path.lexists(socket_path):
+    if not is_trusted_daemon_socket(socket_path):
+      print_error(f"다른 사용자 소유이거나 소켓이 아닌 파일이 있습니다: {socket_path}")
+      return 1
+    os.unlink(socket_path)
+
+  server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+  server.bind(socket_path)
+  os.chmod(socket_path, 0o600)
+  server.listen(8)
+  server.settimeout(idle_timeout)
+  print_success(f"데몬 시작: {socket_path} (pid {os.getpid()})")
+
+  signature = None
+  handled = 0
+  try:
+    while True:
+      try:
+        conn, _ = server.accept()
+      except socket.timeout:
+        print_info("요청이 없어 데몬을 종료합니다.")
+        break
+
+      with conn:
+        conn.settimeout(DAEMON_REQUEST_TIMEOUT)
+        try:
+          data = b''
+          while not data.endswith(b'\n'):
+            chunk = conn.recv(65536)
+            if not chunk:
+              break
+            data += chunk
+          request = json.loads(data.decode('utf-8'))
+        except (OSError, ValueError):
+          continue
+
+        command = request.get('cmd')
+        if command == 'run':
+          current = repository_signature(common_dir)
+          if current != signature:
+            invalidate_snapshot()
+          response = handle_daemon_run(request)
+          signature = repository_signature(common_dir)
+          handled += 1
+        elif command == 'ping':
+          response = {'pid': os.getpid(), 'requests': handled, 'repository': str(common_dir)}
+        elif command == 'stop':
+          response = {'stopped': True}
+        else:
+          response = {'error': f'알 수 없는 요청: {command}'}
+
+        try:
+          conn.sendall(json.dumps(response, ensure_ascii=False).encode('utf-8'))
+        except OSError:
+          pass
+        if command == 'stop':
+          break
+  finally:
+    server.close()
+    if is_trusted_daemon_socket(socket_path):
+      os.unlink(socket_path)
+  return 0
+
+
+def run_daemon_command(action: str, idle_timeout: int) -> int:
+  """
+  daemon start / stop / status / run
+
+  Returns:
+      int: Exit code
+  """
+  if action == 'run':
+    return serve_daemon(idle_timeout)
+
+  common_dir = find_git_common_dir(Path.cwd()) if not IS_WINDOWS else None
+  if not common_dir:
+    print_error("Git 저장소가 아니거나 Unix 소켓을 지원하지 않는 플랫폼입니다.")
+    return 1
+  socket_path = get_daemon_socket_path(common_dir)
+  status = send_daemon_request(socket_path, {'cmd': 'ping'}, timeout=DAEMON_CONNECT_TIMEOUT)
+
+  if action == 'status':
+    if status:
+      print_success(f"데몬 실행 중 (pid {status['pid']}, 처리한 요청 {status['requests']}개): {socket_path}")
+    else:
+      print_info("데몬이 실행 중이 아닙니다.")
+    return 0
+
+  if action == 'stop':
+    if not status:
+      print_info("데몬이 실행 중이 아닙니다.")
+      return 0
+    send_daemon_request(socket_path, {'cmd': 'stop'}, timeout=DAEMON_CONNECT_TIMEOUT)
+    print_success("데몬을 중지했습니다.")
+    return 0
+
+  if status:
+    print_info(f"데몬이 이미 실행 중입니다 (pid {status['pid']}).")
+    return 0
+
+  import subprocess
+
+  subprocess.Popen(
+    [sys.executable, str(Path(__file__).resolve()), 'daemon', 'run', '--idle-timeout', str(idle_timeout)],
+    stdin=subprocess.DEVNULL,
+    stdout=subprocess.DEVNULL,
+    stderr=subprocess.DEVNULL,
+    start_new_session=True
+  )
+  for _ in range(50):
+    time.sleep(0.1)
+    status = send_daemon_request(socket_path, {'cmd': 'ping'}, timeout=DAEMON_CONNECT_TIMEOUT)
+    if status:
+      print_success(f"데몬 시작 (pid {status['pid']}): {socket_path}")
+      return 0
+  print_error("데몬을 시작하지 못했습니다.")
+  return 1
+
+
+# ===================================================================
+# 시작 시간 측정 (bench)
+# ===================================================================
+
+# "이미 존재" 경로에서 인터프리터 기동(python -c pass)을 뺀 스크립트 시간 예산
+STARTUP_BUDGET_MS = 50.0
+STARTUP_BENCH_RUNS = 15
+
+
+def measure_command(command: List[str], runs: int) -> float:
+  """명령을 runs번 실행해 중앙값(ms) 반환 (출력은 버림)"""
+  import statistics
+  import subprocess
+
+  timings = []
+  for _ in range(runs):
+    start = time.perf_counter()
+    subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    timings.append((time.perf_counter() - start) * 1000)
+  return statistics.median(timings)
+
+
+def top_imports(command: List[str], limit: int = 5) -> List[Tuple[str, int]]:
+  """python -X importtime 결과에서 누적 시간이 큰 최상위 import (모듈명, µs)"""
+  import subprocess
+
+  result = subprocess.run(command[:1] + ['-X', 'importtime'] + command[1:],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+  imports = []
+  for line in result.stderr.splitlines():
+    if not line.startswith('import time:') or 'cumulative' in line:
+      continue
+    _, cumulative, name = line[len('import time:'):].split('|')
+    if not name.startswith('  '):
+      imports.append((name.strip(), int(cumulative)))
+  return sorted(imports, key=lambda item: -item[1])[:limit]
+
+
+def run_startup_bench(branch: Optional[str], runs: int, budget_ms: float) -> int:
+  """
+  이미 존재하는 worktree를 요청하는 경로의 콜드 스타트 시간 측정 (bench 명령)
+
+  같은 인터프리터의 `python -c pass` 시간을 빼서 기기 차이를 줄이고, 예산을 넘으면 exit 1을 반환합니다.
+
+  Returns:
+      int: Exit code (0: 예산 이내, 1: 초과 또는 측정 불가)
+  """
+  if not branch:
+    entries = get_worktree_entries() or []
+    branch = next((entry['branch'] for entry in entries[1:] if entry['branch'] and not entry['prunable']), None)
+  if not branch:
+    print_error("측정할 worktree가 없습니다. --branch로 이미 worktree가 있는 브랜치를 지정하세요.")
+    return 1
+
+  # 가장 흔한 호출 형태(브랜치명 하나)를 그대로 측정하고, 데몬은 환경 변수로 끔
+  os.environ['WORKTREE_MANAGER_NO_DAEMON'] = '1'
+  script = [sys.executable, str(Path(__file__).resolve()), branch]
+  print_step("⏱️", f"측정 대상: {branch} ({runs}회)")
+
+  baseline = measure_command([sys.executable, '-c', 'pass'], runs)
+  total = measure_command(script, runs)
+  overhead = total - baseline
+
+  print_info(f"중앙값 {total:.1f}ms = 인터프리터 {baseline:.1f}ms + 스크립트 {overhead:.1f}ms (예산 {budget_ms:.0f}ms)")
+  print_info("import 상위: " + ', '.join(f"{name} {us / 1000:.1f}ms" for name, us in top_imports(script)))
+
+  if overhead > budget_ms:
+    print_error(f"시작 시간 예산 초과: {overhead:.1f}ms > {budget_ms:.0f}ms")
+    return 1
+  print_success("시작 시간 예산 이내")
+  return 0
+
+
+# ===================================================================
+# 메인 워크플로우
+# ===================================================================
+
+# 옵션 기본값 (argparse와 브랜치명 하나만 받는 빠른 경로가 함께 사용)
+DEFAULT_OPTIONS = {
+  'command': None,
+  'branch': None,
+  'batch': None,
+  'jobs': DEFAULT_BATCH_JOBS,
+  'depth': None,
+  'remote_ttl': REMOTE_CACHE_TTL,
+  'profile': None,
+  'seed_cache': False,
+  'seed_from': None,
+  'seed_mode': 'auto',
+  'no_daemon': False,
+  'json': False,
+}
+
+
+def parse_args(argv: Optional[List[str]] = None) -> 'argparse.Namespace':
+  """
+  명령행 인자 파싱 (첫 인자가 list/status/gc/daemon/bench이면 해당 명령으로 처리)
+
+  명령 이름과 같은 브랜치명은 `--` 뒤에 있을 때만 브랜치로 받습니다.
+
+  브랜치명 하나만 받은 가장 흔한 호출은 argparse(와 argparse가 불러오는 re)를 로드하지 않고 처리합니다.
+  """
+  argv = sys.argv[1:] if argv is None else argv
+  if argv and argv[0] in COMMANDS:
+    return parse_command_args(argv)
+  if len(argv) == 1 and not argv[0].startswith('-'):
+    import types
+    return types.SimpleNamespace(**dict(DEFAULT_OPTIONS, branch=argv[0]))
+
+  import argparse
+
+  parser = argparse.ArgumentParser(
+    prog='worktree_manager.py',
+    description='Git worktree 자동 생성 및 관리'
+  )
+  parser.add_argument('branch', nargs='?', help='worktree를 만들 브랜치명')
+  parser.add_argument('--batch', metavar='FILE', help='브랜치 목록 파일로 일괄 생성 (한 줄에 하나, "-"이면 stdin)')
+  parser.add_argument('--jobs', type=int,
+                      help=f'일괄 생성 시 동시에 실행할 worktree add 수 (기본: {DEFAULT_BATCH_JOBS})')
+  parser.add_argument('--depth', type=int,
+                      help='리모트 브랜치를 얕게 fetch (이미 shallow인 저장소에서만 사용 가능)')
+  parser.add_argument('--remote-ttl', type=int,
+                      help=f'리모트 브랜치 목록 캐시 유효 시간 (초, 0이면 사용 안 함, 기본: {REMOTE_CACHE_TTL})')
+  parser.add_argument('--profile', action='append', metavar='NAME',
+                      help=f'sparse-checkout 프로필로 필요한 폴더만 체크아웃 (여러 번 지정 가능, {PROFILES_FILE.name})')
+  parser.add_argument('--seed-cache', action='store_true',
+                      help='새 worktree에 빌드 캐시(.dart_tool, build, Gradle, CocoaPods)를 복제')
+  parser.add_argument('--seed-from', metavar='PATH|BRANCH',
+                      help='빌드 캐시 원본 체크아웃 경로 또는 브랜치 (기본: 메인 worktree)')
+  parser.add_argument('--seed-mode', choices=['auto', 'hardlink', 'copy'],
+                      help='auto: reflink, 안 되면 복사 / hardlink: reflink, 안 되면 hardlink '
+                           '(원본과 파일을 공유하므로 주의) / copy: 항상 복사')
+  parser.add_argument('--no-daemon', action='store_true', help='실행 중인 데몬이 있어도 직접 실행')
+  parser.add_argument('--json', action='store_true',
+                      help='stdout에 결과 문서(JSON) 하나만 출력 (진행 메시지는 stderr, git 호출별 소요 시간 포함)')
+  parser.set_defaults(**DEFAULT_OPTIONS)
+  args = parser.parse_args(argv)
+
+  # 명령은 첫 인자일 때만 인식하므로 옵션 뒤의 list/status/gc 등은 브랜치명으로 파싱됨
+  # (예: --no-daemon list가 list 브랜치를 만듦). 같은 이름의 브랜치는 `--` 뒤에 있을 때만 허용
+  explicit = argv[argv.index('--') + 1:] if '--' in argv else []
+  if args.branch in COMMANDS and args.branch not in explicit:
+    parser.error(f"'{args.branch}'은(는) 명령 이름입니다. 명령은 옵션 없이 첫 인자로 실행하고, "
+                 f"같은 이름의 브랜치는 `-- {args.branch}`로 지정하세요.")
+  return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+  """
+  메인 워크플로우
+
+  Args:
+      argv: 명령행 인자 (없으면 sys.argv)
+
+  Returns:
+      int: Exit code (0: 성공, 1: 실패)
+  """
+  argv = sys.argv[1:] if argv is None else argv
+  args = parse_args(argv)
+
+  # 브랜치 하나를 만드는 요청은 데몬이 실행 중이면 데몬이 처리 (stdin/환경 변수 입력은 직접 실행)
+  if args.command is None and args.branch and not args.batch and not args.no_daemon:
+    exit_code = run_via_daemon(argv)
+    if exit_code is not None:
+      return exit_code
+
+  _git_calls.clear()
+  _errors.clear()
+
+  if args.command is None and args.json:
+    return run_with_json_output(args)
+
+  print_header()
+
+  if args.command:
+    return run_command(args)
+  return run_worktree(args, {})
+
+
+def run_with_json_output(args: 'argparse.Namespace') -> int:
+  """
+  --json: 사람이 읽는 출력은 stderr로 보내고 stdout에는 결과 문서(JSON) 하나만 출력
+
+  문서: branch, folder, path, is_existing, source('local' | 'remote' | 'new'), success, exit_code,
+        message(실패 시 마지막 에러), elapsed_ms, git_calls([{'command', 'ms', 'ok'}, ...]),
+        일괄 생성이면 results(브랜치별 결과), 시딩했으면 seed
+  """
+  import contextlib
+  import json
+
+  report = {'branch': None, 'folder': None, 'path': None, 'is_existing': None, 'source': None}
+  start = time.perf_counter()
+  with contextlib.redirect_stdout(sys.stderr):
+    print_header()
+    exit_code = run_worktree(args, report)
+
+  report.update(
+    success=exit_code == 0,
+    exit_code=exit_code,
+    message=_errors[-1] if exit_code and _errors else report.get('message'),
+    elapsed_ms=round((time.perf_counter() - start) * 1000, 2),
+    git_calls=list(_git_calls),
+  )
+  print(json.dumps(report, ensure_ascii=False, indent=2))
+  return exit_code
+
+
+def run_worktree(args: 'argparse.Namespace', report: Dict) -> int:
+  """
+  worktree 생성 워크플로우 (브랜치 하나 또는 --batch)
+
+  Args:
+      args: 파싱된 명령행 인자
+      report: 진행하면서 결과를 기록할 dict (--json 결과 문서)
+
+  Returns:
+      int: Exit code (0: 성공, 1: 실패)
+  """
+  sparse_paths, profile_error = resolve_sparse_paths(args.profile)
+  if profile_error:
+    print_error(profile_error)
+    return 1
+  if sparse_paths:
+    print_step("🧩", f"sparse-checkout 프로필: {', '.join(args.profile)} ({', '.join(sparse_paths)})")
+
+  # 전체 clone에서 --depth로 fetch하면 메인 저장소까지 shallow가 되어 히스토리가 잘림
+  if args.depth and is_git_repository() and not is_shallow_repository():
+    print_error("--depth는 이미 shallow인 저장소에서만 사용할 수 있습니다. "
+                "전체 clone에서는 --depth 없이 실행하세요 (메인 저장소가 shallow 상태가 됨).")
+    return 1
+
+  seed_source = None
+  if args.seed_cache or args.seed_from:
+    seed_source = resolve_seed_source(args.seed_from)
+    if not seed_source:
+      print_error(f"빌드 캐시 원본을 찾을 수 없습니다: {args.seed_from}")
+      return 1
+    print_step("🧊", f"빌드 캐시 원본: {seed_source}")
+
+  if sparse_paths:
+    report['sparse_paths'] = sparse_paths
+
+  if args.batch:
+    return run_batch(args.batch, args.jobs, args.depth, args.remote_ttl, sparse_paths,
+                     seed_source, args.seed_mode, report)
+
+  # 1. 브랜치명 받기 (Windows 환경 대응)
+  branch_name = get_branch_name(args.branch)
+
+  if not branch_name:
+    print_error("브랜치명이 제공되지 않았습니다.")
+    print()
+    print("사용법:")
+    if IS_WINDOWS:
+      print("  Windows 환경:")
+      print("    방법 1: 환경 변수 사용")
+      print(f'      $env:GIT_BRANCH_NAME = "브랜치명"')
+      print(f"      python {sys.argv[0]}")
+      print()
+      print("    방법 2: 파일 사용")
+      print(f'      $env:BRANCH_NAME_FILE = "branch_name.txt"')
+      print(f"      python {sys.argv[0]}")
+      print()
+      print("    방법 3: 인자로 전달 (한글 깨짐 가능)")
+      print(f'      python {sys.argv[0]} "브랜치명"')
+    else:
+      print(f"  python {sys.argv[0]} <branch_name>")
+    print(f"  python {sys.argv[0]} --batch <branches.txt|->   (여러 브랜치 일괄 생성)")
+    print()
+    print("예시:")
+    print(f'  python {sys.argv[0]} "20260120_#163_Github_Projects_에_대한_템플릿_개발_필요"')
+    return 1
+
+  print_step("📋", f"입력된 브랜치: {branch_name}")
+  report['branch'] = branch_name
+
+  # 2. Git 저장소 확인
+  if not is_git_repository():
+    print_error("현재 디렉토리가 Git 저장소가 아닙니다.")
+    return 1
+
+  # 2-1. Windows 긴 경로 지원 확인 및 활성화
+  if IS_WINDOWS:
+    check_and_enable_longpaths()
+    print()
+
+  # 3. 브랜치명 정규화
+  folder_name = normalize_branch_name(branch_name)
+  print_step("📁", f"폴더명: {folder_name}")
+  print()
+  report['folder'] = folder_name
+
+  # 4. 브랜치 존재 확인 (로컬 → 리모트 순서)
+  print_step("🔍", "브랜치 확인 중...")
+
+  if branch_exists(branch_name):
+    print_success("로컬 브랜치가 이미 존재합니다.")
+    report['source'] = 'local'
+  else:
+    print_warning("로컬 브랜치가 존재하지 않습니다.")
+
+    # 리모트에 있는지 먼저 확인하고 있으면 그 브랜치만 가져오기
+    print_step("🌐", "리모트 브랜치 확인 중...")
+    remote_state = sync_remote_branches([branch_name], depth=args.depth, ttl=args.remote_ttl)[branch_name]
+    report['source'] = 'new' if remote_state == 'new' else 'remote'
+
+    if remote_state == 'fetch_failed':
+      print_error(f"리모트 브랜치(origin/{branch_name})를 가져오지 못했습니다.")
+      return 1
+
+    if remote_state == 'remote':
+      # 리모트에 브랜치가 있으면 tracking 브랜치로 생성
+      print_step("🌐", f"리모트(origin/{branch_name})에서 브랜치를 가져옵니다...")
+
+      if not create_branch_from_remote(branch_name):
+        print_error("리모트 브랜치 기반 로컬 브랜치 생성에 실패했습니다.")
+        return 1
+
+      print_success(f"리모트 브랜치(origin/{branch_name})를 기반으로 로컬 브랜치 생성 완료!")
+    else:
+      # 리모트에도 없으면 현재 브랜치에서 새로 생성
+      current_branch = get_current_branch()
+      if current_branch:
+        print_step("🔄", f"현재 브랜치({current_branch})에서 새 브랜치 생성 중...")
+      else:
+        print_step("🔄", "새 브랜치 생성 중...")
+
+      if not create_branch(branch_name):
+        print_error("브랜치 생성에 실패했습니다.")
+        return 1
+
+      print_success("새 브랜치 생성 완료!")
+
+  print()
 
   # 5. Worktree 경로 계산
   try:
@@ -661,6 +2573,7 @@ def main() -> int:
 
   print_step("📂", f"Worktree 경로: {worktree_path}")
   print()
+  report['path'] = str(worktree_path.resolve())
 
   # 6. Worktree 존재 확인
   print_step("🔍", "Worktree 확인 중...")
@@ -669,6 +2582,7 @@ def main() -> int:
     print_info("Worktree가 이미 존재합니다.")
     print()
     print_step("📍", f"경로: {worktree_path.resolve()}")
+    report.update(is_existing=True, message='Worktree가 이미 존재합니다.')
     return 0
 
   # 7. Worktree 루트 디렉토리 생성
@@ -679,13 +2593,18 @@ def main() -> int:
   # 8. Worktree 생성
   print_step("🔄", "Worktree 생성 중...")
 
-  result = create_worktree(branch_name, worktree_path)
+  result = create_worktree(branch_name, worktree_path, sparse_paths)
+  report.update(path=result['path'], is_existing=result['is_existing'], message=result['message'])
 
   if result['success']:
     if result['is_existing']:
       print_info(result['message'])
     else:
       print_success(result['message'])
+      if seed_source:
+        print_step("🧊", "빌드 캐시 복제 중...")
+        report['seed'] = seed_build_cache(seed_source, worktree_path, args.seed_mode, sparse_paths)
+        print_seed_report(report['seed'])
 
     print()
     print_step("📍", f"경로: {result['path']}")
@@ -700,6 +2619,8 @@ def main() -> int:
 # ===================================================================
 
 if __name__ == "__main__":
+  if IS_WINDOWS:
+    configure_windows_console()
   try:
     exit_code = main()
     sys.exit(exit_code)
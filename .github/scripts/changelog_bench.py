@@ -0,0 +1,607 @@
+#!/usr/bin/env python3
+"""
+changelog_bench.py
+
+changelog_manager.py 성능 측정 및 스트레스 테스트 스크립트.
+
+측정 대상 (--suite):
+  - parser      : 합성 PR body 크기에 따른 Markdown 파서 처리 시간 (선형성)
+  - corpus      : 저장된 raw_summary + 적대적 본문에 대한 단계별 파서 처리량/최악 지연
+  - fuzz        : 파싱 + 노이즈 제거 최악 시간의 선형성 퍼즈
+  - index       : 합성 히스토리에서 전체 로드 탐색과 버전 인덱스 탐색 비교
+  - concurrency : update-from-summary/compact/generate-md 동시 실행 후 유실/중복 확인
+  - clean       : Summary 노이즈 제거 처리량 (기존 정규식 구현과 비교)
+
+사용 예:
+  python3 changelog_bench.py --suite index --releases 50000 --output bench.json
+  python3 changelog_bench.py --suite corpus --output after.json --baseline before.json
+  python3 changelog_bench.py --suite concurrency --writers 32
+
+저장소 루트에서 실행하면 CHANGELOG.json을 코퍼스로 사용한다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from changelog_manager import (
+    CHANGELOG_INDEX,
+    CHANGELOG_JSON,
+    CHANGELOG_MD,
+    _clean_summary_noise,
+    _clean_summary_noise_cached,
+    _file_size,
+    _find_release,
+    _load_changelog,
+    _parse_markdown_heuristic,
+    _parse_markdown_lenient,
+    _parse_markdown_precise,
+    _parse_summary_markdown,
+    _read_snapshot,
+    _write_snapshot,
+    cmd_generate_md,
+)
+
+_MANAGER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'changelog_manager.py')
+
+
+# --------------------------- 측정 도구 ---------------------------
+
+def _synthetic_pr_body(target_bytes: int, style: str) -> str:
+    """벤치마크용 합성 PR body 생성 (target_bytes 이상이 될 때까지 블록 반복)."""
+    blocks = {
+        # 정밀 파서가 성공하는 현재 CodeRabbit 형식
+        'coderabbit': "* **카테고리 {i}**\n  * 항목 {i}-1 처리 개선\n  * 항목 {i}-2 오류 수정\n\n",
+        # 관대한 파서까지 내려가는 형식 변형
+        'lenient': "- 카테고리 {i}\n    - 항목 {i}-1 처리 개선\n\t+ 항목 {i}-2 오류 수정\n",
+        # 세 단계가 모두 실패하는 본문
+        'unparsable': "설명 문단 {i} * 별표와 **짝이 맞지 않는 굵은 글씨\n         *들여쓰기 {i}\n<!-- 주석 {i} -->\n",
+        # 이하 적대적 입력: 깊은 들여쓰기, 카테고리 하나에 수천 개 항목, 짝이 안 맞는 **,
+        # 본문 대부분을 덮는 HTML 주석, 개행 없는 한 줄
+        'deep_indent': "{pad}* **카테고리 {i}**\n{pad}  * 항목 {i} 처리 개선\n",
+        'many_bullets': "  * 항목 {i} 처리 개선\n",
+        'unbalanced_bold': "* **카테고리 {i} 처리 ** 개선 **\n  * **항목 {i}\n**\n",
+        'huge_html_comment': "* **숨김 {i}**\n  * <b>주석</b> 안 항목 {i}\n",
+        'long_line': "**굵게 {i} * 별표 - 대시 ",
+    }
+    heads = {'many_bullets': "* **카테고리**\n", 'huge_html_comment': "<!-- "}
+    tails = {'huge_html_comment': " -->\n\n* **보이는 카테고리**\n  * 항목\n"}
+    block = blocks[style]
+    tail = tails.get(style, '')
+    parts = ["## Summary by CodeRabbit\n\n" + heads.get(style, '')]
+    size = len(parts[0].encode('utf-8')) + len(tail.encode('utf-8'))
+    i = 0
+    while size < target_bytes:
+        part = block.format(i=i, pad=' ' * (i % 200 * 2))
+        parts.append(part)
+        size += len(part.encode('utf-8'))
+        i += 1
+    parts.append(tail)
+    return ''.join(parts)
+
+
+def _time_call(func, *args, repeat: int = 3) -> float:
+    """func(*args)를 repeat번 실행해 가장 빠른 시간(초) 반환. 진행 출력은 숨긴다."""
+    best = float('inf')
+    for _ in range(max(1, repeat)):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func(*args)
+            elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+    return best
+
+
+def _bench_parser_scaling(max_bytes: int, repeat: int) -> dict:
+    """본문 크기를 1/4, 1/2, 1배로 늘리며 파서 처리 시간이 선형인지 측정."""
+    results = {}
+    for style in ('coderabbit', 'lenient', 'unparsable'):
+        rows = []
+        for fraction in (0.25, 0.5, 1.0):
+            body = _synthetic_pr_body(int(max_bytes * fraction), style)
+            size = len(body.encode('utf-8'))
+            seconds = _time_call(_parse_summary_markdown, body, repeat=repeat)
+            rows.append({
+                'bytes': size,
+                'seconds': round(seconds, 6),
+                'ns_per_byte': round(seconds * 1e9 / size, 2),
+            })
+        # 크기가 4배일 때 바이트당 시간이 크게 늘지 않으면 선형
+        growth = rows[-1]['ns_per_byte'] / rows[0]['ns_per_byte'] if rows[0]['ns_per_byte'] else 0.0
+        results[style] = {'runs': rows, 'ns_per_byte_growth': round(growth, 2)}
+    return results
+
+
+_ADVERSARIAL_STYLES = ('deep_indent', 'many_bullets', 'unbalanced_bold', 'huge_html_comment', 'long_line', 'unparsable')
+_PARSER_STAGES = (
+    ('precise', _parse_markdown_precise),
+    ('lenient', _parse_markdown_lenient),
+    ('heuristic', _parse_markdown_heuristic),
+)
+
+
+def _bench_parser_corpus(max_bytes: int, repeat: int) -> dict:
+    """
+    실제 raw_summary 전체와 적대적 본문으로 단계별 파서 측정.
+
+    입력마다 세 파서를 단독으로, 그리고 전체 파이프라인을 실행해 처리량, 최악 지연,
+    어느 단계가 결과를 냈는지 기록한다. parse_method가 markdown인 릴리즈는 저장된
+    parsed_changes와 비교해 회귀 여부도 확인한다.
+    """
+    inputs = []
+    regressions = []
+    snapshot = _read_snapshot() or {}
+    for release in snapshot.get('releases') or []:
+        body = (release.get('raw_summary') or '') + "\n"
+        inputs.append(('corpus', str(release.get('version')), body))
+        if release.get('parse_method') == 'markdown':
+            with contextlib.redirect_stdout(io.StringIO()):
+                parsed = _parse_summary_markdown(body)
+            if parsed != (release.get('parsed_changes') or {}):
+                regressions.append(str(release.get('version')))
+    for style in _ADVERSARIAL_STYLES:
+        inputs.append(('adversarial', style, _synthetic_pr_body(max_bytes, style)))
+
+    parsers = [*_PARSER_STAGES, ('pipeline', _parse_summary_markdown)]
+    groups: dict[str, dict] = {}
+    adversarial: dict[str, dict] = {}
+    for group, label, body in inputs:
+        size = len(body.encode('utf-8'))
+        stats = groups.setdefault(group, {
+            'inputs': 0,
+            'bytes': 0,
+            'stages': {'precise': 0, 'lenient': 0, 'heuristic': 0, 'none': 0},
+            'parsers': {name: {'seconds': 0.0, 'worst_seconds': 0.0, 'worst_input': None} for name, _ in parsers},
+        })
+        stats['inputs'] += 1
+        stats['bytes'] += size
+
+        timings = {}
+        stage = 'none'
+        for name, func in parsers:
+            seconds = _time_call(func, body, repeat=repeat)
+            timings[name] = round(seconds, 6)
+            row = stats['parsers'][name]
+            row['seconds'] += seconds
+            if seconds > row['worst_seconds']:
+                row['worst_seconds'], row['worst_input'] = seconds, label
+            if stage == 'none' and name != 'pipeline' and func(body):
+                stage = name
+        stats['stages'][stage] += 1
+        if group == 'adversarial':
+            adversarial[label] = {'bytes': size, 'stage': stage, 'seconds': timings}
+
+    for stats in groups.values():
+        for row in stats['parsers'].values():
+            seconds = row['seconds']
+            row['mb_per_second'] = round(stats['bytes'] / seconds / 1e6, 2) if seconds else None
+            row['seconds'] = round(seconds, 6)
+            row['worst_seconds'] = round(row['worst_seconds'], 6)
+    return {'groups': groups, 'adversarial': adversarial, 'regressions': regressions}
+
+
+def _bench_concurrent_updates(writers: int, seed_releases: int = 200) -> dict:
+    """
+    임시 디렉토리에서 update-from-summary 프로세스 writers개를 compact/generate-md와 섞어 동시에 실행하고
+    끝난 뒤 잃어버리거나 중복된 릴리즈가 없는지 확인.
+    """
+    script = _MANAGER_SCRIPT
+    jobs = [('update-from-summary', n) for n in range(writers)]
+    jobs += [('compact', None)] * max(1, writers // 4) + [('generate-md', None)] * max(1, writers // 4)
+    random.Random(0).shuffle(jobs)
+    expected = {f"9.{n // 100}.{n % 100}" for n in range(writers)}
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            seed = _synthetic_changelog(seed_releases)
+            expected |= {r["version"] for r in seed["releases"]}
+            _write_snapshot(seed)
+            with open('pr_body.md', 'w', encoding='utf-8') as f:
+                f.write(_synthetic_pr_body(2 * 1024, 'coderabbit'))
+
+            start = time.perf_counter()
+            procs = []
+            for command, n in jobs:
+                env = dict(os.environ)
+                if n is not None:
+                    env.update(VERSION=f"9.{n // 100}.{n % 100}", PROJECT_TYPE='flutter', TODAY='2026-01-01',
+                               PR_NUMBER=str(100000 + n), TIMESTAMP=f"2026-01-01T00:00:{n % 60:02d}Z")
+                procs.append(subprocess.Popen([sys.executable, script, command], env=env,
+                                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+            failed = sum(1 for proc in procs if proc.wait() != 0)
+            seconds = time.perf_counter() - start
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                cmd_generate_md()
+            data = _load_changelog()
+            versions = [str(r.get("version")) for r in data["releases"]]
+            with open(CHANGELOG_MD, 'r', encoding='utf-8') as f:
+                md_versions = set(re.findall(r'^## \[([^\]]+)\]', f.read(), re.MULTILINE))
+        finally:
+            os.chdir(cwd)
+
+    return {
+        'writers': writers,
+        'processes': len(jobs),
+        'seconds': round(seconds, 4),
+        'failed_processes': failed,
+        'releases': len(versions),
+        'expected_releases': len(expected),
+        'lost': sorted(expected - set(versions)),
+        'duplicates': len(versions) - len(set(versions)),
+        'total_releases_metadata': data["metadata"].get("totalReleases"),
+        'missing_in_md': sorted(expected - md_versions),
+    }
+
+
+# 선형성 퍼즈에 쓰는 반복 토큰: 닫히지 않는 태그/주석/<sub>, 공백뿐인 줄, 짝 없는 **,
+# 항목 없는 헤더, 깊은 들여쓰기 마커 등 정규식/파서가 같은 구간을 반복해서 훑기 쉬운 모양
+_FUZZ_FAMILIES = {
+    'unclosed_tag': '<',
+    'unclosed_comment': '<!--',
+    'unclosed_sub_tip': '<sub>Tip:',
+    'blank_lines': ' \n',
+    'tip_after_blanks': ' \n \nTip: x\n',
+    'emoji_lines': '✏️\n',
+    'bold_markers': '**',
+    'bold_lines': '**\n',
+    'bullet_lines': '  * \n',
+    'header_blanks': '* **a**\n\n\n',
+    'lenient_headers': '-\n\n',
+    'deep_markers': '         *\n',
+}
+_FUZZ_ALPHABET = ('\n', '\n', ' ', '\t', 'x', '가', '*', '**', '-', '+', '1.', '<', '>', '<!--', '-->',
+                  '<sub>', '</sub>', 'Tip:', '✏️', '  * ', '* **')
+_FUZZ_MAX_GROWTH = 2.0  # 크기 8배에서 문자당 시간이 이 배수를 넘으면 선형이 아닌 것으로 판단
+
+
+def _fuzz_body(rng: random.Random, size: int) -> str:
+    """_FUZZ_ALPHABET 토큰을 무작위로 이어 size 문자 이상의 본문 생성."""
+    parts = []
+    length = 0
+    while length < size:
+        token = rng.choice(_FUZZ_ALPHABET)
+        parts.append(token)
+        length += len(token)
+    return ''.join(parts)
+
+
+def _bench_parser_fuzz(max_bytes: int, repeat: int, seed: int = 0) -> dict:
+    """
+    파싱 + 노이즈 제거의 최악 시간이 입력 크기에 선형인지 퍼즈로 확인.
+
+    토큰 패턴별/무작위 본문을 1/8~1배 크기로 늘리며 문자당 최악 시간의 증가율을 재고,
+    작은 무작위 본문으로 노이즈 제거 결과가 기존 정규식 구현과 같은지도 비교한다.
+    """
+    rng = random.Random(seed)
+    sizes = [max(1, max_bytes // d) for d in (8, 4, 2, 1)]
+
+    def work(body: str) -> None:
+        _parse_summary_markdown(body)
+        _clean_summary_noise_cached.__wrapped__(body)
+
+    cases: dict[str, list[list[str]]] = {
+        name: [[token * max(1, size // len(token))] for size in sizes]
+        for name, token in _FUZZ_FAMILIES.items()
+    }
+    cases['random_mix'] = [[_fuzz_body(rng, size) for _ in range(3)] for size in sizes]
+
+    families = {}
+    for name, bodies_by_size in cases.items():
+        rows = []
+        for bodies in bodies_by_size:
+            worst = max(_time_call(work, body, repeat=repeat) for body in bodies)
+            chars = max(len(body) for body in bodies)
+            rows.append({'chars': chars, 'worst_seconds': round(worst, 6),
+                         'ns_per_char': round(worst * 1e9 / chars, 2)})
+        growth = rows[-1]['ns_per_char'] / rows[0]['ns_per_char'] if rows[0]['ns_per_char'] else 0.0
+        families[name] = {'runs': rows, 'ns_per_char_growth': round(growth, 2)}
+
+    mismatches = []
+    for _ in range(2000):
+        body = _fuzz_body(rng, rng.randint(0, 40))
+        if _clean_summary_noise(body) != _clean_summary_noise_reference(body):
+            mismatches.append(body)
+
+    worst_family = max(families, key=lambda k: families[k]['ns_per_char_growth'])
+    worst_growth = families[worst_family]['ns_per_char_growth']
+    return {
+        'seed': seed,
+        'families': families,
+        'worst_family': worst_family,
+        'worst_growth': worst_growth,
+        'linear': worst_growth <= _FUZZ_MAX_GROWTH,
+        'clean_mismatches': len(mismatches),
+        'mismatch_examples': mismatches[:3],
+    }
+
+
+def _print_bench_baseline(report: dict, baseline_path: str) -> None:
+    """이전 bench JSON과 파서 코퍼스 처리량/최악 지연 비교 출력."""
+    try:
+        with open(baseline_path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️ 기준 결과를 읽을 수 없습니다: {e}")
+        return
+    current = (report.get('parser_corpus') or {}).get('groups') or {}
+    previous = (baseline.get('parser_corpus') or {}).get('groups') or {}
+    print(f"\n📈 기준 결과 대비 ({baseline_path})")
+    for group, stats in current.items():
+        for name, row in stats['parsers'].items():
+            old = ((previous.get(group) or {}).get('parsers') or {}).get(name)
+            if not old or not old.get('mb_per_second') or not row['mb_per_second']:
+                continue
+            print(f"  - {group}/{name}: {old['mb_per_second']} → {row['mb_per_second']} MB/s "
+                  f"(x{row['mb_per_second'] / old['mb_per_second']:.2f}), "
+                  f"최악 {old['worst_seconds'] * 1000:.3f}ms → {row['worst_seconds'] * 1000:.3f}ms")
+
+
+def _synthetic_changelog(release_count: int) -> dict:
+    """벤치마크용 합성 체인지로그 생성 (최신 릴리즈가 앞쪽)."""
+    releases = []
+    for i in range(release_count - 1, -1, -1):
+        version = f"{i // 10000}.{i // 100 % 100}.{i % 100}"
+        items = [f"합성 항목 {i}-{n} 처리 개선" for n in range(3)]
+        releases.append({
+            "version": version,
+            "project_type": "flutter",
+            "date": "2026-01-01",
+            "pr_number": i,
+            "raw_summary": "## Summary by CodeRabbit\n\n* **개선**\n" + "".join(f"  * {it}\n" for it in items),
+            "parsed_changes": {"개선": {"title": "개선", "items": items}},
+            "parse_method": "markdown",
+        })
+    return {
+        "metadata": {
+            "lastUpdated": "2026-01-01T00:00:00Z",
+            "currentVersion": releases[0]["version"] if releases else None,
+            "totalReleases": release_count,
+            "projectType": "flutter",
+        },
+        "releases": releases,
+    }
+
+
+def _bench_version_index(release_count: int, repeat: int) -> dict:
+    """합성 히스토리에서 전체 로드 탐색과 인덱스 탐색의 export 조회 시간 비교."""
+    data = _synthetic_changelog(release_count)
+    targets = {
+        'newest': data["releases"][0]["version"],
+        'middle': data["releases"][release_count // 2]["version"],
+        'oldest': data["releases"][-1]["version"],
+        'missing': '99.99.99',
+    }
+
+    def linear_lookup(version: str) -> dict | None:
+        releases = _load_changelog().get('releases') or []
+        return next((r for r in releases if str(r.get('version')) == version), None)
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            _write_snapshot(data)
+            del data
+            result = {
+                'releases': release_count,
+                'json_bytes': _file_size(CHANGELOG_JSON),
+                'build_index_seconds': round(_time_call(cmd_generate_md, repeat=1), 6),
+                'index_bytes': _file_size(CHANGELOG_INDEX),
+                'lookups': {},
+            }
+            for label, version in targets.items():
+                full = _time_call(linear_lookup, version, repeat=repeat)
+                indexed = _time_call(_find_release, version, repeat=repeat)
+                result['lookups'][label] = {
+                    'version': version,
+                    'full_load_seconds': round(full, 6),
+                    'indexed_seconds': round(indexed, 6),
+                    'speedup': round(full / indexed, 1) if indexed else None,
+                }
+        finally:
+            os.chdir(cwd)
+    return result
+
+
+def _clean_summary_noise_reference(text: str) -> str:
+    """비교 기준: 패턴을 매번 컴파일하며 여섯 단계를 모두 적용하던 기존 구현."""
+    if not text:
+        return text
+    text = re.sub(r'<!--.*?-->', '', text, flags=re.DOTALL)
+    text = re.sub(r'^.*?✏️\s*Tip:.*$', '', text, flags=re.MULTILINE)
+    text = re.sub(r'<sub>.*?Tip:.*?</sub>', '', text, flags=re.IGNORECASE | re.DOTALL)
+    text = re.sub(r'^\s*Tip:.*$', '', text, flags=re.MULTILINE | re.IGNORECASE)
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip()
+
+
+def _bench_clean_noise(repeat: int) -> dict | None:
+    """실제 CHANGELOG.json의 raw_summary 전체에 대해 노이즈 제거 처리량 비교."""
+    snapshot = _read_snapshot()
+    if not snapshot:
+        return None
+    summaries = [r.get('raw_summary') or '' for r in snapshot.get('releases') or []]
+    total_bytes = sum(len(s.encode('utf-8')) for s in summaries)
+    mismatches = sum(1 for s in summaries if _clean_summary_noise_reference(s) != _clean_summary_noise(s))
+
+    def run(func) -> None:
+        for summary in summaries:
+            func(summary)
+
+    def run_cached() -> None:
+        _clean_summary_noise_cached.cache_clear()
+        run(_clean_summary_noise)
+
+    rows = {
+        'reference': _time_call(run, _clean_summary_noise_reference, repeat=repeat),
+        'precompiled': _time_call(run, _clean_summary_noise_cached.__wrapped__, repeat=repeat),
+        'cached': _time_call(run_cached, repeat=repeat),
+    }
+    base = rows['reference']
+    return {
+        'summaries': len(summaries),
+        'unique_summaries': len(set(summaries)),
+        'bytes': total_bytes,
+        'mismatches': mismatches,
+        'runs': {
+            label: {
+                'seconds': round(seconds, 6),
+                'mb_per_second': round(total_bytes / seconds / 1e6, 2) if seconds else None,
+                'speedup': round(base / seconds, 2) if seconds else None,
+            }
+            for label, seconds in rows.items()
+        },
+    }
+
+
+def cmd_bench(suite: str, max_mb: float, releases: int, repeat: int, output_path: str | None,
+              baseline_path: str | None = None, writers: int = 16) -> int:
+    """파서 처리량, 버전 인덱스 조회, Summary 노이즈 제거 성능과 동시 쓰기 안전성을 측정."""
+    report = {'python': sys.version.split()[0]}
+    exit_code = 0
+
+    if suite in ('parser', 'all'):
+        max_bytes = int(max_mb * 1024 * 1024)
+        print(f"⏱️ 파서 벤치마크 (최대 {max_bytes} bytes, {repeat}회 중 최솟값)")
+        report['parser_scaling'] = _bench_parser_scaling(max_bytes, repeat)
+
+        for style, result in report['parser_scaling'].items():
+            print(f"\n📊 {style}")
+            for row in result['runs']:
+                print(f"  - {row['bytes']:>9} bytes: {row['seconds']:.4f}s ({row['ns_per_byte']} ns/byte)")
+            print(f"  - 바이트당 시간 증가율 (4배 크기): x{result['ns_per_byte_growth']}")
+
+    if suite in ('corpus', 'all'):
+        max_bytes = int(max_mb * 1024 * 1024)
+        print(f"\n⏱️ 파서 코퍼스 벤치마크 ({CHANGELOG_JSON} raw_summary + 적대적 본문 {max_bytes} bytes)")
+        result = _bench_parser_corpus(max_bytes, repeat)
+        report['parser_corpus'] = result
+
+        for group, stats in result['groups'].items():
+            stages = ', '.join(f"{k} {v}" for k, v in stats['stages'].items())
+            print(f"\n📊 {group}: 입력 {stats['inputs']}개, {stats['bytes']} bytes (채택 단계: {stages})")
+            for name, row in stats['parsers'].items():
+                print(f"  - {name:<9}: {row['mb_per_second']} MB/s, 최악 {row['worst_seconds'] * 1000:.3f}ms ({row['worst_input']})")
+        for label, row in result['adversarial'].items():
+            print(f"  - {label}: {row['stage']} 단계 채택, 파이프라인 {row['seconds']['pipeline']:.4f}s")
+        if result['regressions']:
+            print(f"  ❌ 저장된 parsed_changes와 다른 결과: {', '.join(result['regressions'])}")
+        else:
+            print("  ✅ markdown 릴리즈 파싱 결과가 저장된 parsed_changes와 모두 일치")
+
+    if suite in ('fuzz', 'all'):
+        max_bytes = int(max_mb * 1024 * 1024)
+        print(f"\n⏱️ 선형성 퍼즈 (최대 {max_bytes}자, 크기 8배 기준 허용 증가율 x{_FUZZ_MAX_GROWTH})")
+        result = _bench_parser_fuzz(max_bytes, repeat)
+        report['parser_fuzz'] = result
+
+        for name, row in result['families'].items():
+            last = row['runs'][-1]
+            print(f"  - {name:<18}: 최악 {last['worst_seconds']:.4f}s ({last['ns_per_char']} ns/char), "
+                  f"증가율 x{row['ns_per_char_growth']}")
+        if result['linear']:
+            print(f"  ✅ 선형 (최대 증가율 x{result['worst_growth']}: {result['worst_family']})")
+        else:
+            print(f"  ❌ 선형이 아님: {result['worst_family']} x{result['worst_growth']}")
+            exit_code = 1
+        if result['clean_mismatches']:
+            print(f"  ❌ 노이즈 제거 결과가 기존 구현과 다름: {result['clean_mismatches']}건")
+            exit_code = 1
+
+    if suite in ('index', 'all'):
+        print(f"\n⏱️ 버전 인덱스 벤치마크 (합성 릴리즈 {releases}개)")
+        result = _bench_version_index(releases, repeat)
+        report['version_index'] = result
+
+        print(f"  - CHANGELOG.json: {result['json_bytes']} bytes, 인덱스: {result['index_bytes']} bytes")
+        print(f"  - 인덱스 생성 (generate-md 포함): {result['build_index_seconds']:.4f}s")
+        for label, row in result['lookups'].items():
+            print(f"  - {label} ({row['version']}): 전체 로드 {row['full_load_seconds']:.4f}s → "
+                  f"인덱스 {row['indexed_seconds']:.6f}s (x{row['speedup']})")
+
+    if suite in ('concurrency', 'all'):
+        print(f"\n⏱️ 동시 쓰기 스트레스 (update-from-summary {writers}개 + compact/generate-md 동시 실행)")
+        result = _bench_concurrent_updates(writers)
+        report['concurrency'] = result
+
+        print(f"  - 프로세스 {result['processes']}개: {result['seconds']:.2f}s, 실패 {result['failed_processes']}개")
+        print(f"  - 릴리즈 {result['releases']}개 (기대 {result['expected_releases']}개, "
+              f"metadata.totalReleases {result['total_releases_metadata']})")
+        problems = []
+        if result['failed_processes']:
+            problems.append(f"실패한 프로세스 {result['failed_processes']}개")
+        if result['lost']:
+            problems.append(f"유실 {', '.join(result['lost'])}")
+        if result['duplicates']:
+            problems.append(f"중복 {result['duplicates']}개")
+        if result['total_releases_metadata'] != result['releases']:
+            problems.append("metadata.totalReleases 불일치")
+        if result['missing_in_md']:
+            problems.append(f"CHANGELOG.md 누락 {', '.join(result['missing_in_md'])}")
+        if problems:
+            print(f"  ❌ {'; '.join(problems)}")
+            exit_code = 1
+        else:
+            print("  ✅ 유실/중복 없음")
+
+    if suite in ('clean', 'all'):
+        print(f"\n⏱️ Summary 노이즈 제거 벤치마크 ({CHANGELOG_JSON})")
+        result = _bench_clean_noise(repeat)
+        if result is None:
+            print(f"  ⚠️ {CHANGELOG_JSON}이 없어 건너뜁니다")
+        else:
+            report['clean_noise'] = result
+            print(f"  - raw_summary {result['summaries']}개 (고유 {result['unique_summaries']}개), "
+                  f"{result['bytes']} bytes, 결과 불일치 {result['mismatches']}개")
+            for label, row in result['runs'].items():
+                print(f"  - {label}: {row['seconds']:.6f}s ({row['mb_per_second']} MB/s, x{row['speedup']})")
+
+    if baseline_path:
+        _print_bench_baseline(report, baseline_path)
+
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n✅ 벤치마크 결과 저장: {output_path}")
+    return exit_code
+
+
+# ------------------------------- CLI -------------------------------
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='changelog_bench',
+        description='changelog_manager 파서/버전 인덱스/노이즈 제거 성능 및 동시 쓰기 측정',
+        add_help=True
+    )
+    parser.add_argument('--suite', choices=['parser', 'corpus', 'fuzz', 'index', 'concurrency', 'clean', 'all'],
+                        default='all', help='측정 대상')
+    parser.add_argument('--max-mb', type=float, default=1.0, help='합성 PR body 최대 크기 (MB)')
+    parser.add_argument('--releases', type=int, default=50000, help='인덱스 벤치마크용 합성 릴리즈 수')
+    parser.add_argument('--repeat', type=int, default=3, help='측정 반복 횟수')
+    parser.add_argument('--output', help='JSON 결과 파일 경로')
+    parser.add_argument('--baseline', help='비교할 이전 bench JSON 결과 경로')
+    parser.add_argument('--writers', type=int, default=16, help='동시 쓰기 스트레스에서 실행할 update-from-summary 수')
+
+    args = parser.parse_args(argv)
+    return cmd_bench(args.suite, args.max_mb, args.releases, args.repeat, args.output, args.baseline, args.writers)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,28 +5,192 @@ changelog_manager.py
 통합 체인지로그 매니저 스크립트.
 
 서브커맨드:
-  - update-from-summary: CodeRabbit Summary Markdown을 파싱하여 CHANGELOG.json 갱신
-  - generate-md        : CHANGELOG.json을 기반으로 CHANGELOG.md 재생성
-  - export             : 특정 버전의 릴리즈 노트를 생성하여 stdout 또는 파일로 저장
+  - update-from-summary: CodeRabbit Summary Markdown을 파싱하여 CHANGELOG 저널에 릴리즈 추가 (같은 버전/PR은 갱신)
+  - generate-md        : CHANGELOG.json(+저널)을 기반으로 CHANGELOG.md 재생성 (바뀐 릴리즈만 렌더링, --full로 전체)
+  - compact            : 저널을 합쳐 단일 CHANGELOG.json 스냅샷 재생성
+  - dedupe             : 같은 (버전, PR 번호)의 중복 릴리즈를 하나만 남기고 제거
+  - reparse            : 저장된 raw_summary(또는 PR body 디렉토리)를 병렬로 다시 파싱해 한 번에 병합
+  - stats              : CHANGELOG.json(+저널)을 스트리밍으로 읽어 릴리즈 통계 출력
+  - export             : 특정 버전(여러 개/범위/--all 가능)의 릴리즈 노트를 stdout 또는 파일로 저장
 
 사용 예:
   python3 changelog_manager.py update-from-summary
   python3 changelog_manager.py generate-md
+  python3 changelog_manager.py compact
+  python3 changelog_manager.py dedupe --dry-run
+  python3 changelog_manager.py reparse --dry-run
+  python3 changelog_manager.py reparse --input-dir pr_bodies/ --jobs 8
+  python3 changelog_manager.py stats --output stats.json
   python3 changelog_manager.py export --version 0.0.2 --output release_notes.txt
+  python3 changelog_manager.py export --version 1.10.80..1.10.97 --format json --output-dir notes/
+  python3 changelog_manager.py generate-md --metrics-json metrics.json
+
+모든 서브커맨드는 --metrics-json PATH로 구간별 소요 시간(load/parse/clean/render/write), 입출력 크기,
+채택된 파서 단계, 최대 메모리 사용량을 JSON으로 남길 수 있다.
 
 입력 파일:
   - pr_body.md: GitHub PR body (Markdown 형식)
+
+저장 파일:
+  - CHANGELOG.json         : 릴리즈 히스토리 스냅샷
+  - CHANGELOG.journal.jsonl: 스냅샷 이후 추가된 릴리즈 (append-only)
+  - CHANGELOG.index.tsv    : 버전별 바이트 위치 + CHANGELOG.md 블록 지문 인덱스 (커밋하지 않음, CI는 캐시)
+  - CHANGELOG.lock         : 동시 실행 직렬화용 잠금 파일 (커밋하지 않음)
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
+import hashlib
 import html
+import io
 import json
 import os
 import re
 import sys
+import tempfile
+import time
 import traceback
+from typing import NamedTuple
+
+# 선택: 설치되어 있으면 CHANGELOG.json 스트리밍에 사용 (없으면 순수 Python 파서)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# POSIX 전용: 체인지로그 파일 잠금 (없는 플랫폼에서는 잠그지 않고 동작)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# POSIX 전용: --metrics-json의 최대 메모리 사용량 (없으면 null로 기록)
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+# ----------------------------- 실행 지표 -----------------------------
+#
+# --metrics-json을 주면 로드/파싱/노이즈 제거/렌더링/쓰기 구간 시간, 입출력 크기, 채택된 파서 단계,
+# 최대 메모리 사용량을 모아 JSON으로 남긴다. 수집 중이 아닐 때는 각 지점이 바로 반환한다.
+# 구간은 같은 이름끼리만 중첩을 합치므로(예: 로드 안의 로드) 서로 다른 구간은 겹칠 수 있다.
+
+_metrics: dict | None = None
+_active_phases: set[str] = set()
+
+
+@contextlib.contextmanager
+def _timed(phase: str):
+    """with 블록 실행 시간을 phase 구간에 누적."""
+    if _metrics is None or phase in _active_phases:
+        yield
+        return
+    _active_phases.add(phase)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _active_phases.discard(phase)
+        seconds = _metrics['seconds']
+        seconds[phase] = seconds.get(phase, 0.0) + time.perf_counter() - start
+
+
+def _timed_phase(phase: str):
+    """함수 실행 시간을 phase 구간에 누적하는 데코레이터."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _metrics is None:
+                return func(*args, **kwargs)
+            with _timed(phase):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def _timed_iter(phase: str, iterable):
+    """이터레이터가 다음 값을 만드는 시간만 phase 구간에 누적 (소비하는 쪽 시간은 제외)."""
+    if _metrics is None:
+        yield from iterable
+        return
+    it = iter(iterable)
+    while True:
+        with _timed(phase):
+            try:
+                item = next(it)
+            except StopIteration:
+                return
+        yield item
+
+
+def _record_metric(key: str, value) -> None:
+    """지표 값 기록 (같은 키는 마지막 값)."""
+    if _metrics is not None:
+        _metrics[key] = value
+
+
+def _count_metric(key: str, name: str, amount: int = 1) -> None:
+    """지표 key 아래 name별 횟수/크기 누적."""
+    if _metrics is not None:
+        counts = _metrics.setdefault(key, {})
+        counts[name] = counts.get(name, 0) + amount
+
+
+def _peak_rss_bytes(who: int) -> int | None:
+    """getrusage 최대 RSS를 바이트로 (Linux는 KB, macOS는 바이트 단위로 보고)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _metric_files() -> dict:
+    """체인지로그 저장 파일 크기 (없으면 None)."""
+    return {path: _file_size(path) for path in
+            (CHANGELOG_JSON, CHANGELOG_JOURNAL, CHANGELOG_MD, CHANGELOG_INDEX)}
+
+
+def _start_metrics(command: str) -> None:
+    """지표 수집 시작."""
+    global _metrics
+    _active_phases.clear()
+    _metrics = {
+        'command': command,
+        'python': sys.version.split()[0],
+        'seconds': {},
+        'files_before': _metric_files(),
+        '_started': time.perf_counter(),
+    }
+
+
+def _finish_metrics(exit_code: int, path: str, error: str | None = None) -> None:
+    """
+    지표 수집을 끝내고 JSON으로 저장 (진행 메시지는 stdout 출력과 섞이지 않게 stderr로).
+
+    error: 서브커맨드가 예외로 끝났을 때 예외 요약 (정상 종료면 None)
+    """
+    global _metrics
+    metrics, _metrics = _metrics, None
+    if metrics is None:
+        return
+    total = time.perf_counter() - metrics.pop('_started')
+    seconds = {phase: round(value, 6) for phase, value in metrics['seconds'].items()}
+    metrics['seconds'] = {'total': round(total, 6), **seconds}
+    metrics['exit_code'] = exit_code
+    metrics['error'] = error
+    metrics['files_after'] = _metric_files()
+    metrics['peak_rss_bytes'] = _peak_rss_bytes(resource.RUSAGE_SELF) if resource else None
+    metrics['peak_rss_children_bytes'] = _peak_rss_bytes(resource.RUSAGE_CHILDREN) if resource else None
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(metrics, f, indent=2, ensure_ascii=False)
+    print(f"📈 실행 지표 저장: {path}", file=sys.stderr)
 
 
 # ----------------------------- 공통 유틸 -----------------------------
@@ -36,6 +200,111 @@ def _normalize_text(text: str) -> str:
     return html.unescape(text).strip()
 
 
+# Summary 노이즈 패턴. 앞 단계의 제거 결과가 다음 단계 매칭에 영향을 주므로
+# 하나의 정규식으로 합치지 않고 순서대로 적용한다.
+# `<!--.*?-->`, `<sub>.*?Tip:.*?</sub>`, `^\s*Tip:.*$`, `<[^>]+>`는 닫는 부분이 없는 입력에서
+# 시작 위치마다 끝까지 다시 훑어 O(n²)이 되므로 같은 결과를 내는 선형 스캐너로 대체한다.
+_TIP_MARK_RE = re.compile(r'tip:', re.IGNORECASE)
+_TIP_EMOJI_LINE_RE = re.compile(r'^.*?✏️\s*Tip:.*$', re.MULTILINE)
+_SUB_OPEN_RE = re.compile(r'<sub>', re.IGNORECASE)
+_SUB_CLOSE_RE = re.compile(r'</sub>', re.IGNORECASE)
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+
+def _remove_html_comments(text: str) -> str:
+    """`<!--.*?-->`(DOTALL) 제거. 닫는 `-->`가 없으면 이후에도 매치가 없으므로 바로 멈춘다."""
+    parts = []
+    pos = 0
+    while True:
+        start = text.find('<!--', pos)
+        if start == -1:
+            break
+        end = text.find('-->', start + 4)
+        if end == -1:
+            break
+        parts.append(text[pos:start])
+        pos = end + 3
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def _strip_html_tags(text: str) -> str:
+    """`<[^>]+>` 제거. `<` 다음의 첫 `>`까지가 태그이며 `<>`는 태그가 아니다."""
+    parts = []
+    pos = search = 0
+    while True:
+        start = text.find('<', search)
+        if start == -1:
+            break
+        end = text.find('>', start + 1)
+        if end == -1:
+            break
+        search = end + 1
+        if end > start + 1:
+            parts.append(text[pos:start])
+            pos = search
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def _remove_tip_sub_blocks(text: str) -> str:
+    """`<sub>.*?Tip:.*?</sub>`(IGNORECASE, DOTALL) 제거."""
+    parts = []
+    pos = 0
+    while True:
+        opening = _SUB_OPEN_RE.search(text, pos)
+        if not opening:
+            break
+        tip = _TIP_MARK_RE.search(text, opening.end())
+        closing = tip and _SUB_CLOSE_RE.search(text, tip.end())
+        if not closing:
+            break
+        parts.append(text[pos:opening.start()])
+        pos = closing.end()
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def _whitespace_run_start(text: str, end: int, floor: int) -> int:
+    """text[floor:end]에서 end 바로 앞 공백 구간의 시작 위치 (구간 길이에 비례하는 비용)."""
+    width = 64
+    while True:
+        lo = max(floor, end - width)
+        stripped = text[lo:end].rstrip()
+        if stripped or lo == floor:
+            return lo + len(stripped)
+        width *= 2
+
+
+def _remove_tip_lines(text: str) -> str:
+    """
+    `^\s*Tip:.*$`(MULTILINE, IGNORECASE) 제거.
+
+    `\s*`는 개행도 넘으므로 매치 시작은 `Tip:` 앞 공백 구간 안의 첫 줄 시작이다.
+    `Tip:`마다 앞쪽 공백 구간만 거꾸로 훑으면 되므로 전체가 선형이다.
+    """
+    parts = []
+    pos = search = 0
+    while True:
+        tip = _TIP_MARK_RE.search(text, search)
+        if not tip:
+            break
+        start = _whitespace_run_start(text, tip.start(), pos)
+        if start > 0 and text[start - 1] != '\n':
+            newline = text.find('\n', start, tip.start())
+            start = newline + 1 if newline != -1 else -1
+        if start == -1:
+            search = tip.start() + 1
+            continue
+        end = text.find('\n', tip.end())
+        end = len(text) if end == -1 else end
+        parts.append(text[pos:start])
+        pos = search = end
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+@_timed_phase('clean')
 def _clean_summary_noise(text: str) -> str:
     """
     Summary 텍스트에서 불필요한 노이즈 제거.
@@ -45,23 +314,38 @@ def _clean_summary_noise(text: str) -> str:
     2. CodeRabbit Tip 메시지
     3. 남은 HTML 태그
     4. 연속된 빈 줄
+
+    같은 raw_summary가 반복되는 경우가 많아 결과를 내용 기준으로 캐시한다.
     """
     if not text:
         return text
+    return _clean_summary_noise_cached(text)
+
+
+@functools.lru_cache(maxsize=1024)
+def _clean_summary_noise_cached(text: str) -> str:
+    """_clean_summary_noise 본체 (해당 문자가 없으면 그 단계는 건너뜀)."""
+    has_html = '<' in text
 
     # 1. HTML 주석 제거
-    text = re.sub(r'<!--.*?-->', '', text, flags=re.DOTALL)
+    if has_html:
+        text = _remove_html_comments(text)
 
     # 2. CodeRabbit Tip 줄 제거
-    text = re.sub(r'^.*?✏️\s*Tip:.*$', '', text, flags=re.MULTILINE)
-    text = re.sub(r'<sub>.*?Tip:.*?</sub>', '', text, flags=re.IGNORECASE | re.DOTALL)
-    text = re.sub(r'^\s*Tip:.*$', '', text, flags=re.MULTILINE | re.IGNORECASE)
+    if _TIP_MARK_RE.search(text):
+        if '✏️' in text:
+            text = _TIP_EMOJI_LINE_RE.sub('', text)
+        if has_html:
+            text = _remove_tip_sub_blocks(text)
+        text = _remove_tip_lines(text)
 
     # 3. 남은 HTML 태그 제거
-    text = re.sub(r'<[^>]+>', '', text)
+    if has_html:
+        text = _strip_html_tags(text)
 
     # 4. 연속된 빈 줄 정리 (3개 이상 → 2개)
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    if '\n\n\n' in text:
+        text = _BLANK_LINES_RE.sub('\n\n', text)
 
     return text.strip()
 
@@ -72,17 +356,124 @@ def _make_safe_key(title: str, idx: int) -> str:
     return safe_key if safe_key else f"category_{idx}"
 
 
+# ---------------------- Markdown 토크나이저 ----------------------
+
+class _SummaryLine(NamedTuple):
+    """토크나이저가 한 번 분류해 둔 PR body 한 줄."""
+    kind: str           # 'category' | 'item' | 'heading' | 'noise'
+    text: str           # 원본 줄 (개행 제외)
+    indent: int         # 앞쪽 공백 길이
+    end: int            # 뒤쪽 공백을 제외한 길이 (0이면 빈 줄)
+    bold: str | None    # 줄에서 처음 나온 **굵은 텍스트** (카테고리 후보)
+
+
+_BOLD_RE = re.compile(r'\*\*([^\*]+)\*\*')
+_LEADING_MARKER_RE = re.compile(r'^[\*\-\+\d\.]+\s*')
+_LIST_MARKERS = '*-+'
+
+
+def _classify_line(line: str) -> _SummaryLine:
+    """한 줄을 category / item / heading / noise 중 하나로 분류."""
+    stripped = line.strip()
+    end = len(line.rstrip())
+    indent = len(line) - len(line.lstrip()) if end else len(line)
+
+    if not stripped or stripped.startswith('<!--'):
+        return _SummaryLine('noise', line, indent, end, None)
+    if stripped.startswith('##'):
+        return _SummaryLine('heading', line, indent, end, None)
+
+    bold_match = _BOLD_RE.search(stripped)
+    if bold_match:
+        return _SummaryLine('category', line, indent, end, bold_match.group(1))
+    if line.startswith((' ', '\t')):
+        return _SummaryLine('item', line, indent, end, None)
+    return _SummaryLine('noise', line, indent, end, None)
+
+
+def _tokenize_summary(md_content: str) -> list[_SummaryLine]:
+    """PR body를 줄 단위로 한 번만 훑어 토큰 스트림으로 변환."""
+    return [_classify_line(line) for line in md_content.split('\n')]
+
+
+# 토큰 스트림 위의 위치는 (줄 번호, 열)로 표현한다.
+# 줄 끝(열 == len(text))은 개행 문자, 마지막 줄의 끝은 EOF에 해당한다.
+
+def _char_at(tokens: list[_SummaryLine], k: int, c: int) -> str:
+    """(k, c) 위치의 문자. 줄 끝은 '\\n', EOF는 빈 문자열."""
+    if k >= len(tokens):
+        return ''
+    text = tokens[k].text
+    if c < len(text):
+        return text[c]
+    return '\n' if k < len(tokens) - 1 else ''
+
+
+def _next_pos(tokens: list[_SummaryLine], k: int, c: int) -> tuple[int, int]:
+    """(k, c) 다음 문자 위치."""
+    if c < len(tokens[k].text):
+        return k, c + 1
+    return k + 1, 0
+
+
+def _skip_ws(tokens: list[_SummaryLine], k: int, c: int) -> tuple[int, int]:
+    """(k, c)부터 개행을 포함한 공백을 건너뛴 첫 비공백 문자 위치. EOF면 (len, 0)."""
+    n = len(tokens)
+    if k < n:
+        tok = tokens[k]
+        if c < tok.end:
+            if c <= tok.indent:
+                return k, tok.indent
+            return k, len(tok.text) - len(tok.text[c:].lstrip())
+        k += 1
+    while k < n and tokens[k].end == 0:
+        k += 1
+    if k >= n:
+        return n, 0
+    return k, tokens[k].indent
+
+
+def _line_start_after_ws(tokens: list[_SummaryLine], k: int, c: int) -> int:
+    """(k, c)에서 시작하는 공백 구간 안의 마지막 개행 바로 다음 줄 번호 (`\\s*\\n`의 위치)."""
+    k2, _ = _skip_ws(tokens, k, c)
+    return min(k2, len(tokens) - 1)
+
+
+def _with_expanded_tabs(tokens: list[_SummaryLine]) -> list[_SummaryLine]:
+    """탭을 공백 4칸으로 바꾼 토큰 스트림 (탭이 있는 줄만 다시 분류)."""
+    return [_classify_line(tok.text.replace('\t', '    ')) if '\t' in tok.text else tok for tok in tokens]
+
+
 # ----------------------- Markdown 파서 (통합) -----------------------
 
-def _parse_summary_markdown(md_content: str) -> dict:
+# update-from-summary에서 파서 단계 하나에 허용하는 시간 (초). 넘으면 다음 단계로 넘어간다.
+_STAGE_TIMEOUT_SECONDS = 5.0
+
+
+class _StageTimeout(Exception):
+    """파서 단계가 시간 예산을 넘김."""
+
+
+def _check_deadline(deadline: float | None) -> None:
+    """deadline(perf_counter 기준)이 지났으면 _StageTimeout."""
+    if deadline is not None and time.perf_counter() > deadline:
+        raise _StageTimeout
+
+
+@_timed_phase('parse')
+def _parse_summary_markdown(md_content: str, stage_timeout: float | None = None,
+                            timeouts: list[str] | None = None) -> dict:
     """
     Markdown 형식의 CodeRabbit Summary 파싱.
 
-    3단계 폴백 전략:
+    본문을 한 번 토큰화한 뒤 3단계 엄격도를 순서대로 적용:
     1. 정밀 파싱 (현재 CodeRabbit 형식)
     2. 관대한 파싱 (형식 변형 대응)
     3. 휴리스틱 파싱 (최후 수단)
 
+    stage_timeout(초)을 주면 단계마다 그 시간 안에 끝나지 않을 때 다음 단계로 넘어가고,
+    시간 초과된 단계 이름('precise' 등)을 timeouts에 추가한다.
+
     예상 형식:
     ## Summary by CodeRabbit
 
@@ -93,57 +484,242 @@ def _parse_summary_markdown(md_content: str) -> dict:
     * **Chores**
       * 버전 0.1.39로 업그레이드
     """
-    # 1단계: 정밀 파싱
-    detected = _parse_markdown_precise(md_content)
-    if detected:
-        print("  → 정밀 파서 성공")
-        return detected
-
-    # 2단계: 관대한 파싱
-    detected = _parse_markdown_lenient(md_content)
-    if detected:
-        print("  → 관대한 파서 성공")
-        return detected
-
-    # 3단계: 휴리스틱 파싱
-    detected = _parse_markdown_heuristic(md_content)
-    if detected:
-        print("  → 휴리스틱 파서 성공")
-    return detected
+    tokens = _tokenize_summary(md_content)
+
+    stages = (
+        ('precise', '정밀 파서', _parse_tokens_precise),
+        ('lenient', '관대한 파서', _parse_tokens_lenient),
+        ('heuristic', '휴리스틱 파서', _parse_tokens_heuristic),
+    )
+    for name, label, parse in stages:
+        deadline = time.perf_counter() + stage_timeout if stage_timeout else None
+        try:
+            detected = parse(tokens, deadline)
+        except _StageTimeout:
+            print(f"  ⏱️ {label} 시간 초과 ({stage_timeout}s), 다음 단계로 넘어감")
+            if timeouts is not None:
+                timeouts.append(name)
+            _count_metric('parser_timeouts', name)
+            continue
+        if detected:
+            print(f"  → {label} 성공")
+            _count_metric('parser_stages', name)
+            return detected
+    _count_metric('parser_stages', 'none')
+    return {}
 
 
 def _parse_markdown_precise(md_content: str) -> dict:
+    """정밀 파서 단독 실행 (토큰화 포함)."""
+    return _parse_tokens_precise(_tokenize_summary(md_content))
+
+
+def _parse_markdown_lenient(md_content: str) -> dict:
+    """관대한 파서 단독 실행 (토큰화 포함)."""
+    return _parse_tokens_lenient(_tokenize_summary(md_content))
+
+
+def _parse_markdown_heuristic(md_content: str) -> dict:
+    """휴리스틱 파서 단독 실행 (토큰화 포함)."""
+    return _parse_tokens_heuristic(_tokenize_summary(md_content))
+
+
+def _precise_header(tokens: list[_SummaryLine], k: int) -> tuple[str, int] | None:
+    """
+    k번째 줄에서 시작하는 `* **카테고리**` 헤더 탐색.
+
+    `*` 뒤 공백(개행 포함) 다음에 `**제목**`이 오고, 닫는 `**` 뒤로는
+    공백과 개행만 있어야 한다. 반환: (제목, 헤더가 끝나는 줄 번호)
+    """
+    n = len(tokens)
+    tok = tokens[k]
+    text, e = tok.text, tok.end
+    if not e or text[e - 1] != '*':
+        return None
+
+    i = text.find('*', 0, e)
+    while i != -1:
+        j = i + 1
+        while j < e and text[j].isspace():
+            j += 1
+        if j >= e:
+            # 줄 끝의 '*' → 다음 내용 줄 맨 앞의 '**제목**'과 이어질 수 있음
+            k2, c2 = _skip_ws(tokens, k + 1, 0)
+            if k2 < n - 1:
+                nxt = tokens[k2]
+                if nxt.text.startswith('**', c2) and nxt.end - 2 >= c2 + 3 and nxt.text.endswith('**', 0, nxt.end):
+                    return nxt.text[c2 + 2:nxt.end - 2], k2
+            return None
+        if k < n - 1 and text.startswith('**', j) and e - 2 >= j + 3 and text.endswith('**', 0, e):
+            return text[j + 2:e - 2], k
+        i = text.find('*', i + 1, e)
+    return None
+
+
+def _precise_item(tokens: list[_SummaryLine], k: int) -> tuple[str, int] | None:
+    """
+    k번째 줄 시작에서 `  * 항목` 하나 읽기.
+
+    공백 2칸(개행 포함) + `*` + 공백 1칸 이상 뒤의 줄 나머지가 항목 내용이다.
+    반환: (항목 내용, 다음 항목을 찾을 줄 번호)
+    """
+    n = len(tokens)
+    pos = (k, 0)
+    for _ in range(2):
+        ch = _char_at(tokens, *pos)
+        if not ch or not ch.isspace():
+            return None
+        pos = _next_pos(tokens, *pos)
+    if _char_at(tokens, *pos) != '*':
+        return None
+    pos = _next_pos(tokens, *pos)
+    ch = _char_at(tokens, *pos)
+    if not ch or not ch.isspace():
+        return None
+
+    k2, c2 = _skip_ws(tokens, *pos)
+    if k2 >= n:
+        # EOF까지 공백뿐 → 빈 항목으로 블록 종료
+        return '', n
+    return tokens[k2].text[c2:], k2 + 1
+
+
+def _parse_tokens_precise(tokens: list[_SummaryLine], deadline: float | None = None) -> dict:
     """
     정밀 파서: 현재 CodeRabbit 형식에 최적화.
 
-    형식: * **카테고리**\n  * 항목
+    형식: * **카테고리**\\n  * 항목
     """
     detected: dict[str, dict] = {}
+    n = len(tokens)
+    k = 0
+    idx = 0
+
+    while k < n:
+        _check_deadline(deadline)
+        header = _precise_header(tokens, k)
+        if header is None:
+            k += 1
+            continue
 
-    # 패턴: * **카테고리** (bold, 들여쓰기 2칸)
-    pattern = r'\*\s*\*\*(.+?)\*\*\s*\n((?:\s{2}\*\s+.+(?:\n|$))*)'
-    matches = re.findall(pattern, md_content, re.MULTILINE)
+        category_title, header_line = header
+        k, _ = _skip_ws(tokens, header_line + 1, 0)
+
+        items = []
+        while k < n:
+            _check_deadline(deadline)
+            item = _precise_item(tokens, k)
+            if item is None:
+                break
+            content, k = item
+            content = content.strip()
+            if content:
+                items.append(content)
 
-    for idx, (category_title, items_text) in enumerate(matches):
         category_title = category_title.strip()
+        if category_title or items:
+            safe_key = _make_safe_key(category_title, idx)
+            detected[safe_key] = {
+                'title': category_title,
+                'items': items,
+            }
+        idx += 1
 
-        # 항목 추출: "  * 항목 내용"
-        items = re.findall(r'\s{2}\*\s+(.+)', items_text)
-        items = [item.strip() for item in items if item.strip()]
+    return detected
 
-        if not category_title and not items:
-            continue
 
-        safe_key = _make_safe_key(category_title, idx)
-        detected[safe_key] = {
-            'title': category_title,
-            'items': items,
-        }
+def _lenient_title_at(tokens: list[_SummaryLine], j: int, c: int) -> tuple[str, int] | None:
+    """
+    (j, c)에서 시작하는 관대한 파서의 카테고리 제목 판별.
 
-    return detected
+    제목은 `*`와 개행을 포함하지 않으며, 뒤에는 선택적인 `**`와
+    공백, 개행이 와야 한다. 반환: (제목, 항목 블록이 시작되는 줄 번호)
+    """
+    n = len(tokens)
+    text = tokens[j].text
+    star = text.find('*', c)
+    if star == -1:
+        if j >= n - 1 or c >= len(text):
+            return None
+        u = max(c + 1, len(text[c:].rstrip()) + c)
+        return text[c:u], _line_start_after_ws(tokens, j, u)
 
+    if star == c or j >= n - 1 or not text.startswith('**', star) or star + 2 < tokens[j].end:
+        return None
+    return text[c:star], _line_start_after_ws(tokens, j, star + 2)
 
-def _parse_markdown_lenient(md_content: str) -> dict:
+
+def _lenient_header(tokens: list[_SummaryLine], k: int) -> tuple[str, int] | None:
+    """
+    k번째 줄 맨 앞의 리스트 마커(`*`, `-`, `+`)로 시작하는 카테고리 헤더 탐색.
+
+    마커 뒤 공백이 개행을 넘어갈 수 있으므로 제목이 다음 줄에 있을 수도 있다.
+    반환: (제목, 항목 블록이 시작되는 줄 번호)
+    """
+    n = len(tokens)
+    text = tokens[k].text
+    if not text or text[0] not in _LIST_MARKERS:
+        return None
+
+    ks, cs = _skip_ws(tokens, k, 1)
+    if ks < n:
+        line = tokens[ks].text
+        if line.startswith('**', cs):
+            found = _lenient_title_at(tokens, ks, cs + 2)
+            if found:
+                return found
+        if line[cs] != '*':
+            found = _lenient_title_at(tokens, ks, cs)
+        elif cs > (1 if ks == k else 0):
+            # 제목 앞 공백을 제목으로 되돌려 보는 경우 (같은 줄)
+            found = _lenient_title_at(tokens, ks, cs - 1)
+        else:
+            found = None
+        if found:
+            return found
+        if ks == k:
+            return None
+
+    # 이전 줄 끝의 공백 한 칸이 제목이 되는 경우
+    last = min(ks, n - 1)
+    for j in range(last - 1, k - 1, -1):
+        length = len(tokens[j].text)
+        if length > (1 if j == k else 0):
+            return tokens[j].text[length - 1], last
+    return None
+
+
+def _lenient_item(tokens: list[_SummaryLine], k: int) -> tuple[str, int] | None:
+    """
+    k번째 줄 시작에서 관대한 파서의 항목 하나 읽기.
+
+    공백 1~8칸(개행 포함) + 리스트 마커 + 공백 1칸 이상 뒤의 줄 나머지가 항목 내용이다.
+    반환: (항목 내용, 항목 내용이 끝나는 줄 번호)
+    """
+    n = len(tokens)
+    pos = (k, 0)
+    width = 0
+    while width <= 8:
+        ch = _char_at(tokens, *pos)
+        if not ch or not ch.isspace():
+            break
+        width += 1
+        pos = _next_pos(tokens, *pos)
+    marker = _char_at(tokens, *pos)
+    if not 1 <= width <= 8 or not marker or marker not in _LIST_MARKERS:
+        return None
+    pos = _next_pos(tokens, *pos)
+    ch = _char_at(tokens, *pos)
+    if not ch or not ch.isspace():
+        return None
+
+    k2, c2 = _skip_ws(tokens, *pos)
+    if k2 >= n:
+        return '', n
+    return tokens[k2].text[c2:], k2
+
+
+def _parse_tokens_lenient(tokens: list[_SummaryLine], deadline: float | None = None) -> dict:
     """
     관대한 파서: 형식 변형에 대응.
 
@@ -152,37 +728,47 @@ def _parse_markdown_lenient(md_content: str) -> dict:
     - bold 선택적 (**제목** 또는 제목)
     - 다양한 리스트 마커 (*, -, +)
     """
-    content = md_content.replace('\t', '    ')
+    tokens = _with_expanded_tabs(tokens)
     detected: dict[str, dict] = {}
+    n = len(tokens)
+    k = 0
+    idx = 0
+
+    while k < n:
+        _check_deadline(deadline)
+        header = _lenient_header(tokens, k)
+        if header is None:
+            k += 1
+            continue
 
-    # 패턴: 카테고리 + 중첩 항목
-    pattern = r'(?:^|\n)([\*\-\+])\s*(\*\*)?([^\*\n]+?)(\*\*)?\s*\n((?:(?:^|\n)\s{1,8}[\*\-\+]\s+.+)*)'
-    matches = re.findall(pattern, content, re.MULTILINE)
+        category_title, k = header
+        items = []
+        while k < n:
+            _check_deadline(deadline)
+            item = _lenient_item(tokens, k)
+            if item is None:
+                break
+            content, last_line = item
+            content = content.strip()
+            if content:
+                items.append(content)
+            k = last_line + 1
 
-    for idx, (marker, bold_start, category_title, bold_end, items_text) in enumerate(matches):
         category_title = category_title.strip()
 
-        # 항목 추출
-        items = re.findall(r'(?:^|\n)\s{1,8}[\*\-\+]\s+(.+)', items_text, re.MULTILINE)
-        items = [item.strip() for item in items if item.strip()]
-
-        if not category_title and not items:
-            continue
-
         # 너무 긴 제목은 카테고리가 아님
-        if len(category_title) > 100:
-            continue
-
-        safe_key = _make_safe_key(category_title, idx)
-        detected[safe_key] = {
-            'title': category_title,
-            'items': items,
-        }
+        if (category_title or items) and len(category_title) <= 100:
+            safe_key = _make_safe_key(category_title, idx)
+            detected[safe_key] = {
+                'title': category_title,
+                'items': items,
+            }
+        idx += 1
 
     return detected
 
 
-def _parse_markdown_heuristic(md_content: str) -> dict:
+def _parse_tokens_heuristic(tokens: list[_SummaryLine], deadline: float | None = None) -> dict:
     """
     휴리스틱 파서: 줄 단위로 카테고리/항목 추론.
 
@@ -190,21 +776,14 @@ def _parse_markdown_heuristic(md_content: str) -> dict:
     1. Bold 텍스트(**...**) → 카테고리
     2. 들여쓰기 있는 줄 → 항목
     """
-    lines = md_content.split('\n')
     detected: dict[str, dict] = {}
     current_key = None
 
-    for line in lines:
-        stripped = line.strip()
-
-        if not stripped or stripped.startswith('<!--') or stripped.startswith('##'):
-            continue
-
+    for tok in tokens:
+        _check_deadline(deadline)
         # Bold 텍스트 → 카테고리
-        bold_match = re.search(r'\*\*([^\*]+)\*\*', stripped)
-        if bold_match:
-            title = bold_match.group(1).strip()
-            title = re.sub(r'^[\*\-\+\d\.]+\s*', '', title).strip()
+        if tok.kind == 'category':
+            title = _LEADING_MARKER_RE.sub('', tok.bold.strip()).strip()
 
             if title and len(title) < 100:
                 current_key = _make_safe_key(title, len(detected))
@@ -212,9 +791,9 @@ def _parse_markdown_heuristic(md_content: str) -> dict:
             continue
 
         # 들여쓰기 있는 줄 → 항목
-        if line.startswith((' ', '\t')) and stripped:
-            item = re.sub(r'^[\*\-\+\d\.]+\s*', '', stripped).strip()
-            item = re.sub(r'<[^>]+>', '', item).strip()
+        if tok.kind == 'item':
+            item = _LEADING_MARKER_RE.sub('', tok.text.strip()).strip()
+            item = _strip_html_tags(item).strip()
 
             if current_key and item and len(item) > 3:
                 detected[current_key]['items'].append(item)
@@ -223,10 +802,892 @@ def _parse_markdown_heuristic(md_content: str) -> dict:
     return {k: v for k, v in detected.items() if v.get('items')}
 
 
+# ------------------------- 체인지로그 저장소 -------------------------
+#
+# CHANGELOG.json          : 압축된 스냅샷 (releases는 최신순)
+# CHANGELOG.journal.jsonl : 스냅샷 이후 추가된 릴리즈 (한 줄에 한 릴리즈, 오래된 순)
+#
+# 새 릴리즈는 저널 끝에 한 줄만 추가하고, `compact`가 둘을 합쳐 스냅샷을 다시 쓴다.
+# 릴리즈는 (버전, PR 번호)로 식별하며, 이미 있는 키의 저널 레코드는 기존 릴리즈를 대체한다(upsert).
+#
+# 파일 전체를 다시 쓸 때는 임시 파일 → fsync → rename으로 교체하므로 중간에 죽어도 잘린 파일이
+# 남지 않는다. 읽고-고쳐-쓰는 서브커맨드는 CHANGELOG.lock 잠금으로 직렬화된다.
+
+CHANGELOG_JSON = 'CHANGELOG.json'
+CHANGELOG_MD = 'CHANGELOG.md'
+CHANGELOG_JOURNAL = 'CHANGELOG.journal.jsonl'
+CHANGELOG_LOCK = 'CHANGELOG.lock'
+
+_LOCK_TIMEOUT_SECONDS = 300.0
+_LOCK_POLL_SECONDS = 0.05
+
+_SNAPSHOT_HEAD_BYTES = 64 * 1024
+
+
+_lock_depth = 0
+
+
+@contextlib.contextmanager
+def _changelog_lock(shared: bool = False, timeout: float = _LOCK_TIMEOUT_SECONDS):
+    """
+    CHANGELOG.lock에 대한 advisory 잠금 (flock). shared=True면 읽기 전용 공유 잠금.
+
+    같은 프로세스 안에서는 중첩해 잡을 수 있고 바깥 잠금을 그대로 쓴다.
+    timeout 안에 잠금을 얻지 못하면 TimeoutError.
+    """
+    global _lock_depth
+    if fcntl is None or _lock_depth:
+        _lock_depth += 1
+        try:
+            yield
+        finally:
+            _lock_depth -= 1
+        return
+
+    fd = os.open(CHANGELOG_LOCK, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout
+        mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        while True:
+            try:
+                fcntl.flock(fd, mode | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"{CHANGELOG_LOCK} 잠금 대기 시간 초과 ({timeout:.0f}s)")
+                time.sleep(_LOCK_POLL_SECONDS)
+        _lock_depth += 1
+        try:
+            yield
+        finally:
+            _lock_depth -= 1
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _with_changelog_lock(shared: bool = False):
+    """서브커맨드 전체를 체인지로그 잠금 안에서 실행. 잠금을 얻지 못하면 실패(1) 반환."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                with _changelog_lock(shared):
+                    return func(*args, **kwargs)
+            except TimeoutError as e:
+                print(f"❌ {func.__name__} 실패: {e}")
+                return 1
+        return wrapper
+    return decorate
+
+
+def _empty_changelog(timestamp: str | None, version: str | None, project_type: str | None) -> dict:
+    """빈 체인지로그 구조 생성."""
+    return {
+        "metadata": {
+            "lastUpdated": timestamp,
+            "currentVersion": version,
+            "projectType": project_type,
+            "totalReleases": 0,
+        },
+        "releases": [],
+    }
+
+
+@_timed_phase('load')
+def _read_snapshot(path: str = CHANGELOG_JSON) -> dict | None:
+    """스냅샷 전체 로드. 없거나 깨졌으면 None."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _read_snapshot_metadata(path: str = CHANGELOG_JSON) -> dict | None:
+    """
+    스냅샷 앞부분만 읽어 metadata 추출.
+
+    metadata는 파일 맨 앞에 기록되므로 releases 전체를 파싱할 필요가 없다.
+    앞부분에서 찾지 못하면 전체 로드로 폴백한다.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            head = f.read(_SNAPSHOT_HEAD_BYTES)
+    except FileNotFoundError:
+        return None
+
+    m = re.match(r'\s*\{\s*"metadata"\s*:\s*', head)
+    if m:
+        try:
+            metadata, _ = json.JSONDecoder().raw_decode(head, m.end())
+            return metadata
+        except json.JSONDecodeError:
+            pass
+
+    snapshot = _read_snapshot(path)
+    return snapshot.get('metadata') if snapshot else None
+
+
+def _iter_journal(path: str = CHANGELOG_JOURNAL):
+    """
+    저널 레코드를 오래된 순으로 순회. 깨진 줄은 경고 후 건너뜀.
+
+    Yields: (바이트 오프셋, 바이트 길이, 레코드)
+    """
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return
+    with f:
+        offset = 0
+        for line_no, line in enumerate(f, 1):
+            length = len(line)
+            if line.strip():
+                try:
+                    yield offset, length, json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    print(f"⚠️ {path}:{line_no} 손상된 저널 레코드 무시")
+            offset += length
+
+
+def _read_last_journal_record(path: str = CHANGELOG_JOURNAL) -> dict | None:
+    """저널 마지막 레코드만 파일 끝에서 거꾸로 읽어 반환."""
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return None
+    with f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        tail = b''
+        while pos > 0:
+            step = min(4096, pos)
+            pos -= step
+            f.seek(pos)
+            tail = f.read(step) + tail
+            body = tail.rstrip(b'\r\n')
+            newline = body.rfind(b'\n')
+            if newline != -1:
+                return json.loads(body[newline + 1:])
+        body = tail.strip()
+        return json.loads(body) if body else None
+
+
+def _current_metadata() -> dict | None:
+    """저널 마지막 레코드 또는 스냅샷에서 현재 metadata 조회 (히스토리 크기와 무관)."""
+    try:
+        record = _read_last_journal_record()
+    except json.JSONDecodeError:
+        # 마지막 줄이 깨졌으면 전체를 읽어 계산
+        return _load_changelog().get('metadata')
+    if record:
+        return record.get('metadata')
+    return _read_snapshot_metadata()
+
+
+def _release_key(release: dict) -> tuple[str, int | None]:
+    """upsert 기준 키: (버전, PR 번호)."""
+    return str(release.get("version")), release.get("pr_number")
+
+
+def _release_hash(release: dict) -> str:
+    """릴리즈 내용 해시 (키 순서와 무관)."""
+    return hashlib.sha1(json.dumps(release, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+@_timed_phase('write')
+def _append_release(new_release: dict, timestamp: str | None, version: str | None,
+                    project_type: str | None, replaces: bool = False) -> dict:
+    """
+    릴리즈를 저널에 한 줄 추가하고 갱신된 metadata 반환.
+
+    replaces=True면 같은 (버전, PR 번호)의 기존 릴리즈를 대체하는 레코드이므로 totalReleases를 늘리지 않는다.
+    """
+    metadata = dict(_current_metadata() or _empty_changelog(timestamp, version, project_type)["metadata"])
+    metadata["lastUpdated"] = timestamp
+    metadata["currentVersion"] = version
+    metadata["projectType"] = project_type
+    metadata["totalReleases"] = (metadata.get("totalReleases") or 0) + (0 if replaces else 1)
+
+    record = {"metadata": metadata, "release": new_release}
+    line = (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+    offset = _file_size(CHANGELOG_JOURNAL) or 0
+    with open(CHANGELOG_JOURNAL, 'a+b') as f:
+        if offset:
+            f.seek(offset - 1)
+            if f.read(1) != b'\n':
+                # 이전 추가가 중간에 끊겨 잘린 줄이 남았으면 새 레코드가 그 줄에 붙지 않도록 끊는다
+                f.write(b'\n')
+                offset += 1
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+    _count_metric('written_bytes', CHANGELOG_JOURNAL, len(line))
+
+    _index_journal_append(new_release.get("version"), offset, len(line))
+    return metadata
+
+
+def _merge_journal(snapshot: dict | None, records) -> dict:
+    """
+    스냅샷에 저널 레코드를 합쳐 CHANGELOG.json과 같은 구조로 반환.
+
+    새 키의 릴리즈는 맨 앞에 추가하고, 이미 있는 키는 그 자리의 릴리즈를 대체한다.
+    스냅샷에 같은 키가 여러 번 있으면(dedupe 이전 히스토리) 앞쪽(최신) 릴리즈가 대상이다.
+    """
+    data = snapshot or _empty_changelog(None, None, None)
+    releases = data.setdefault("releases", [])
+
+    positions: dict[tuple, int] | None = None  # 저널 레코드가 있을 때만 만드는 (버전, PR 번호) → 스냅샷 위치
+    appended: dict[tuple, dict] = {}
+    for record in records:
+        release = record.get("release") or {}
+        key = _release_key(release)
+        if positions is None:
+            positions = {}
+            for i, existing in enumerate(releases):
+                positions.setdefault(_release_key(existing), i)
+        if key in positions and key not in appended:
+            releases[positions[key]] = release
+        else:
+            appended[key] = release
+        if record.get("metadata"):
+            data["metadata"] = record["metadata"]
+
+    if appended:
+        data["releases"] = list(reversed(appended.values())) + releases
+    _record_metric('releases', len(data["releases"]))
+    return data
+
+
+@_timed_phase('load')
+def _load_changelog() -> dict:
+    """스냅샷과 저널을 합쳐 CHANGELOG.json과 같은 구조로 반환."""
+    return _merge_journal(_read_snapshot(), (record for _, _, record in _iter_journal()))
+
+
+@_timed_phase('load')
+def _load_changelog_indexed() -> tuple[dict, dict]:
+    """
+    _load_changelog와 같지만 읽는 동안 릴리즈별 바이트 위치도 수집.
+
+    Returns:
+        (체인지로그 데이터, {파일 경로: {버전: [오프셋, 길이]}})
+    """
+    snapshot, snapshot_entries = _scan_snapshot()
+
+    records = []
+    journal_entries: dict[str, list[int]] = {}
+    for offset, length, record in _iter_journal():
+        records.append(record)
+        version = (record.get("release") or {}).get("version")
+        if version is not None:
+            # 같은 버전이 여러 번 있으면 가장 최근 레코드가 우선
+            journal_entries[str(version)] = [offset, length]
+
+    entries = {CHANGELOG_JSON: snapshot_entries, CHANGELOG_JOURNAL: journal_entries}
+    return _merge_journal(snapshot, records), entries
+
+
+def _fsync_directory(directory: str) -> None:
+    """rename으로 바뀐 디렉토리 항목을 디스크에 반영 (디렉토리를 열 수 없는 플랫폼은 건너뜀)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@_timed_phase('write')
+def _replace_file(path: str, chunks) -> None:
+    """
+    같은 디렉토리의 임시 파일에 기록하고 fsync한 뒤 한 번에 교체.
+
+    중간에 프로세스가 죽어도 기존 파일은 그대로 남고, 읽는 쪽은 항상 완성된 파일만 본다.
+    기존 파일의 권한은 유지한다 (새 파일은 0644).
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.writelines(chunks)
+            f.flush()
+            os.fsync(f.fileno())
+            _count_metric('written_bytes', path, f.tell())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _fsync_directory(directory)
+
+
+def _write_snapshot(data: dict, path: str = CHANGELOG_JSON) -> None:
+    """스냅샷을 기존 CHANGELOG.json 형식(indent=2)으로 기록."""
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    _replace_file(path, (chunk.encode('utf-8') for chunk in encoder.iterencode(data)))
+
+
+# --------------------------- 스트리밍 리더 ---------------------------
+#
+# releases를 한 번에 하나씩 디코딩해 넘겨주므로 히스토리 크기와 상관없이
+# 메모리에는 릴리즈 하나와 읽기 버퍼만 남는다. ijson이 설치되어 있으면 사용하고,
+# 없으면 json.JSONDecoder.raw_decode 기반의 순수 Python 파서를 쓴다.
+
+_STREAM_CHUNK_CHARS = 64 * 1024
+_STREAM_BACKENDS = ('auto', 'python', 'ijson')
+
+_JSON_WS_RE = re.compile(r'[ \t\n\r]*')
+
+
+def _iter_snapshot_releases_python(f, chunk_size: int = _STREAM_CHUNK_CHARS):
+    """최상위 객체의 releases 배열 원소를 순서대로 yield (다른 키의 값은 디코딩 후 버림)."""
+    decoder = json.JSONDecoder()
+    buf = ''
+    pos = 0
+    eof = False
+
+    def fill(min_chars: int) -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = f.read(max(chunk_size, min_chars))
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def peek() -> str:
+        nonlocal pos
+        while True:
+            pos = _JSON_WS_RE.match(buf, pos).end()
+            if pos < len(buf):
+                return buf[pos]
+            if not fill(0):
+                return ''
+
+    def expect(char: str) -> None:
+        nonlocal pos
+        if peek() != char:
+            raise json.JSONDecodeError(f"'{char}' 필요", buf, pos)
+        pos += 1
+
+    def value():
+        nonlocal pos
+        while True:
+            peek()
+            try:
+                result, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                # 값이 버퍼 밖으로 이어짐: 남은 길이만큼 더 읽어 버퍼를 두 배로 키운 뒤 재시도
+                if not fill(len(buf) - pos):
+                    raise
+                continue
+            # 버퍼 끝에서 끝난 숫자는 잘렸을 수 있으므로 더 읽고 다시 디코딩
+            if end == len(buf) and fill(0):
+                continue
+            pos = end
+            return result
+
+    expect('{')
+    if peek() == '}':
+        return
+    while True:
+        key = value()
+        expect(':')
+        if key == 'releases' and peek() == '[':
+            pos += 1
+            if peek() != ']':
+                while True:
+                    yield value()
+                    if peek() != ',':
+                        break
+                    pos += 1
+            expect(']')
+        else:
+            value()
+        if peek() != ',':
+            break
+        pos += 1
+    expect('}')
+
+
+def _stream_backend(backend: str = 'auto') -> str:
+    """사용할 스트리밍 백엔드 이름 결정 (ijson이 없으면 python)."""
+    if backend in ('auto', 'ijson') and IJSON_AVAILABLE:
+        return 'ijson'
+    if backend == 'ijson':
+        print("⚠️ ijson이 설치되어 있지 않아 순수 Python 파서를 사용합니다 (설치: pip install ijson)")
+    return 'python'
+
+
+def _iter_snapshot_releases(path: str = CHANGELOG_JSON, backend: str = 'auto'):
+    """
+    스냅샷 releases를 파일 순서(최신순)대로 하나씩 순회. 파일이 없으면 아무것도 yield하지 않음.
+
+    중간에 멈추면 파일은 바로 닫히므로 원하는 버전을 찾은 뒤 순회를 끝내도 된다.
+    """
+    try:
+        if _stream_backend(backend) == 'ijson':
+            f = open(path, 'rb')
+        else:
+            f = open(path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        return
+    with f:
+        if isinstance(f, io.TextIOBase):
+            yield from _iter_snapshot_releases_python(f)
+        else:
+            yield from ijson.items(f, 'releases.item', use_float=True)
+
+
+def _iter_releases(backend: str = 'auto'):
+    """
+    저널과 스냅샷의 릴리즈를 순회 (저널 오래된 순 → 스냅샷 최신순).
+
+    _merge_journal과 같은 upsert 규칙을 따른다: 저널에서 같은 (버전, PR 번호)는 마지막 레코드만,
+    스냅샷에서는 저널이 대체한 릴리즈(키별 첫 번째)를 건너뛴다. 같은 버전의 다른 PR 간
+    우선순위는 호출하는 쪽에서 정한다: 저널은 나중 레코드, 스냅샷은 앞쪽 릴리즈가 우선.
+    Yields: (저널 여부, 릴리즈)
+    """
+    journal: dict[tuple, dict] = {}
+    for _, _, record in _timed_iter('load', _iter_journal()):
+        release = record.get("release") or {}
+        journal[_release_key(release)] = release
+    for release in journal.values():
+        yield True, release
+
+    replaced = set(journal)
+    for release in _timed_iter('load', _iter_snapshot_releases(backend=backend)):
+        if isinstance(release, dict):
+            key = _release_key(release)
+            if key in replaced:
+                replaced.discard(key)
+                continue
+            yield False, release
+
+
+def _stream_find_release(version: str, backend: str = 'auto') -> dict | None:
+    """_load_changelog 없이 버전 조회. 저널은 끝까지, 스냅샷은 찾는 즉시 멈춘다."""
+    version = str(version)
+    matched = None
+    for from_journal, release in _iter_releases(backend):
+        if not from_journal and matched is not None:
+            break
+        if str(release.get('version')) == version:
+            matched = release
+            if not from_journal:
+                break
+    return matched
+
+
+def _iter_md_sections(path: str = CHANGELOG_MD):
+    """
+    CHANGELOG.md를 줄 단위로 읽어 `## [버전]` 섹션을 순서대로 순회.
+
+    Yields: (버전, 헤더 줄 끝부터 다음 `## [` 직전까지의 본문)
+    """
+    try:
+        f = open(path, 'r', encoding='utf-8')
+    except FileNotFoundError:
+        return
+    with f:
+        version = None
+        body: list[str] = []
+        for line in f:
+            if line.startswith('## ['):
+                if version is not None:
+                    yield version, ''.join(body)
+                version = line[4:line.index(']')] if ']' in line else None
+                body = ['\n'] if line.endswith('\n') else []
+            elif version is not None:
+                body.append(line)
+        if version is not None:
+            yield version, ''.join(body)
+
+
+# --------------------------- 버전 인덱스 ---------------------------
+#
+# CHANGELOG.index.tsv: 버전 → 각 파일 안의 (바이트 오프셋, 길이)
+#
+#   # changelog-index v1
+#   @<파일 경로>\t<인덱스 생성 시점의 파일 크기>
+#   <파일 경로>\t<버전>\t<오프셋>\t<길이>
+#   ...
+#   CHANGELOG.journal.jsonl\t<버전>\t<오프셋>\t<길이>   ← update-from-summary가 끝에 덧붙임
+#   @CHANGELOG.journal.jsonl\t<덧붙인 뒤의 저널 크기>
+#
+# update-from-summary는 인덱스를 다시 쓰지 않고 저널 항목과 새 저널 크기 줄만 끝에 덧붙인다.
+# 끝의 `@` 줄은 머리글의 저널 크기보다 우선하며, generate-md/compact가 인덱스를 새로 쓸 때 정리된다.
+# 조회는 항목 줄을 파싱하지 않고 바이트 검색으로 한 줄만 찾는다.
+# 파일 크기가 인덱스에 기록된 크기와 같을 때만 인덱스를 신뢰하고,
+# 읽은 조각의 버전까지 확인한다. 어긋나면 전체 로드로 폴백한다.
+
+CHANGELOG_INDEX = 'CHANGELOG.index.tsv'
+
+# CHANGELOG.md의 릴리즈 블록 지문 → (오프셋, 길이). generate-md가 바뀌지 않은 블록을 재사용할 때 사용
+_MD_BLOCKS_KEY = f"{CHANGELOG_MD}#blocks"
+
+_INDEX_MAGIC = b'# changelog-index v1\n'
+
+
+def _scan_snapshot(path: str = CHANGELOG_JSON) -> tuple[dict | None, dict]:
+    """
+    스냅샷을 한 번 읽으면서 releases 각 원소의 바이트 위치를 기록.
+
+    Returns:
+        (스냅샷 데이터 또는 None, {버전: [오프셋, 길이]})
+    """
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        text = raw.decode('utf-8')
+        data, spans = _decode_snapshot_with_spans(text)
+    except FileNotFoundError:
+        return None, {}
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None, {}
+
+    entries: dict[str, list[int]] = {}
+    ascii_only = len(raw) == len(text)
+    byte_pos = 0
+    char_pos = 0
+    for release, start, end in spans:
+        if ascii_only:
+            byte_start, byte_len = start, end - start
+        else:
+            byte_pos += len(text[char_pos:start].encode('utf-8'))
+            byte_start = byte_pos
+            byte_len = len(text[start:end].encode('utf-8'))
+            byte_pos += byte_len
+            char_pos = end
+        version = release.get('version') if isinstance(release, dict) else None
+        if version is not None:
+            # 같은 버전이 여러 번 있으면 앞쪽(최신) 릴리즈가 우선
+            entries.setdefault(str(version), [byte_start, byte_len])
+    return data, entries
+
+
+def _decode_snapshot_with_spans(text: str) -> tuple[dict, list]:
+    """최상위 객체를 디코딩하며 releases 원소별 (값, 시작, 끝) 문자 위치 반환."""
+    decoder = json.JSONDecoder()
+    spans = []
+
+    def skip(pos: int) -> int:
+        return _JSON_WS_RE.match(text, pos).end()
+
+    def expect(pos: int, char: str) -> int:
+        if text[pos:pos + 1] != char:
+            raise json.JSONDecodeError(f"'{char}' 필요", text, pos)
+        return skip(pos + 1)
+
+    data = {}
+    pos = expect(skip(0), '{')
+    if text[pos:pos + 1] == '}':
+        return data, spans
+
+    while True:
+        key, pos = decoder.raw_decode(text, pos)
+        pos = expect(skip(pos), ':')
+        if key == 'releases' and text[pos:pos + 1] == '[':
+            releases = []
+            pos = skip(pos + 1)
+            if text[pos:pos + 1] != ']':
+                while True:
+                    start = pos
+                    value, pos = decoder.raw_decode(text, pos)
+                    releases.append(value)
+                    spans.append((value, start, pos))
+                    pos = skip(pos)
+                    if text[pos:pos + 1] != ',':
+                        break
+                    pos = skip(pos + 1)
+            pos = expect(pos, ']')
+            data[key] = releases
+        else:
+            data[key], pos = decoder.raw_decode(text, pos)
+            pos = skip(pos)
+
+        if text[pos:pos + 1] != ',':
+            break
+        pos = skip(pos + 1)
+
+    expect(pos, '}')
+    return data, spans
+
+
+def _read_index() -> tuple[dict, bytes]:
+    """
+    인덱스 파일 로드.
+
+    Returns:
+        ({파일 경로: 인덱스 생성 시점의 파일 크기}, 항목 줄 본문) — 없거나 깨졌으면 ({}, b'')
+    """
+    try:
+        with open(CHANGELOG_INDEX, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return {}, b''
+    if not raw.startswith(_INDEX_MAGIC):
+        return {}, b''
+
+    sizes = {}
+    pos = len(_INDEX_MAGIC)
+    try:
+        while raw.startswith(b'@', pos):
+            end = raw.index(b'\n', pos)
+            path, size = raw[pos + 1:end].decode('utf-8').split('\t')
+            sizes[path] = None if size == '-' else int(size)
+            pos = end + 1
+    except ValueError:
+        return {}, b''
+    if CHANGELOG_JOURNAL in sizes:
+        sizes[CHANGELOG_JOURNAL] = _appended_journal_size(raw[pos - 1:], sizes[CHANGELOG_JOURNAL])
+    # 항목 검색 키가 '\n'으로 시작하므로 직전 개행을 포함해 반환
+    return sizes, raw[pos - 1:]
+
+
+def _appended_journal_size(tail: bytes, header_size: int | None) -> int | None:
+    """
+    인덱스 끝에 덧붙은 `@저널\t크기` 줄이 있으면 그 크기, 없으면 머리글 크기.
+
+    마지막 줄이 개행으로 끝나지 않으면(덧붙이다 끊김) None을 반환해 저널 항목을 신뢰하지 않게 한다.
+    """
+    if not tail.endswith(b'\n'):
+        return None if tail.strip() else header_size
+    key = f"\n@{CHANGELOG_JOURNAL}\t".encode('utf-8')
+    pos = tail.rfind(key)
+    if pos == -1:
+        return header_size
+    start = pos + len(key)
+    try:
+        return int(tail[start:tail.index(b'\n', start)])
+    except ValueError:
+        return None
+
+
+def _write_index(sizes: dict, lines: list[bytes]) -> None:
+    """인덱스 파일 기록. lines는 `경로\t버전\t오프셋\t길이` 형식."""
+    header = [f"@{path}\t{'-' if size is None else size}\n".encode('utf-8') for path, size in sizes.items()]
+    _replace_file(CHANGELOG_INDEX, [_INDEX_MAGIC, *header, *(line + b'\n' for line in lines)])
+
+
+def _index_lines(path: str, entries: dict) -> list[bytes]:
+    """{버전: [오프셋, 길이]}를 인덱스 항목 줄로 변환."""
+    return [f"{path}\t{version}\t{offset}\t{length}".encode('utf-8')
+            for version, (offset, length) in entries.items()]
+
+
+def _file_size(path: str) -> int | None:
+    """파일 크기 (없으면 None). `파일#이름` 형식의 보조 항목은 앞쪽 파일 기준."""
+    try:
+        return os.path.getsize(path.split('#', 1)[0])
+    except OSError:
+        return None
+
+
+def _update_index(file_entries: dict) -> None:
+    """{파일 경로: {버전: [오프셋, 길이]}}를 현재 파일 크기와 함께 인덱스에 반영."""
+    sizes, body = _read_index()
+    # 끝에 덧붙은 `@저널` 크기 줄은 머리글(sizes)에 반영되었으므로 버림
+    prefixes = tuple(f"{path}\t".encode('utf-8') for path in file_entries) + (b'@',)
+    lines = [line for line in body.split(b'\n') if line and not line.startswith(prefixes)]
+    for path, entries in file_entries.items():
+        sizes[path] = _file_size(path)
+        lines.extend(_index_lines(path, entries))
+    _write_index(sizes, lines)
+
+
+def _indexed_journal_size() -> int | None:
+    """
+    인덱스가 기록한 저널 크기. 인덱스 파일의 앞(머리글)과 끝(마지막 줄)만 읽는다.
+
+    인덱스가 없거나, 저널 항목이 없거나, 마지막 줄이 끊겼으면 None.
+    """
+    try:
+        with open(CHANGELOG_INDEX, 'rb') as f:
+            head = f.read(4096)
+            end = f.seek(0, os.SEEK_END)
+            f.seek(max(0, end - 4096))
+            tail = f.read()
+    except FileNotFoundError:
+        return None
+    if not head.startswith(_INDEX_MAGIC):
+        return None
+
+    header_size = None
+    key = f"@{CHANGELOG_JOURNAL}\t".encode('utf-8')
+    for line in head[len(_INDEX_MAGIC):].split(b'\n'):
+        if not line.startswith(b'@'):
+            break
+        if line.startswith(key):
+            value = line[len(key):]
+            try:
+                # 저널이 없을 때 기록된 '-'는 크기 0과 같음 (첫 레코드는 오프셋 0에 추가됨)
+                header_size = 0 if value == b'-' else int(value)
+            except ValueError:
+                return None
+    if header_size is None:
+        return None
+    return _appended_journal_size(b'\n' + tail, header_size)
+
+
+def _index_journal_append(version: str | None, offset: int, length: int) -> None:
+    """
+    저널에 한 줄을 추가한 직후 인덱스 끝에 저널 항목과 새 저널 크기를 덧붙임 (인덱스가 최신일 때만).
+
+    인덱스 파일을 다시 쓰지 않으므로 쓰는 양이 히스토리 크기와 무관하다.
+    """
+    if _indexed_journal_size() != offset:
+        return
+    lines = []
+    if version is not None:
+        # 같은 버전이 다시 추가되면 뒤쪽 줄이 우선 (저널 조회는 rfind)
+        lines.extend(_index_lines(CHANGELOG_JOURNAL, {str(version): [offset, length]}))
+    lines.append(f"@{CHANGELOG_JOURNAL}\t{offset + length}".encode('utf-8'))
+    chunk = b''.join(line + b'\n' for line in lines)
+    with open(CHANGELOG_INDEX, 'ab') as f:
+        f.write(chunk)
+        f.flush()
+        os.fsync(f.fileno())
+    _count_metric('written_bytes', CHANGELOG_INDEX, len(chunk))
+
+
+def _indexed_span(sizes: dict, body: bytes, path: str, version: str, last: bool = False) -> list[int] | None:
+    """
+    인덱스에서 (오프셋, 길이) 조회.
+
+    Returns:
+        [오프셋, 길이], 인덱스 기준으로 없는 버전이면 [], 인덱스가 낡았으면 None
+    """
+    if path not in sizes or sizes[path] != _file_size(path):
+        return None
+    key = f"\n{path}\t{version}\t".encode('utf-8')
+    pos = body.rfind(key) if last else body.find(key)
+    if pos == -1:
+        return []
+    start = pos + len(key)
+    end = body.find(b'\n', start)
+    offset, length = body[start:end if end != -1 else len(body)].split(b'\t')
+    return [int(offset), int(length)]
+
+
+def _indexed_entries(sizes: dict, body: bytes, path: str) -> dict | None:
+    """인덱스에서 한 파일의 {키: [오프셋, 길이]} 전체 조회. 인덱스가 낡았으면 None."""
+    if path not in sizes or sizes[path] != _file_size(path):
+        return None
+    prefix = f"{path}\t".encode('utf-8')
+    entries = {}
+    for line in body.split(b'\n'):
+        if line.startswith(prefix):
+            key, offset, length = line[len(prefix):].decode('utf-8').split('\t')
+            entries[key] = [int(offset), int(length)]
+    return entries
+
+
+def _read_span(path: str, offset: int, length: int) -> bytes:
+    """파일의 [offset, offset + length) 구간만 읽기."""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        return f.read(length)
+
+
+@_timed_phase('load')
+def _find_release(version: str) -> dict | None:
+    """
+    버전에 해당하는 릴리즈 조회.
+
+    인덱스가 최신이면 해당 릴리즈 조각만 읽고, 아니면 스트리밍으로 순회하며 찾는다.
+    """
+    version = str(version)
+    sizes, body = _read_index()
+    # 저널은 같은 버전이 다시 추가될 수 있으므로 가장 마지막 항목, 스냅샷은 맨 앞(최신) 항목
+    journal_span = _indexed_span(sizes, body, CHANGELOG_JOURNAL, version, last=True)
+    snapshot_span = _indexed_span(sizes, body, CHANGELOG_JSON, version)
+
+    if journal_span is not None and snapshot_span is not None:
+        for path, span, is_record in ((CHANGELOG_JOURNAL, journal_span, True),
+                                      (CHANGELOG_JSON, snapshot_span, False)):
+            if not span:
+                continue
+            try:
+                value = json.loads(_read_span(path, *span))
+            except (OSError, ValueError):
+                break
+            release = value.get('release') if is_record and isinstance(value, dict) else value
+            if isinstance(release, dict) and str(release.get('version')) == version:
+                return release
+            break
+        else:
+            # 두 파일 모두 인덱스 기준으로 해당 버전이 없음
+            return None
+
+    return _stream_find_release(version)
+
+
+@_timed_phase('load')
+def _stored_release(version: str | None, pr_number: int | None) -> dict | None:
+    """
+    (버전, PR 번호)로 저장된 릴리즈 조회 (upsert 판단용).
+
+    버전 인덱스로 찾은 릴리즈의 PR 번호가 같으면 바로 반환하고, 같은 버전의 다른 PR이면
+    전체를 순회하며 찾는다. 버전 자체가 없으면 히스토리를 읽지 않는다.
+    """
+    key = (str(version), pr_number)
+    release = _find_release(str(version))
+    if release is None or _release_key(release) == key:
+        return release
+    return next((r for _, r in _iter_releases() if _release_key(r) == key), None)
+
+
+@_timed_phase('load')
+def _find_md_section(version: str) -> str | None:
+    """
+    CHANGELOG.md에서 `## [버전]` 헤더 아래 본문 조회.
+
+    인덱스가 최신이면 해당 블록만 읽고, 아니면 줄 단위로 읽으며 찾는다.
+    """
+    version = str(version)
+    header_re = re.compile(rf"^## \[{re.escape(version)}\].*$", re.MULTILINE)
+
+    span = _indexed_span(*_read_index(), CHANGELOG_MD, version)
+    if span is not None:
+        if not span:
+            return None
+        try:
+            block = _read_span(CHANGELOG_MD, *span).decode('utf-8')
+        except (OSError, UnicodeDecodeError):
+            block = ''
+        m = header_re.match(block)
+        if m:
+            return block[m.end():]
+
+    return next((body for ver, body in _iter_md_sections() if ver == version), None)
+
+
 # ------------------------ 서브커맨드 구현부 ------------------------
 
-def cmd_update_from_summary() -> int:
-    """pr_body.md에서 Markdown을 파싱하여 CHANGELOG.json 갱신."""
+@_with_changelog_lock()
+def cmd_update_from_summary(stage_timeout: float | None = _STAGE_TIMEOUT_SECONDS) -> int:
+    """
+    pr_body.md에서 Markdown을 파싱하여 CHANGELOG 저널에 릴리즈 추가.
+
+    파서 단계가 stage_timeout을 넘기면 다음 단계로 넘어가고, 넘긴 단계를 parse_method에 남긴다
+    (예: `markdown:timeout=precise`). 0이나 None이면 시간 제한 없음.
+    """
     version = os.environ.get('VERSION')
     project_type = os.environ.get('PROJECT_TYPE')
     today = os.environ.get('TODAY')
@@ -255,12 +1716,16 @@ def cmd_update_from_summary() -> int:
 
         print(f"📄 입력 파일: {input_file}")
         print(f"📝 파일 크기: {len(content)} bytes")
+        _count_metric('input_bytes', input_file, _file_size(input_file) or 0)
 
         # Markdown 파싱 (통합)
         print("\n🔍 Markdown 파싱 시작...")
-        categories = _parse_summary_markdown(content)
+        timeouts: list[str] = []
+        categories = _parse_summary_markdown(content, stage_timeout, timeouts)
 
         parse_method = 'markdown' if categories else 'markdown_failed'
+        if timeouts:
+            parse_method += f":timeout={'+'.join(timeouts)}"
         if categories:
             print(f"✅ 파싱 성공: {len(categories)}개 카테고리")
         else:
@@ -290,31 +1755,18 @@ def cmd_update_from_summary() -> int:
             items_count = len(value.get('items', []))
             print(f"    • {title}: {items_count}개 항목")
 
-        # CHANGELOG.json 업데이트
-        try:
-            with open('CHANGELOG.json', 'r', encoding='utf-8') as f:
-                changelog_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            changelog_data = {
-                "metadata": {
-                    "lastUpdated": timestamp,
-                    "currentVersion": version,
-                    "projectType": project_type,
-                    "totalReleases": 0,
-                },
-                "releases": [],
-            }
-
-        changelog_data["metadata"]["lastUpdated"] = timestamp
-        changelog_data["metadata"]["currentVersion"] = version
-        changelog_data["metadata"]["projectType"] = project_type
-        changelog_data["metadata"]["totalReleases"] = len(changelog_data.get("releases", [])) + 1
-        changelog_data.setdefault("releases", []).insert(0, new_release)
-
-        with open('CHANGELOG.json', 'w', encoding='utf-8') as f:
-            json.dump(changelog_data, f, indent=2, ensure_ascii=False)
-
-        print("\n✅ CHANGELOG.json 업데이트 완료!")
+        # 같은 (버전, PR 번호)가 이미 있으면 upsert: 내용이 같으면 건너뛰고, 다르면 대체 레코드 추가
+        existing = _stored_release(version, pr_number)
+        if existing is not None and _release_hash(existing) == _release_hash(new_release):
+            print(f"\nℹ️ 같은 내용의 릴리즈({version}, PR #{pr_number})가 이미 기록되어 있어 건너뜁니다")
+            return 0
+
+        # 저널에 릴리즈 추가 (기존 히스토리는 읽거나 다시 쓰지 않음)
+        metadata = _append_release(new_release, timestamp, version, project_type, replaces=existing is not None)
+        if existing is not None:
+            print(f"\n🔁 기존 릴리즈({version}, PR #{pr_number}) 갱신")
+        print(f"\n📚 전체 릴리즈: {metadata['totalReleases']}개")
+        print(f"✅ {CHANGELOG_JOURNAL} 업데이트 완료!")
         return 0
 
     except Exception as e:
@@ -323,66 +1775,137 @@ def cmd_update_from_summary() -> int:
         return 1
 
 
-def cmd_generate_md() -> int:
-    """CHANGELOG.json을 기반으로 CHANGELOG.md 재생성."""
-    try:
-        with open('CHANGELOG.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
+_MD_RENDER_VERSION = 1  # _render_release_block 출력 형식이 바뀌면 올려서 기존 블록 재사용을 막는다
 
-        with open('CHANGELOG.md', 'w', encoding='utf-8') as f:
-            f.write("# Changelog\n\n")
 
-            metadata = data.get('metadata', {})
-            current_version = metadata.get('currentVersion', 'Unknown')
-            last_updated = metadata.get('lastUpdated', 'Unknown')
+@_timed_phase('render')
+def _render_md_header(metadata: dict) -> str:
+    """CHANGELOG.md 상단 (제목 + 현재 버전 정보) 렌더링."""
+    current_version = metadata.get('currentVersion', 'Unknown')
+    last_updated = metadata.get('lastUpdated', 'Unknown')
+    return (
+        "# Changelog\n\n"
+        f"**현재 버전:** {current_version}  \n"
+        f"**마지막 업데이트:** {last_updated}  \n\n"
+        "---\n\n"
+    )
 
-            f.write(f"**현재 버전:** {current_version}  \n")
-            f.write(f"**마지막 업데이트:** {last_updated}  \n\n")
-            f.write("---\n\n")
 
-            for release in data.get('releases', []):
-                version = release.get('version', 'Unknown')
-                date = release.get('date', 'Unknown')
-                pr_number = release.get('pr_number')
+@_timed_phase('render')
+def _render_release_block(release: dict) -> str:
+    """릴리즈 하나를 `## [버전] - 날짜`부터 구분선까지의 Markdown 블록으로 렌더링."""
+    version = release.get('version', 'Unknown')
+    date = release.get('date', 'Unknown')
+    pr_number = release.get('pr_number')
+
+    parts = [f"## [{version}] - {date}\n\n"]
+
+    if pr_number is not None:
+        parts.append(f"**PR:** #{pr_number}  \n\n")
+
+    parsed = release.get('parsed_changes') or {}
+
+    if parsed:
+        # 구조화된 데이터 출력
+        for _, items in parsed.items():
+            if not items:
+                continue
+            if isinstance(items, dict) and 'items' in items:
+                actual_items = items.get('items') or []
+                title = items.get('title') or ''
+            else:
+                actual_items = items
+                title = _normalize_text(_)
+
+            parts.append(f"**{title}**\n")
+            for item in actual_items:
+                parts.append(f"- {item}\n")
+            parts.append("\n")
+    else:
+        # 파싱 실패 시 raw_summary 출력
+        raw_summary = release.get('raw_summary', '').strip()
+        if raw_summary:
+            raw_summary = _clean_summary_noise(raw_summary)
+            if raw_summary:
+                parts.append(raw_summary + "\n\n")
+            else:
+                parts.append("*변경사항 정보 없음*\n\n")
+        else:
+            parts.append("*변경사항 정보 없음*\n\n")
 
-                f.write(f"## [{version}] - {date}\n\n")
+    parts.append("---\n\n")
+    return ''.join(parts)
 
-                if pr_number is not None:
-                    f.write(f"**PR:** #{pr_number}  \n\n")
 
-                parsed = release.get('parsed_changes') or {}
+def _release_fingerprint(release: dict) -> str:
+    """릴리즈 블록 렌더링 입력의 지문 (렌더러 버전 포함)."""
+    payload = json.dumps(release, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(f"{_MD_RENDER_VERSION}\n{payload}".encode('utf-8')).hexdigest()
+
+
+@_timed_phase('load')
+def _load_md_blocks() -> tuple[bytes, dict]:
+    """
+    재사용 가능한 기존 CHANGELOG.md 블록 로드.
+
+    Returns:
+        (기존 CHANGELOG.md 바이트, {지문: [오프셋, 길이]}) — 인덱스가 낡았으면 (b'', {})
+    """
+    blocks = _indexed_entries(*_read_index(), _MD_BLOCKS_KEY)
+    if not blocks:
+        return b'', {}
+    try:
+        with open(CHANGELOG_MD, 'rb') as f:
+            return f.read(), blocks
+    except OSError:
+        return b'', {}
 
-                if parsed:
-                    # 구조화된 데이터 출력
-                    for _, items in parsed.items():
-                        if not items:
-                            continue
-                        if isinstance(items, dict) and 'items' in items:
-                            actual_items = items.get('items') or []
-                            title = items.get('title') or ''
-                        else:
-                            actual_items = items
-                            title = _normalize_text(_)
 
-                        f.write(f"**{title}**\n")
-                        for item in actual_items:
-                            f.write(f"- {item}\n")
-                        f.write("\n")
+@_with_changelog_lock()
+def cmd_generate_md(full: bool = False) -> int:
+    """
+    CHANGELOG.json(+저널)을 기반으로 CHANGELOG.md 재생성하고 버전 인덱스 갱신.
+
+    기본은 증분 모드: 지문이 같은 릴리즈는 기존 CHANGELOG.md의 블록을 그대로 재사용하고
+    새로 추가되었거나 바뀐 릴리즈만 렌더링한다. full=True면 전체를 다시 렌더링한다.
+    """
+    try:
+        data, file_entries = _load_changelog_indexed()
+        old_md, old_blocks = (b'', {}) if full else _load_md_blocks()
+
+        chunks = [_render_md_header(data.get('metadata', {})).encode('utf-8')]
+        offset = len(chunks[0])
+        md_entries: dict[str, list[int]] = {}
+        block_entries: dict[str, list[int]] = {}
+        reused = 0
+
+        for release in data.get('releases', []):
+            fingerprint = _release_fingerprint(release)
+            block = None
+            span = old_blocks.get(fingerprint)
+            if span:
+                block = old_md[span[0]:span[0] + span[1]]
+                if block.startswith(b'## ['):
+                    reused += 1
                 else:
-                    # 파싱 실패 시 raw_summary 출력
-                    raw_summary = release.get('raw_summary', '').strip()
-                    if raw_summary:
-                        raw_summary = _clean_summary_noise(raw_summary)
-                        if raw_summary:
-                            f.write(raw_summary + "\n\n")
-                        else:
-                            f.write("*변경사항 정보 없음*\n\n")
-                    else:
-                        f.write("*변경사항 정보 없음*\n\n")
-
-                f.write("---\n\n")
-
-        print("✅ CHANGELOG.md 재생성 완료!")
+                    block = None
+            if block is None:
+                block = _render_release_block(release).encode('utf-8')
+
+            # 같은 버전이 여러 번 있으면 앞쪽(최신) 블록이 우선
+            md_entries.setdefault(str(release.get('version', 'Unknown')), [offset, len(block)])
+            block_entries.setdefault(fingerprint, [offset, len(block)])
+            chunks.append(block)
+            offset += len(block)
+
+        _replace_file(CHANGELOG_MD, chunks)
+
+        file_entries[CHANGELOG_MD] = md_entries
+        file_entries[_MD_BLOCKS_KEY] = block_entries
+        _update_index(file_entries)
+
+        rendered = len(chunks) - 1 - reused
+        print(f"✅ CHANGELOG.md 재생성 완료! (재사용 {reused}개, 렌더링 {rendered}개)")
         return 0
 
     except Exception as e:
@@ -391,65 +1914,515 @@ def cmd_generate_md() -> int:
         return 1
 
 
-def cmd_export_release_notes(version: str, output_path: str | None) -> int:
-    """CHANGELOG에서 해당 버전 릴리즈 노트를 생성."""
-    notes_text = ""
-
-    # 1) CHANGELOG.json 시도
-    try:
-        if os.path.isfile('CHANGELOG.json'):
-            with open('CHANGELOG.json', 'r', encoding='utf-8') as f:
-                changelog = json.load(f)
-            releases = changelog.get('releases') or []
-            matched = next((r for r in releases if str(r.get('version')) == str(version)), None)
-            if matched:
-                header = f"버전 {matched.get('version')} 업데이트\n\n"
-                parsed_changes = matched.get('parsed_changes') or {}
-                if parsed_changes:
-                    category_blocks: list[str] = []
-                    for _, value in parsed_changes.items():
-                        title = (value.get('title') or '').strip()
-                        items = [it for it in (value.get('items') or []) if it]
-                        if title and items:
-                            block = "**" + title + "**\n" + "\n".join("- " + it for it in items)
-                            category_blocks.append(block)
-                    body = "\n\n".join(category_blocks) if category_blocks else (matched.get('raw_summary') or '').strip()
-                else:
-                    body = (matched.get('raw_summary') or '').strip()
-                notes_text = (header + (body or "")).strip()
+_EXPORT_FORMATS = {'text': 'txt', 'json': 'json', 'md': 'md'}
+_FALLBACK_NOTES = "앱 안정성 및 사용자 경험이 개선되었습니다."
+
+
+def _version_key(version: str) -> tuple:
+    """버전 문자열 정렬 키 (`1.10.9` < `1.10.80`)."""
+    return tuple(int(part) if part.isdigit() else 0 for part in re.findall(r'\d+|[^\d.]+', str(version)))
+
+
+def _release_notes_body(release: dict) -> str:
+    """릴리즈의 스토어용 본문 (카테고리 블록, 없으면 raw_summary)."""
+    parsed_changes = release.get('parsed_changes') or {}
+    category_blocks: list[str] = []
+    for _, value in parsed_changes.items():
+        title = (value.get('title') or '').strip()
+        items = [it for it in (value.get('items') or []) if it]
+        if title and items:
+            category_blocks.append("**" + title + "**\n" + "\n".join("- " + it for it in items))
+    if category_blocks:
+        return "\n\n".join(category_blocks)
+    return (release.get('raw_summary') or '').strip()
+
+
+def _release_notes_text(release: dict) -> str:
+    """CHANGELOG.json 릴리즈로 만든 릴리즈 노트 (형식이 맞지 않으면 빈 문자열)."""
+    try:
+        header = f"버전 {release.get('version')} 업데이트\n\n"
+        return (header + (_release_notes_body(release) or "")).strip()
     except Exception:
-        pass
+        return ""
+
+
+@_timed_phase('render')
+def _render_release_notes(version: str, release: dict | None, md_section: str | None, fmt: str) -> str:
+    """
+    한 버전의 릴리즈 노트를 지정 형식으로 렌더링.
+
+    CHANGELOG.json(+저널) 릴리즈 → CHANGELOG.md 섹션 → 기본 문구 순으로 내용을 고른다.
+    """
+    notes_text = _release_notes_text(release) if release else ""
+    source = 'json'
+    if not notes_text and md_section is not None:
+        notes_text = (f"버전 {version} 업데이트\n\n" + md_section.strip()).strip()
+        source = 'md'
+    if not notes_text:
+        notes_text = f"버전 {version} 업데이트\n{_FALLBACK_NOTES}"
+        source = 'fallback'
+
+    if fmt == 'json':
+        payload = {
+            "version": version,
+            "date": (release or {}).get('date'),
+            "pr_number": (release or {}).get('pr_number'),
+            "source": source,
+            "notes": notes_text,
+        }
+        return json.dumps(payload, ensure_ascii=False, indent=2)
+    if fmt == 'md':
+        if source == 'json':
+            return _render_release_block(release).rstrip().removesuffix('---').rstrip() + "\n"
+        body = md_section.strip() if source == 'md' else _FALLBACK_NOTES
+        return f"## [{version}]\n\n{body}\n"
+    return notes_text
+
+
+def _export_version_matcher(specs: list[str], export_all: bool):
+    """
+    `--version` 값들로 (직접 지정한 버전 목록, 버전 포함 여부 함수) 생성.
 
-    # 2) CHANGELOG.md 폴백
-    if not notes_text and os.path.isfile('CHANGELOG.md'):
+    `A..B`는 A 이상 B 이하(양끝 포함, 한쪽 생략 가능)의 기록된 버전을 뜻한다.
+    """
+    explicit: list[str] = []
+    ranges: list[tuple] = []
+    for spec in specs:
+        spec = spec.strip()
+        if '..' in spec:
+            low, high = (part.strip() for part in spec.split('..', 1))
+            ranges.append((_version_key(low) if low else None, _version_key(high) if high else None))
+        elif spec:
+            explicit.append(spec)
+    explicit = list(dict.fromkeys(explicit))
+    explicit_set = set(explicit)
+
+    def matches(version: str) -> bool:
+        if export_all or version in explicit_set:
+            return True
+        key = _version_key(version)
+        return any((low is None or key >= low) and (high is None or key <= high) for low, high in ranges)
+
+    return explicit, matches
+
+
+def _export_single(version: str, output_path: str | None, fmt: str) -> int:
+    """버전 하나: 인덱스로 해당 릴리즈/섹션만 읽어 출력."""
+    release = None
+    md_section = None
+    try:
+        release = _find_release(version)
+    except Exception:
+        pass
+    if not release or not _release_notes_text(release):
         try:
-            with open('CHANGELOG.md', 'r', encoding='utf-8') as f:
-                md = f.read()
-            pattern = re.compile(rf"^## \[{re.escape(str(version))}\].*$", re.MULTILINE)
-            m = pattern.search(md)
-            if m:
-                start = m.end()
-                next_m = re.search(r"^## \\[", md[start:], re.MULTILINE)
-                section = md[start: start + next_m.start()] if next_m else md[start:]
-                body = section.strip()
-                notes_text = (f"버전 {version} 업데이트\n\n" + body).strip()
+            md_section = _find_md_section(version)
         except Exception:
             pass
 
-    # 3) 최종 폴백
-    if not notes_text:
-        notes_text = f"버전 {version} 업데이트\n앱 안정성 및 사용자 경험이 개선되었습니다."
-
+    notes_text = _render_release_notes(version, release, md_section, fmt)
     if output_path:
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with _timed('write'), open(output_path, 'w', encoding='utf-8') as f:
             f.write(notes_text)
+        _count_metric('written_bytes', output_path, len(notes_text.encode('utf-8')))
     else:
         sys.stdout.write(notes_text + "\n")
     return 0
 
 
+@_with_changelog_lock(shared=True)
+def cmd_export_release_notes(versions: list[str] | None, output_path: str | None, export_all: bool = False,
+                             fmt: str = 'text', output_dir: str | None = None) -> int:
+    """
+    CHANGELOG에서 릴리즈 노트를 생성.
+
+    버전 하나면 기존처럼 stdout/--output으로, 여러 버전·범위·--all이면
+    CHANGELOG.json과 CHANGELOG.md를 한 번씩 스트리밍하며 output_dir에 버전별 파일로 저장한다.
+    """
+    versions = versions or []
+    if not export_all and len(versions) == 1 and '..' not in versions[0] and not output_dir:
+        return _export_single(versions[0].strip(), output_path, fmt)
+
+    if not export_all and not versions:
+        print("❌ --version 또는 --all 중 하나가 필요합니다", file=sys.stderr)
+        return 1
+    if output_path and not output_dir:
+        print("❌ 여러 버전을 내보낼 때는 --output 대신 --output-dir을 사용하세요", file=sys.stderr)
+        return 1
+
+    explicit, matches = _export_version_matcher(versions, export_all)
+    output_dir = output_dir or 'release_notes'
+    ext = _EXPORT_FORMATS[fmt]
+    written: set[str] = set()
+
+    def write(version: str, release: dict | None, md_section: str | None) -> None:
+        if not written:
+            os.makedirs(output_dir, exist_ok=True)
+        notes_text = _render_release_notes(version, release, md_section, fmt)
+        file_name = version.replace(os.sep, '_') + '.' + ext
+        with _timed('write'), open(os.path.join(output_dir, file_name), 'w', encoding='utf-8') as f:
+            f.write(notes_text)
+        _count_metric('written_bytes', output_dir, len(notes_text.encode('utf-8')))
+        written.add(version)
+
+    # 1) CHANGELOG.json(+저널)을 스트리밍하며 버전별 우선 릴리즈를 바로 기록
+    #    (저널은 나중 레코드, 스냅샷은 앞쪽 릴리즈 우선 → 저널 매칭만 모아 둔다)
+    claimed: set[str] = set()
+    deferred: dict[str, dict] = {}  # JSON 내용으로 노트를 만들 수 없어 MD 섹션이 필요한 릴리즈
+
+    def claim(version: str, release: dict) -> None:
+        if version in claimed:
+            return
+        claimed.add(version)
+        if _release_notes_text(release):
+            write(version, release, None)
+        else:
+            deferred[version] = release
+
+    try:
+        journal_matches: dict[str, dict] = {}
+        for from_journal, release in _iter_releases():
+            version = release.get('version')
+            if version is None or not matches(str(version)):
+                continue
+            if from_journal:
+                journal_matches[str(version)] = release
+                continue
+            if journal_matches:
+                for journal_version, journal_release in journal_matches.items():
+                    claim(journal_version, journal_release)
+                journal_matches.clear()
+            claim(str(version), release)
+        for journal_version, journal_release in journal_matches.items():
+            claim(journal_version, journal_release)
+    except Exception as e:
+        print(f"⚠️ {CHANGELOG_JSON} 읽기 실패, {CHANGELOG_MD}로 계속합니다: {e}")
+
+    # 2) 아직 기록하지 못한 버전은 CHANGELOG.md 섹션으로
+    try:
+        for version, body in _iter_md_sections():
+            if version not in written and matches(version):
+                write(version, deferred.pop(version, None), body)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"⚠️ {CHANGELOG_MD} 읽기 실패: {e}")
+
+    # 3) 어디에도 없는 버전은 기본 문구로
+    for version, release in deferred.items():
+        if version not in written:
+            write(version, release, None)
+    for version in explicit:
+        if version not in written:
+            write(version, None, None)
+
+    if not written:
+        print("⚠️ 내보낼 버전이 없습니다")
+        return 0
+    print(f"✅ 릴리즈 노트 {len(written)}개 내보내기 완료 → {output_dir}/")
+    return 0
+
+
+def _rewrite_snapshot(data: dict) -> None:
+    """병합된 체인지로그 전체를 CHANGELOG.json으로 다시 쓰고 저널을 비운 뒤 인덱스 갱신."""
+    data["metadata"]["totalReleases"] = len(data["releases"])
+    _write_snapshot(data)
+
+    if os.path.isfile(CHANGELOG_JOURNAL):
+        os.remove(CHANGELOG_JOURNAL)
+
+    _, file_entries = _load_changelog_indexed()
+    _update_index(file_entries)
+
+
+@_with_changelog_lock()
+def cmd_compact() -> int:
+    """저널을 스냅샷에 합쳐 단일 CHANGELOG.json을 다시 만들고 저널을 비운다."""
+    try:
+        journal_count = sum(1 for _ in _iter_journal())
+        data = _load_changelog()
+        _rewrite_snapshot(data)
+
+        print(f"✅ {CHANGELOG_JSON} 압축 완료! (저널 {journal_count}개 반영, 전체 {len(data['releases'])}개)")
+        return 0
+
+    except Exception as e:
+        print(f"❌ compact 실패: {e}")
+        traceback.print_exc()
+        return 1
+
+
+@_with_changelog_lock()
+def cmd_dedupe(dry_run: bool = False) -> int:
+    """
+    같은 (버전, PR 번호)의 중복 릴리즈를 앞쪽(최신) 하나만 남기고 제거한 뒤 스냅샷을 다시 쓴다.
+
+    제거한 릴리즈 중 남긴 릴리즈와 내용 해시가 같은 것과 다른 것을 나눠 보고한다.
+    """
+    try:
+        before = sum(_file_size(path) or 0 for path in (CHANGELOG_JSON, CHANGELOG_JOURNAL))
+        data = _load_changelog()
+
+        kept: dict[tuple, str] = {}  # 키 → 남긴 릴리즈의 내용 해시
+        releases = []
+        identical = differing = 0
+        removed_versions: list[str] = []
+        for release in data["releases"]:
+            key = _release_key(release)
+            digest = _release_hash(release)
+            if key not in kept:
+                kept[key] = digest
+                releases.append(release)
+                continue
+            if kept[key] == digest:
+                identical += 1
+            else:
+                differing += 1
+            removed_versions.append(key[0])
+
+        print("📊 중복 제거 결과")
+        print(f"  - 전체 릴리즈: {len(data['releases'])}개 → {len(releases)}개")
+        print(f"  - 내용이 같은 중복: {identical}개, 내용이 다른 중복(앞쪽 유지): {differing}개")
+        if removed_versions:
+            print(f"  - 제거된 버전: {', '.join(removed_versions)}")
+
+        if dry_run:
+            print("ℹ️ --dry-run: 파일은 변경하지 않았습니다")
+            return 0
+        if not removed_versions:
+            print("✅ 중복 없음")
+            return 0
+
+        data["releases"] = releases
+        _rewrite_snapshot(data)
+        after = _file_size(CHANGELOG_JSON) or 0
+        print(f"✅ {CHANGELOG_JSON} 갱신 완료! ({before} → {after} bytes, generate-md로 CHANGELOG.md에 반영)")
+        return 0
+
+    except Exception as e:
+        print(f"❌ dedupe 실패: {e}")
+        traceback.print_exc()
+        return 1
+
+
+def _reparse_worker(task: tuple[int, str, float | None]) -> tuple[int, dict, str]:
+    """프로세스 풀 작업 단위: (릴리즈 위치, 본문, 단계 시간 제한) → (위치, parsed_changes, parse_method)."""
+    index, body, stage_timeout = task
+    timeouts: list[str] = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        categories = _parse_summary_markdown(body, stage_timeout, timeouts)
+    parse_method = 'markdown' if categories else 'markdown_failed'
+    if timeouts:
+        parse_method += f":timeout={'+'.join(timeouts)}"
+    return index, categories or {}, parse_method
+
+
+def _match_pr_bodies(input_dir: str, releases: list[dict]) -> tuple[dict[int, str], list[str]]:
+    """
+    디렉토리의 PR body 파일(*.md, *.html)을 릴리즈에 대응.
+
+    파일 이름(확장자 제외)이 버전이면 그 버전의 최신 릴리즈, `123`/`pr-123`/`#123`이면
+    해당 PR 번호의 최신 릴리즈에 대응한다. Returns: ({릴리즈 위치: 본문}, 대응 못 한 파일 목록)
+    """
+    by_version: dict[str, int] = {}
+    by_pr: dict[str, int] = {}
+    for i, release in enumerate(releases):
+        by_version.setdefault(str(release.get('version')), i)
+        if release.get('pr_number') is not None:
+            by_pr.setdefault(str(release.get('pr_number')), i)
+
+    bodies: dict[int, str] = {}
+    unmatched: list[str] = []
+    for name in sorted(os.listdir(input_dir)):
+        stem, ext = os.path.splitext(name)
+        if ext.lower() not in ('.md', '.html'):
+            continue
+        pr_key = re.sub(r'^(?:pr-|#)', '', stem, flags=re.IGNORECASE)
+        index = by_version.get(stem, by_pr.get(pr_key))
+        if index is None:
+            unmatched.append(name)
+            continue
+        path = os.path.join(input_dir, name)
+        with open(path, 'r', encoding='utf-8') as f:
+            bodies[index] = f.read()
+        _count_metric('input_bytes', path, _file_size(path) or 0)
+    return bodies, unmatched
+
+
+@_with_changelog_lock()
+def cmd_reparse(input_dir: str | None, jobs: int | None, stage_timeout: float | None,
+                dry_run: bool = False) -> int:
+    """
+    저장된 raw_summary(또는 PR body 디렉토리)를 프로세스 풀로 다시 파싱해 한 번에 병합.
+
+    input_dir이 있으면 대응되는 릴리즈만 새 본문으로 파싱하고 raw_summary도 갱신한다.
+    결과는 스냅샷 하나로 다시 쓰며(저널 병합 포함), dry_run이면 변경 통계만 출력한다.
+    """
+    start = time.perf_counter()
+    try:
+        data = _load_changelog()
+        releases = data["releases"]
+
+        if input_dir:
+            bodies, unmatched = _match_pr_bodies(input_dir, releases)
+            for name in unmatched:
+                print(f"⚠️ 대응하는 릴리즈가 없어 건너뜀: {name}")
+        else:
+            # update-from-summary가 파싱하던 pr_body.md는 개행으로 끝나므로 저장된 요약에도 붙여 준다
+            bodies = {i: (r.get('raw_summary') or '') + "\n" for i, r in enumerate(releases)}
+
+        tasks = [(i, body, stage_timeout) for i, body in bodies.items()]
+        jobs = max(1, jobs or os.cpu_count() or 1)
+        print(f"🔍 {len(tasks)}개 릴리즈 재파싱 (프로세스 {min(jobs, len(tasks)) or 1}개)")
+        with _timed('parse'):
+            if jobs > 1 and len(tasks) > 1:
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor(max_workers=jobs) as pool:
+                    results = list(pool.map(_reparse_worker, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+            else:
+                results = [_reparse_worker(task) for task in tasks]
+
+        changed_method = changed_changes = kept = 0
+        changed_versions: list[str] = []
+        for index, categories, parse_method in results:
+            release = releases[index]
+            # 풀 작업자의 파서 단계는 부모 지표에 모이지 않으므로 결과 방식으로 집계
+            _count_metric('parse_methods', parse_method)
+            # 예전 형식(HTML 태그가 지워진 평문) 요약은 지금 파서로 읽히지 않으므로 기존 결과를 지킨다
+            if not categories and release.get('parsed_changes') and not input_dir:
+                kept += 1
+                continue
+            method_diff = release.get('parse_method') != parse_method
+            changes_diff = (release.get('parsed_changes') or {}) != categories
+            changed_method += method_diff
+            changed_changes += changes_diff
+            if method_diff or changes_diff:
+                changed_versions.append(str(release.get('version')))
+            release['parsed_changes'] = categories
+            release['parse_method'] = parse_method
+            if input_dir:
+                release['raw_summary'] = _clean_summary_noise(bodies[index])
+
+        elapsed = time.perf_counter() - start
+        print(f"\n📊 재파싱 결과 ({elapsed:.2f}s)")
+        print(f"  - parse_method 변경: {changed_method}개")
+        print(f"  - parsed_changes 변경: {changed_changes}개")
+        print(f"  - 변경 없음: {len(results) - len(changed_versions) - kept}개")
+        if kept:
+            print(f"  - 파싱 실패로 기존 결과 유지: {kept}개")
+        if changed_versions:
+            shown = ', '.join(changed_versions[:20])
+            more = f" 외 {len(changed_versions) - 20}개" if len(changed_versions) > 20 else ''
+            print(f"  - 변경된 버전: {shown}{more}")
+
+        if dry_run:
+            print("ℹ️ --dry-run: 파일은 변경하지 않았습니다")
+            return 0
+        if not changed_versions and not input_dir:
+            print("✅ 변경 사항 없음")
+            return 0
+
+        _rewrite_snapshot(data)
+        print(f"✅ {CHANGELOG_JSON} 갱신 완료! (generate-md로 CHANGELOG.md에 반영)")
+        return 0
+
+    except Exception as e:
+        print(f"❌ reparse 실패: {e}")
+        traceback.print_exc()
+        return 1
+
+
+@_with_changelog_lock()
+def cmd_stats(backend: str = 'auto', output_path: str | None = None) -> int:
+    """CHANGELOG.json(+저널)을 스트리밍으로 한 번 훑어 릴리즈 통계 출력 (전체를 메모리에 올리지 않음)."""
+    start = time.perf_counter()
+    used_backend = _stream_backend(backend)
+    version_counts: dict[str, int] = {}
+    parse_methods: dict[str, int] = {}
+    journal_records = 0
+    releases = 0
+    categories = 0
+    summary_bytes = 0
+    largest = {'version': None, 'bytes': 0}
+    first_date = last_date = None
+
+    try:
+        for from_journal, release in _iter_releases(used_backend):
+            releases += 1
+            journal_records += from_journal
+            version = str(release.get('version'))
+            version_counts[version] = version_counts.get(version, 0) + 1
+            method = release.get('parse_method') or 'none'
+            parse_methods[method] = parse_methods.get(method, 0) + 1
+            categories += len(release.get('parsed_changes') or {})
+
+            size = len((release.get('raw_summary') or '').encode('utf-8'))
+            summary_bytes += size
+            if size > largest['bytes']:
+                largest = {'version': version, 'bytes': size}
+
+            date = release.get('date')
+            if isinstance(date, str) and date[:1].isdigit():
+                first_date = date if first_date is None or date < first_date else first_date
+                last_date = date if last_date is None or date > last_date else last_date
+    except Exception as e:
+        print(f"❌ {CHANGELOG_JSON} 읽기 실패: {e}", file=sys.stderr)
+        return 1
+
+    metadata = _current_metadata() or {}
+    stats = {
+        'backend': used_backend,
+        'current_version': metadata.get('currentVersion'),
+        'last_updated': metadata.get('lastUpdated'),
+        'releases': releases,
+        'journal_records': journal_records,
+        'unique_versions': len(version_counts),
+        'duplicated_versions': sorted((v for v, n in version_counts.items() if n > 1), key=_version_key),
+        'parse_methods': parse_methods,
+        'categories': categories,
+        'first_date': first_date,
+        'last_date': last_date,
+        'raw_summary_bytes': summary_bytes,
+        'largest_raw_summary': largest,
+        'files': {path: _file_size(path) for path in (CHANGELOG_JSON, CHANGELOG_JOURNAL, CHANGELOG_MD)},
+        'seconds': round(time.perf_counter() - start, 6),
+    }
+
+    print(f"📊 체인지로그 통계 ({used_backend} 리더, {stats['seconds']:.4f}s)")
+    print(f"  - 현재 버전: {stats['current_version']} (마지막 업데이트 {stats['last_updated']})")
+    print(f"  - 릴리즈: {releases}개 (저널 {journal_records}개), 고유 버전 {stats['unique_versions']}개")
+    if stats['duplicated_versions']:
+        print(f"  - 중복 버전: {', '.join(stats['duplicated_versions'])}")
+    print(f"  - 파싱 방식: {', '.join(f'{k} {v}개' for k, v in sorted(parse_methods.items()))}")
+    print(f"  - 카테고리: {categories}개, 기간: {first_date} ~ {last_date}")
+    print(f"  - raw_summary: 총 {summary_bytes} bytes, 최대 {largest['bytes']} bytes ({largest['version']})")
+
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(stats, f, indent=2, ensure_ascii=False)
+        print(f"✅ 통계 저장: {output_path}")
+    return 0
+
+
 # ------------------------------- CLI -------------------------------
 
+def _run_command(args: argparse.Namespace) -> int:
+    """파싱된 인자로 서브커맨드 실행."""
+    if args.command == 'update-from-summary':
+        return cmd_update_from_summary(args.stage_timeout)
+    if args.command == 'generate-md':
+        return cmd_generate_md(args.full)
+    if args.command == 'compact':
+        return cmd_compact()
+    if args.command == 'export':
+        return cmd_export_release_notes(args.version, args.output, args.all, args.format, args.output_dir)
+    if args.command == 'dedupe':
+        return cmd_dedupe(args.dry_run)
+    if args.command == 'reparse':
+        return cmd_reparse(args.input_dir, args.jobs, args.stage_timeout, args.dry_run)
+    if args.command == 'stats':
+        return cmd_stats(args.backend, args.output)
+    return 2
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         prog='changelog_manager',
@@ -458,22 +2431,59 @@ def main(argv: list[str] | None = None) -> int:
     )
     sub = parser.add_subparsers(dest='command', required=True)
 
-    sub.add_parser('update-from-summary', help='PR body에서 CHANGELOG.json 갱신')
-    sub.add_parser('generate-md', help='CHANGELOG.json → CHANGELOG.md 생성')
+    # 모든 서브커맨드 공통 옵션
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--metrics-json', metavar='PATH',
+                        help='구간별 시간/입출력 크기/파서 단계/최대 메모리를 JSON으로 저장')
+
+    p_update = sub.add_parser('update-from-summary', parents=[common], help='PR body에서 CHANGELOG 저널에 릴리즈 추가')
+    p_update.add_argument('--stage-timeout', type=float, default=_STAGE_TIMEOUT_SECONDS,
+                          help='파서 단계별 시간 제한 (초, 0이면 제한 없음)')
+    p_generate = sub.add_parser('generate-md', parents=[common], help='CHANGELOG.json → CHANGELOG.md 생성')
+    p_generate.add_argument('--full', action='store_true', help='기존 블록을 재사용하지 않고 전체 재생성')
+    sub.add_parser('compact', parents=[common], help='저널을 합쳐 CHANGELOG.json 스냅샷 재생성')
+
+    p_export = sub.add_parser('export', parents=[common], help='특정 버전(들)의 릴리즈 노트 추출')
+    p_export.add_argument('--version', action='append', help='버전 번호 또는 범위(A..B), 여러 번 지정 가능')
+    p_export.add_argument('--all', action='store_true', help='기록된 모든 버전 내보내기')
+    p_export.add_argument('--format', choices=sorted(_EXPORT_FORMATS), default='text', help='출력 형식')
+    p_export.add_argument('--output', help='출력 파일 경로 (버전 하나일 때, 없으면 stdout)')
+    p_export.add_argument('--output-dir', help='버전별 파일을 저장할 디렉토리 (기본: release_notes)')
+
+    p_dedupe = sub.add_parser('dedupe', parents=[common], help='같은 (버전, PR 번호)의 중복 릴리즈 제거')
+    p_dedupe.add_argument('--dry-run', action='store_true', help='제거 대상만 출력하고 파일은 그대로 둠')
+
+    p_reparse = sub.add_parser('reparse', parents=[common], help='저장된 raw_summary 또는 PR body 디렉토리를 다시 파싱해 병합')
+    p_reparse.add_argument('--input-dir', help='PR body 디렉토리 (파일 이름: 버전 또는 PR 번호, 예: 1.10.97.md, pr-123.md)')
+    p_reparse.add_argument('--jobs', type=int, help='프로세스 수 (기본: CPU 수)')
+    p_reparse.add_argument('--stage-timeout', type=float, default=_STAGE_TIMEOUT_SECONDS,
+                           help='파서 단계별 시간 제한 (초, 0이면 제한 없음)')
+    p_reparse.add_argument('--dry-run', action='store_true', help='변경 통계만 출력하고 파일은 그대로 둠')
+
+    p_stats = sub.add_parser('stats', parents=[common], help='릴리즈 히스토리 통계 (스트리밍)')
+    p_stats.add_argument('--backend', choices=_STREAM_BACKENDS, default='auto', help='CHANGELOG.json 스트리밍 파서')
+    p_stats.add_argument('--output', help='JSON 결과 파일 경로')
 
-    p_export = sub.add_parser('export', help='특정 버전 릴리즈 노트 추출')
-    p_export.add_argument('--version', required=True, help='버전 번호')
-    p_export.add_argument('--output', help='출력 파일 경로 (없으면 stdout)')
 
     args = parser.parse_args(argv)
+    if not args.metrics_json:
+        return _run_command(args)
 
-    if args.command == 'update-from-summary':
-        return cmd_update_from_summary()
-    if args.command == 'generate-md':
-        return cmd_generate_md()
-    if args.command == 'export':
-        return cmd_export_release_notes(args.version, args.output)
-    return 2
+    # 예외로 끝나도 지표를 남긴다 (실패한 실행일수록 지표가 필요함)
+    _start_metrics(args.command)
+    exit_code, error = 1, None
+    try:
+        exit_code = _run_command(args)
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        raise
+    except BaseException as e:
+        exit_code = 130 if isinstance(e, KeyboardInterrupt) else 1
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _finish_metrics(exit_code, args.metrics_json, error)
+    return exit_code
 
 
 if __name__ == '__main__':
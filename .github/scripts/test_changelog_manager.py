@@ -0,0 +1,61 @@
+"""
+changelog_manager 테스트
+
+실행: python .github/scripts/test_changelog_manager.py
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from changelog_manager import _find_release, _parse_summary_markdown, _write_snapshot, cmd_generate_md
+
+REPO_CHANGELOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "CHANGELOG.json")
+
+
+def _quiet(func, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args)
+
+
+@unittest.skipUnless(os.path.exists(REPO_CHANGELOG), "CHANGELOG.json 필요")
+class StoredParsedChangesTest(unittest.TestCase):
+    def setUp(self):
+        with open(REPO_CHANGELOG, encoding="utf-8") as f:
+            self.releases = json.load(f)["releases"]
+        self.root = tempfile.mkdtemp(prefix="changelog_manager_test_")
+        self.cwd = os.getcwd()
+        os.chdir(self.root)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_markdown_releases_reparse_to_stored_parsed_changes(self):
+        releases = [r for r in self.releases if r.get("parse_method") == "markdown"]
+        self.assertTrue(releases)
+        for release in releases:
+            with self.subTest(version=release["version"]):
+                parsed = _quiet(_parse_summary_markdown, (release.get("raw_summary") or "") + "\n")
+                self.assertEqual(parsed, release.get("parsed_changes") or {})
+
+    def test_parsed_changes_survive_snapshot_and_index(self):
+        release = self.releases[len(self.releases) // 2]
+        _write_snapshot({"metadata": {"totalReleases": 1}, "releases": [release]})
+        _quiet(cmd_generate_md)
+
+        stored = _find_release(str(release["version"]))
+
+        self.assertIsNotNone(stored)
+        self.assertEqual(stored.get("parsed_changes"), release.get("parsed_changes"))
+
+
+if __name__ == "__main__":
+    unittest.main()